@@ -0,0 +1 @@
+"""Offline benchmarks for Yandex Music Browser."""
@@ -0,0 +1,190 @@
+"""
+Offline browse latency benchmark.
+
+Drives `YandexMusicBrowser.generate_browse_from_media` (synchronous path) and
+`_patch_root_async_browse_media` (path used by patched media players) against
+`FakeClient` across nodes, expansion depths, list sizes and response cache states.
+Reports latency percentiles and Yandex API calls per browse.
+
+Usage: python -m benchmarks.browse [--sizes 50,500] [--depths 1,2] [--latency 0.0]
+                                   [--iterations 20] [--paths sync,async] [--nodes ...]
+"""
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+from unittest.mock import patch
+
+from homeassistant.components.media_player.const import (
+    MEDIA_TYPE_ALBUM,
+    MEDIA_TYPE_ARTIST,
+    MEDIA_TYPE_PLAYLIST,
+)
+from homeassistant.core import HomeAssistant
+
+from benchmarks.fake_client import FIXTURE_USER_ID, FakeClient, FixtureSet
+from custom_components.yandex_music_browser.const import (
+    CONF_PAGE_SIZE,
+    DATA_BROWSER,
+    ROOT_MEDIA_CONTENT_TYPE,
+)
+from custom_components.yandex_music_browser.default import MusicBrowserPool
+from custom_components.yandex_music_browser.media_browser import YandexMusicBrowser
+from custom_components.yandex_music_browser.patches._base import _patch_root_async_browse_media
+
+NODES: Dict[str, Tuple[str, Optional[str]]] = {
+    "root": (ROOT_MEDIA_CONTENT_TYPE, None),
+    "user_playlists": ("user_playlists", None),
+    "user_likes": ("user_likes", None),
+    "user_liked_tracks": ("user_liked_tracks", None),
+    "playlist": (MEDIA_TYPE_PLAYLIST, f"{FIXTURE_USER_ID}:1"),
+    "album": (MEDIA_TYPE_ALBUM, "1"),
+    "artist": (MEDIA_TYPE_ARTIST, "1"),
+    "genres": ("genres", None),
+    "new_releases": ("new_releases", None),
+    "new_playlists": ("new_playlists", None),
+    "yandex_mixes": ("yandex_mixes", None),
+    "personal_mixes": ("personal_mixes", None),
+}
+
+CACHE_STATES = ("miss", "hit")
+
+BrowseCallable = Callable[[str, Optional[str], int], Awaitable[object]]
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence"""
+    index = max(0, min(len(sorted_values) - 1, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def make_browser(size: int, latency: float, page_size: int) -> YandexMusicBrowser:
+    fixtures = FixtureSet(
+        tracks_per_playlist=size,
+        liked_tracks=size,
+        albums_per_artist=max(1, size // 10),
+    )
+    return YandexMusicBrowser(
+        FakeClient(fixtures, latency).init(),
+        {CONF_PAGE_SIZE: page_size},
+    )
+
+
+def depth_to_fetch_children(depth: int) -> int:
+    """
+    Convert amount of expanded levels into `fetch_children` value.
+    Processors and `generate_browse_list_from_media_list` both decrement `fetch_children`,
+    so every level below the first one takes two units.
+    """
+    return max(2 * depth - 1, 0)
+
+
+def make_browse_callables(
+    hass: HomeAssistant, music_browser: YandexMusicBrowser
+) -> Dict[str, BrowseCallable]:
+    async def _sync_browse(media_content_type, media_content_id, depth):
+        return music_browser.generate_browse_from_media(
+            (media_content_type, media_content_id), depth_to_fetch_children(depth), True
+        )
+
+    async def _async_browse(media_content_type, media_content_id, depth):
+        return await _patch_root_async_browse_media(
+            hass,
+            media_content_type,
+            media_content_id,
+            fetch_children=depth_to_fetch_children(depth),
+        )
+
+    return {"sync": _sync_browse, "async": _async_browse}
+
+
+async def run_scenario(
+    music_browser: YandexMusicBrowser,
+    browse: BrowseCallable,
+    media_link: Tuple[str, Optional[str]],
+    depth: int,
+    cache_state: str,
+    iterations: int,
+) -> Tuple[List[float], List[int]]:
+    client: FakeClient = music_browser.client
+    latencies, calls = [], []
+
+    music_browser.clear_cache()
+    if cache_state == "hit":
+        await browse(*media_link, depth)
+
+    for _ in range(iterations):
+        if cache_state == "miss":
+            music_browser.clear_cache()
+
+        client.reset_calls()
+        started_at = time.perf_counter()
+        await browse(*media_link, depth)
+        latencies.append((time.perf_counter() - started_at) * 1000)
+        calls.append(client.total_calls)
+
+    return sorted(latencies), calls
+
+
+async def async_main(args: argparse.Namespace) -> None:
+    hass = HomeAssistant()
+
+    print(
+        f"{'node':<18} {'path':<6} {'size':>6} {'depth':>5} {'cache':<5} "
+        f"{'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9} {'calls':>6}"
+    )
+
+    for size in args.sizes:
+        music_browser = make_browser(size, args.latency, args.page_size)
+        hass.data[DATA_BROWSER] = MusicBrowserPool(hass)
+        hass.data[DATA_BROWSER].add_browser(music_browser)
+        browse_callables = make_browse_callables(hass, music_browser)
+
+        for node in args.nodes:
+            for path in args.paths:
+                for depth in args.depths:
+                    for cache_state in CACHE_STATES:
+                        latencies, calls = await run_scenario(
+                            music_browser,
+                            browse_callables[path],
+                            NODES[node],
+                            depth,
+                            cache_state,
+                            args.iterations,
+                        )
+                        print(
+                            f"{node:<18} {path:<6} {size:>6} {depth:>5} {cache_state:<5} "
+                            f"{percentile(latencies, 0.50):>9.2f} "
+                            f"{percentile(latencies, 0.90):>9.2f} "
+                            f"{percentile(latencies, 0.99):>9.2f} "
+                            f"{latencies[-1]:>9.2f} "
+                            f"{max(calls):>6}"
+                        )
+
+
+def _comma_list(converter):
+    return lambda value: [converter(x) for x in value.split(",") if x]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=_comma_list(int), default=[50, 500])
+    parser.add_argument("--depths", type=_comma_list(int), default=[1, 2])
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per API call")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--paths", type=_comma_list(str), default=["sync", "async"])
+    parser.add_argument("--nodes", type=_comma_list(str), default=list(NODES))
+    args = parser.parse_args()
+
+    unknown_nodes = set(args.nodes) - set(NODES)
+    if unknown_nodes:
+        parser.error(f"unknown nodes: {', '.join(sorted(unknown_nodes))}")
+
+    # User profiles are otherwise looked up on the web; keep the benchmark offline
+    with patch("requests.get", side_effect=ConnectionError("offline benchmark")):
+        asyncio.run(async_main(args))
+
+
+if __name__ == "__main__":
+    main()
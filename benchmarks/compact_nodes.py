@@ -0,0 +1,117 @@
+"""
+Memory benchmark for cached browse trees.
+
+Compares retained memory of playlist trees kept as `YandexBrowseMedia` objects
+(with media objects attached) against the same trees kept as `CompactBrowseNode`.
+
+Usage: python -m benchmarks.compact_nodes [--playlists N] [--tracks M]
+"""
+import argparse
+import gc
+import tracemalloc
+from typing import Callable, List
+
+from homeassistant.components.media_player.const import (
+    MEDIA_CLASS_PLAYLIST,
+    MEDIA_CLASS_TRACK,
+    MEDIA_TYPE_PLAYLIST,
+    MEDIA_TYPE_TRACK,
+)
+from yandex_music import Client, Track
+
+from custom_components.yandex_music_browser.media_browser import (
+    CompactBrowseNode,
+    YandexBrowseMedia,
+)
+
+
+# Objects are deserialized without a client in yandex-music, so an offline one is used
+Client.notice_displayed = True
+_OFFLINE_CLIENT = Client(report_unknown_fields=False)
+
+
+def make_track(track_id: int) -> Track:
+    return Track.de_json(
+        {
+            "id": track_id,
+            "title": f"Track {track_id}",
+            "available": True,
+            "lyrics_available": False,
+            "cover_uri": f"avatars.yandex.net/get-music-content/{track_id}/cover/%%",
+            "duration_ms": 180000 + track_id,
+            "artists": [{"id": track_id % 97, "name": f"Artist {track_id % 97}"}],
+            "albums": [{"id": track_id % 211, "title": f"Album {track_id % 211}"}],
+        },
+        _OFFLINE_CLIENT,
+    )
+
+
+def make_playlist_tree(playlist_index: int, tracks_count: int) -> YandexBrowseMedia:
+    children = []
+    for i in range(tracks_count):
+        track = make_track(playlist_index * tracks_count + i)
+        children.append(
+            YandexBrowseMedia(
+                title=f"{track.title} — {', '.join(track.artists_name())}",
+                media_content_type=MEDIA_TYPE_TRACK,
+                media_class=MEDIA_CLASS_TRACK,
+                thumbnail="https://" + track.cover_uri.replace("%%", "200x200"),
+                media_content_id=str(track.id),
+                can_play=True,
+                can_expand=False,
+                children=None,
+                media_object=track,
+            )
+        )
+
+    return YandexBrowseMedia(
+        title=f"Playlist {playlist_index}",
+        media_content_type=MEDIA_TYPE_PLAYLIST,
+        media_class=MEDIA_CLASS_PLAYLIST,
+        thumbnail=None,
+        media_content_id=f"1:{playlist_index}",
+        can_play=True,
+        can_expand=True,
+        children_media_class=MEDIA_CLASS_TRACK,
+        children=children,
+    )
+
+
+def measure(factory: Callable[[], List]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        retained = factory()
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del retained
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--playlists", type=int, default=20)
+    parser.add_argument("--tracks", type=int, default=250)
+    args = parser.parse_args()
+
+    full_size = measure(
+        lambda: [make_playlist_tree(i, args.tracks) for i in range(args.playlists)]
+    )
+    compact_size = measure(
+        lambda: [
+            CompactBrowseNode.from_browse_media(make_playlist_tree(i, args.tracks))
+            for i in range(args.playlists)
+        ]
+    )
+
+    nodes = args.playlists * (args.tracks + 1)
+    print(f"Nodes: {nodes}")
+    print(f"YandexBrowseMedia: {full_size / 1024:.1f} KiB ({full_size / nodes:.0f} B/node)")
+    print(f"CompactBrowseNode: {compact_size / 1024:.1f} KiB ({compact_size / nodes:.0f} B/node)")
+    print(f"Ratio: {full_size / max(compact_size, 1):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
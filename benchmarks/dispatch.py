@@ -0,0 +1,112 @@
+"""
+Microbenchmark of media object dispatch and thumbnail sanitization.
+
+Generates browse nodes for a flat tree of tracks (half of them instances of a `Track`
+subclass, which are resolved through MRO) and reports per-node cost of processor
+lookup, thumbnail sanitization and whole node generation. Tracks share covers of
+their albums, as they do in real libraries.
+
+Usage: python -m benchmarks.dispatch [--nodes 10000] [--repeat 5]
+"""
+import argparse
+import time
+from typing import Callable, List
+from unittest.mock import patch
+
+from yandex_music import Track
+
+from benchmarks.compact_nodes import make_track
+from benchmarks.fake_client import FakeClient, FixtureSet
+from custom_components.yandex_music_browser.media_browser import (
+    MAP_MEDIA_OBJECT_TO_BROWSE,
+    YandexMusicBrowser,
+    get_media_object_processor,
+    sanitize_thumbnail_uri,
+)
+
+
+ALBUMS = 211
+COVER_URI = "avatars.yandex.net/get-music-content/{}/cover/%%"
+
+
+class DerivedTrack(Track):
+    """Track subclass without a processor of its own"""
+
+
+def make_tracks(nodes: int) -> List[Track]:
+    tracks = []
+    for i in range(nodes):
+        track = make_track(i)
+        # Tracks of the same album share covers
+        track.cover_uri = track.albums[0].cover_uri = COVER_URI.format(i % ALBUMS)
+        if i % 2:
+            track.__class__ = DerivedTrack
+        tracks.append(track)
+    return tracks
+
+
+def linear_scan_lookup(media_object):
+    """Processor lookup as done before dispatch caching"""
+    processor = MAP_MEDIA_OBJECT_TO_BROWSE.get(type(media_object))
+    if processor is None:
+        for processor_cls, processor_fn in MAP_MEDIA_OBJECT_TO_BROWSE.items():
+            if isinstance(media_object, processor_cls):
+                return processor_fn
+    return processor
+
+
+def best_of(repeat: int, func: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started_at)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    tracks = make_tracks(args.nodes)
+    cover_uris = [track.cover_uri for track in tracks]
+
+    # User profiles are otherwise looked up on the web; keep the benchmark offline
+    with patch("requests.get", side_effect=ConnectionError("offline benchmark")):
+        music_browser = YandexMusicBrowser(FakeClient(FixtureSet()).init())
+
+    def _per_node(seconds: float) -> str:
+        return f"{seconds * 1e6 / args.nodes:8.3f} us/node ({seconds * 1000:8.2f} ms total)"
+
+    results = {
+        "lookup (linear scan)": best_of(
+            args.repeat, lambda: [linear_scan_lookup(track) for track in tracks]
+        ),
+        "lookup (MRO cache)": best_of(
+            args.repeat, lambda: [get_media_object_processor(type(track)) for track in tracks]
+        ),
+    }
+
+    sanitize_thumbnail_uri.cache_clear()
+    started_at = time.perf_counter()
+    for cover_uri in cover_uris:
+        sanitize_thumbnail_uri(cover_uri, (200, 200))
+    results["sanitize (cold)"] = time.perf_counter() - started_at
+    results["sanitize (memoized)"] = best_of(
+        args.repeat, lambda: [sanitize_thumbnail_uri(x, (200, 200)) for x in cover_uris]
+    )
+
+    results["generate nodes"] = best_of(
+        args.repeat,
+        lambda: music_browser.generate_browse_list_from_media_list(tracks, fetch_children=False),
+    )
+
+    print(f"Nodes: {args.nodes}")
+    for name, seconds in results.items():
+        print(f"{name:<22} {_per_node(seconds)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,381 @@
+"""
+Offline stand-in for `yandex_music.Client`.
+
+`FakeClient` is a regular `Client` whose HTTP layer is replaced with `FakeRequest`.
+Responses are served from synthetic fixtures shaped like recorded API responses, so
+the whole deserialization path of the library is exercised, but no network access
+happens. Every served request is counted and may be delayed by a configurable latency.
+"""
+__all__ = [
+    "FakeClient",
+    "FakeRequest",
+    "FixtureSet",
+    "FIXTURE_USER_ID",
+]
+
+import json
+import re
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from yandex_music import Client
+from yandex_music.exceptions import NotFoundError
+from yandex_music.utils.request import Request
+
+FIXTURE_USER_ID = 1000
+FIXTURE_USER_LOGIN = "benchmark"
+
+_COVER_URI = "avatars.yandex.net/get-music-content/{}/cover/%%"
+
+
+class FixtureSet:
+    """Deterministic synthetic library of a single account."""
+
+    def __init__(
+        self,
+        playlists: int = 10,
+        tracks_per_playlist: int = 100,
+        liked_tracks: int = 500,
+        liked_albums: int = 20,
+        liked_artists: int = 20,
+        tracks_per_album: int = 12,
+        albums_per_artist: int = 10,
+        genres: int = 15,
+        tag_playlists: int = 10,
+        landing_entities: int = 10,
+        new_releases: int = 20,
+    ) -> None:
+        self.playlists = playlists
+        self.tracks_per_playlist = tracks_per_playlist
+        self.liked_tracks = liked_tracks
+        self.liked_albums = liked_albums
+        self.liked_artists = liked_artists
+        self.tracks_per_album = tracks_per_album
+        self.albums_per_artist = albums_per_artist
+        self.genres = genres
+        self.tag_playlists = tag_playlists
+        self.landing_entities = landing_entities
+        self.new_releases = new_releases
+
+    # Single objects
+    @staticmethod
+    def artist(artist_id: int) -> Dict[str, Any]:
+        return {
+            "id": artist_id,
+            "name": f"Artist {artist_id}",
+            "cover": {"type": "from-album-cover", "uri": _COVER_URI.format(artist_id)},
+        }
+
+    def album(self, album_id: int) -> Dict[str, Any]:
+        return {
+            "id": album_id,
+            "title": f"Album {album_id}",
+            "coverUri": _COVER_URI.format(album_id),
+            "trackCount": self.tracks_per_album,
+            "artists": [self.artist(album_id % 97)],
+        }
+
+    @staticmethod
+    def track(track_id: int) -> Dict[str, Any]:
+        album_id = track_id // 100
+        return {
+            "id": str(track_id),
+            "title": f"Track {track_id}",
+            "available": True,
+            "lyricsAvailable": False,
+            "coverUri": _COVER_URI.format(album_id),
+            "durationMs": 180000 + track_id % 60000,
+            "artists": [{"id": track_id % 97, "name": f"Artist {track_id % 97}"}],
+            "albums": [{"id": album_id, "title": f"Album {album_id}"}],
+        }
+
+    def playlist(self, uid: int, kind: int, with_tracks: bool = False) -> Dict[str, Any]:
+        data = {
+            "owner": {"uid": uid, "login": f"user{uid}", "name": f"User {uid}"},
+            "uid": uid,
+            "kind": kind,
+            "title": f"Playlist {uid}:{kind}",
+            "revision": 1,
+            "trackCount": self.tracks_per_playlist,
+            "cover": {"type": "pic", "uri": _COVER_URI.format(kind)},
+        }
+        if with_tracks:
+            first_id = (uid * 1000 + kind) * self.tracks_per_playlist
+            data["tracks"] = [
+                {
+                    "id": first_id + i,
+                    "timestamp": "2021-01-01T00:00:00+00:00",
+                    "track": self.track(first_id + i),
+                }
+                for i in range(self.tracks_per_playlist)
+            ]
+        return data
+
+    def genre(self, index: int) -> Dict[str, Any]:
+        return {
+            "id": f"genre{index}",
+            "weight": index,
+            "composerTop": False,
+            "title": f"Genre {index}",
+            "titles": {"en": {"title": f"Genre {index}"}},
+            "images": {},
+            "showInMenu": True,
+        }
+
+    # Endpoint payloads
+    def account_status(self) -> Dict[str, Any]:
+        return {
+            "account": {
+                "now": "2021-01-01T00:00:00+00:00",
+                "serviceAvailable": True,
+                "uid": FIXTURE_USER_ID,
+                "login": FIXTURE_USER_LOGIN,
+                "displayName": "Benchmark",
+            },
+            "permissions": {"until": "2099-01-01T00:00:00+00:00", "values": [], "default": []},
+        }
+
+    def users_playlists_list(self, uid: int) -> List[Dict[str, Any]]:
+        return [self.playlist(uid, kind) for kind in range(1, self.playlists + 1)]
+
+    def users_likes(self, uid: int, object_type: str) -> Any:
+        if object_type == "track":
+            return {
+                "library": {
+                    "uid": uid,
+                    "revision": 1,
+                    "tracks": [
+                        {
+                            "id": str(track_id),
+                            "albumId": str(track_id // 100),
+                            "timestamp": "2021-01-01T00:00:00+00:00",
+                        }
+                        for track_id in range(1, self.liked_tracks + 1)
+                    ],
+                }
+            }
+        if object_type == "album":
+            return [{"album": self.album(i)} for i in range(1, self.liked_albums + 1)]
+        if object_type == "artist":
+            return [{"artist": self.artist(i)} for i in range(1, self.liked_artists + 1)]
+        return [
+            {"playlist": self.playlist(uid + 1, kind)}
+            for kind in range(1, self.playlists + 1)
+        ]
+
+    def album_with_tracks(self, album_id: int) -> Dict[str, Any]:
+        data = self.album(album_id)
+        first_id = album_id * 100
+        data["volumes"] = [[self.track(first_id + i) for i in range(self.tracks_per_album)]]
+        return data
+
+    def artist_direct_albums(self, artist_id: int, page: int, page_size: int) -> Dict[str, Any]:
+        first = page * page_size
+        last = min(self.albums_per_artist, first + page_size)
+        return {
+            "albums": [self.album(artist_id * 1000 + i) for i in range(first, last)],
+            "pager": {"total": self.albums_per_artist, "page": page, "perPage": page_size},
+        }
+
+    def genres_list(self) -> List[Dict[str, Any]]:
+        return [self.genre(i) for i in range(self.genres)]
+
+    def tag_result(self, tag: str) -> Dict[str, Any]:
+        return {
+            "tag": {"id": tag, "value": tag, "name": tag, "ogDescription": ""},
+            "ids": [{"uid": 2000, "kind": kind} for kind in range(1, self.tag_playlists + 1)],
+        }
+
+    def landing(self, block: str) -> Dict[str, Any]:
+        if block == "mixes":
+            block_type = "mixes"
+            entities = [
+                {
+                    "id": f"mix{i}",
+                    "type": "mix-link",
+                    "data": {
+                        "title": f"Mix {i}",
+                        "url": f"/tag/mix{i}",
+                        "urlScheme": f"yandexmusic://tag/mix{i}",
+                        "textColor": "#ffffff",
+                        "backgroundColor": "#000000",
+                        "backgroundImageUri": _COVER_URI.format(i),
+                        "coverWhite": _COVER_URI.format(i),
+                    },
+                }
+                for i in range(self.landing_entities)
+            ]
+        else:
+            block_type = "personal-playlists"
+            entities = [
+                {
+                    "id": f"personal{i}",
+                    "type": "personal-playlist",
+                    "data": {
+                        "type": f"personal{i}",
+                        "ready": True,
+                        "notify": False,
+                        "data": self.playlist(FIXTURE_USER_ID, 100 + i),
+                    },
+                }
+                for i in range(self.landing_entities)
+            ]
+
+        return {
+            "pumpkin": False,
+            "contentId": block,
+            "blocks": [
+                {
+                    "id": block,
+                    "type": block_type,
+                    "typeForFrom": block,
+                    "title": block,
+                    "entities": entities,
+                }
+            ],
+        }
+
+    def landing_list(self, list_type: str) -> Dict[str, Any]:
+        data = {"type": list_type, "typeForFrom": list_type, "title": list_type}
+        if list_type == "new-releases":
+            data["newReleases"] = list(range(1, self.new_releases + 1))
+        else:
+            data["newPlaylists"] = [
+                {"uid": 3000, "kind": kind} for kind in range(1, self.landing_entities + 1)
+            ]
+        return data
+
+    def objects_list(self, object_type: str, ids: List[str]) -> List[Dict[str, Any]]:
+        if object_type == "track":
+            # Tracks may be requested as "<track_id>:<album_id>"
+            return [self.track(int(x.split(":")[0])) for x in ids]
+        if object_type == "album":
+            return [self.album(int(x)) for x in ids]
+        if object_type == "artist":
+            return [self.artist(int(x)) for x in ids]
+        return [self.playlist(*map(int, x.split(":"))) for x in ids]
+
+
+RouteHandler = Callable[[FixtureSet, re.Match, Dict[str, Any]], Any]
+
+
+def _split_ids(value: Any) -> List[str]:
+    if isinstance(value, str):
+        return [x for x in value.split(",") if x]
+    return [str(x) for x in value]
+
+
+def _get_int(params: Dict[str, Any], key: str, default: int) -> int:
+    value = params.get(key)
+    return default if value is None else int(value)
+
+
+_ROUTES: List[Tuple[str, str, str, RouteHandler]] = [
+    ("account_status", "GET", r"account/status", lambda f, m, p: f.account_status()),
+    (
+        "users_playlists_list",
+        "GET",
+        r"users/(\d+)/playlists/list",
+        lambda f, m, p: f.users_playlists_list(int(m[1])),
+    ),
+    (
+        "users_playlists",
+        "GET",
+        r"users/(\d+)/playlists/(\d+)",
+        lambda f, m, p: f.playlist(int(m[1]), int(m[2]), with_tracks=True),
+    ),
+    (
+        "users_likes",
+        "GET",
+        r"users/(\d+)/likes/(track|album|artist|playlist)s",
+        lambda f, m, p: f.users_likes(int(m[1]), m[2]),
+    ),
+    (
+        "albums_with_tracks",
+        "GET",
+        r"albums/(\d+)/with-tracks",
+        lambda f, m, p: f.album_with_tracks(int(m[1])),
+    ),
+    (
+        "artists_direct_albums",
+        "GET",
+        r"artists/(\d+)/direct-albums",
+        lambda f, m, p: f.artist_direct_albums(
+            int(m[1]), _get_int(p, "page", 0), _get_int(p, "page-size", 20)
+        ),
+    ),
+    ("genres", "GET", r"genres", lambda f, m, p: f.genres_list()),
+    ("tags", "GET", r"tags/([^/]+)/playlist-ids", lambda f, m, p: f.tag_result(m[1])),
+    ("landing", "GET", r"landing3", lambda f, m, p: f.landing(p.get("blocks", ""))),
+    (
+        "landing_list",
+        "GET",
+        r"landing3/(new-releases|new-playlists)",
+        lambda f, m, p: f.landing_list(m[1]),
+    ),
+    (
+        "objects_list",
+        "POST",
+        r"(track|album|artist|playlist)s(?:/list)?",
+        lambda f, m, p: f.objects_list(m[1], _split_ids(p[f"{m[1]}-ids"])),
+    ),
+]
+
+_COMPILED_ROUTES = [
+    (name, method, re.compile(pattern), handler) for name, method, pattern, handler in _ROUTES
+]
+
+
+class FakeRequest(Request):
+    """Request replacement that serves fixtures instead of performing HTTP requests."""
+
+    def __init__(self, fixtures: Optional[FixtureSet] = None, latency: float = 0.0) -> None:
+        super().__init__()
+        self.fixtures = fixtures or FixtureSet()
+        self.latency = latency
+        self.calls: Counter = Counter()
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    def reset_calls(self) -> None:
+        self.calls.clear()
+
+    def _request_wrapper(self, method: str, url: str, *args, **kwargs) -> bytes:
+        path = url.split("://", 1)[-1].partition("/")[2]
+        params = kwargs.get("params") or kwargs.get("data") or {}
+
+        for name, route_method, pattern, handler in _COMPILED_ROUTES:
+            if route_method != method:
+                continue
+            match = pattern.fullmatch(path)
+            if match:
+                self.calls[name] += 1
+                if self.latency > 0:
+                    time.sleep(self.latency)
+                result = handler(self.fixtures, match, params)
+                return json.dumps({"result": result}).encode("utf-8")
+
+        self.calls["unknown"] += 1
+        raise NotFoundError(f"No fixture for {method} {path}")
+
+
+class FakeClient(Client):
+    """Yandex Music client backed by synthetic fixtures."""
+
+    def __init__(self, fixtures: Optional[FixtureSet] = None, latency: float = 0.0) -> None:
+        Client.notice_displayed = True
+        super().__init__(token="benchmark", request=FakeRequest(fixtures, latency))
+
+    @property
+    def calls(self) -> Counter:
+        return self._request.calls
+
+    @property
+    def total_calls(self) -> int:
+        return self._request.total_calls
+
+    def reset_calls(self) -> None:
+        self._request.reset_calls()
@@ -0,0 +1,134 @@
+"""
+Memory benchmark for interned leaf nodes.
+
+Builds cached browse trees of a library whose likes, playlists and albums overlap
+(as they do for most accounts) and compares retained memory of `CompactBrowseNode`
+trees with leaf nodes interned against the same trees with a node per occurrence.
+
+Usage: python -m benchmarks.interning [--likes 2000] [--playlists 30] [--tracks 150]
+"""
+import argparse
+import random
+from typing import List
+from unittest.mock import patch
+
+from homeassistant.components.media_player.const import (
+    MEDIA_CLASS_ALBUM,
+    MEDIA_CLASS_DIRECTORY,
+    MEDIA_CLASS_PLAYLIST,
+    MEDIA_CLASS_TRACK,
+    MEDIA_TYPE_ALBUM,
+    MEDIA_TYPE_PLAYLIST,
+    MEDIA_TYPE_TRACK,
+)
+
+from benchmarks.compact_nodes import make_track, measure
+from custom_components.yandex_music_browser.media_browser import (
+    CompactBrowseNode,
+    YandexBrowseMedia,
+    get_interned_nodes_count,
+)
+
+# Share of playlist tracks that are also liked
+LIKED_SHARE = 0.7
+TRACKS_PER_ALBUM = 12
+
+
+def make_track_node(track_id: int) -> YandexBrowseMedia:
+    track = make_track(track_id)
+    return YandexBrowseMedia(
+        title=f"{track.title} — {', '.join(track.artists_name())}",
+        media_content_type=MEDIA_TYPE_TRACK,
+        media_class=MEDIA_CLASS_TRACK,
+        thumbnail="https://" + track.cover_uri.replace("%%", "200x200"),
+        media_content_id=str(track.id),
+        can_play=True,
+        can_expand=False,
+        children=None,
+        media_object=track,
+    )
+
+
+def make_container(
+    media_content_type: str, media_class: str, media_content_id: str, track_ids: List[int]
+) -> YandexBrowseMedia:
+    return YandexBrowseMedia(
+        title=f"{media_content_type} {media_content_id}",
+        media_content_type=media_content_type,
+        media_class=media_class,
+        thumbnail=None,
+        media_content_id=media_content_id,
+        can_play=True,
+        can_expand=True,
+        children_media_class=MEDIA_CLASS_TRACK,
+        children=[make_track_node(track_id) for track_id in track_ids],
+    )
+
+
+def make_library(likes: int, playlists: int, tracks: int) -> List[YandexBrowseMedia]:
+    """Browse trees of liked tracks, playlists and albums the liked tracks belong to"""
+    rng = random.Random(0)
+    liked_ids = list(range(likes))
+    next_track_id = likes
+
+    trees = [make_container("user_liked_tracks", MEDIA_CLASS_DIRECTORY, "", liked_ids)]
+
+    for playlist_index in range(playlists):
+        liked_count = int(tracks * LIKED_SHARE)
+        track_ids = rng.sample(liked_ids, min(liked_count, likes))
+        new_count = tracks - len(track_ids)
+        track_ids.extend(range(next_track_id, next_track_id + new_count))
+        next_track_id += new_count
+        trees.append(
+            make_container(
+                MEDIA_TYPE_PLAYLIST, MEDIA_CLASS_PLAYLIST, f"1:{playlist_index}", track_ids
+            )
+        )
+
+    for album_index, first_id in enumerate(range(0, likes, TRACKS_PER_ALBUM * 10)):
+        trees.append(
+            make_container(
+                MEDIA_TYPE_ALBUM,
+                MEDIA_CLASS_ALBUM,
+                str(album_index),
+                list(range(first_id, min(first_id + TRACKS_PER_ALBUM, likes))),
+            )
+        )
+
+    return trees
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--likes", type=int, default=2000)
+    parser.add_argument("--playlists", type=int, default=30)
+    parser.add_argument("--tracks", type=int, default=150)
+    args = parser.parse_args()
+
+    trees = make_library(args.likes, args.playlists, args.tracks)
+    leaves = sum(len(tree.children) for tree in trees)
+
+    with patch.object(CompactBrowseNode, "intern", lambda self: self):
+        plain_size = measure(lambda: [CompactBrowseNode.from_browse_media(x) for x in trees])
+
+    unique_leaves = 0
+
+    def _build_interned() -> List[CompactBrowseNode]:
+        nonlocal unique_leaves
+        nodes = [CompactBrowseNode.from_browse_media(x) for x in trees]
+        unique_leaves = get_interned_nodes_count()
+        return nodes
+
+    interned_size = measure(_build_interned)
+
+    print(f"Trees: {len(trees)}, leaf nodes: {leaves}, unique leaf nodes: {unique_leaves}")
+    for name, size in (("Node per occurrence", plain_size), ("Interned leaves", interned_size)):
+        print(f"{name + ':':<20} {size / 1024:.1f} KiB ({size / leaves:.0f} B/leaf)")
+    print(
+        f"Saved: {(plain_size - interned_size) / 1024:.1f} KiB "
+        f"({100 * (plain_size - interned_size) / max(plain_size, 1):.0f}%)"
+    )
+
+
+if __name__ == "__main__":
+    main()
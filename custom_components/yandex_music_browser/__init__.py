@@ -18,6 +18,10 @@ from homeassistant.helpers.typing import ConfigType, HomeAssistantType
 from homeassistant.loader import bind_hass
 
 from custom_components.yandex_music_browser.const import (
+    CONF_API_CALL_BUDGET,
+    CONF_BROWSE_DEADLINE,
+    CONF_BROWSE_TIMEOUT,
+    CONF_CACHE_PAYLOADS,
     CONF_CACHE_TTL,
     CONF_CLASS,
     CONF_CREDENTIALS,
@@ -28,8 +32,16 @@ from custom_components.yandex_music_browser.const import (
     CONF_LANGUAGE,
     CONF_LYRICS,
     CONF_MENU_OPTIONS,
+    CONF_PAGE_SIZE,
     CONF_PATCHES,
+    CONF_PROXY_AUDIO,
+    CONF_PREFETCH_CHILDREN,
+    CONF_REFRESH_CONCURRENCY,
+    CONF_REFRESH_INTERVALS,
+    CONF_REFRESH_JITTER,
     CONF_SHOW_HIDDEN,
+    CONF_THUMBNAIL_CACHE,
+    CONF_THUMBNAIL_CACHE_SIZE,
     CONF_THUMBNAIL_RESOLUTION,
     CONF_TITLE,
     CONF_WIDTH,
@@ -37,6 +49,9 @@ from custom_components.yandex_music_browser.const import (
     DATA_AUTHENTICATORS,
     DATA_BROWSER,
     DATA_CONFIG,
+    DATA_PREFETCHER,
+    DATA_REFRESH_SCHEDULER,
+    DATA_THUMBNAIL_STORE,
     DATA_UNINSTALLS,
     DATA_UPDATE_LISTENER,
     DATA_YAML_CONFIG,
@@ -131,6 +146,19 @@ MENU_OPTIONS_VALIDATOR = vol.All(
 )
 
 
+def validate_refresh_intervals(refresh_intervals: Mapping):
+    for media_link in refresh_intervals:
+        wrap_sanitize_media_link(media_link)
+
+    return refresh_intervals
+
+
+REFRESH_INTERVALS_VALIDATOR = vol.All(
+    vol.Schema({cv.string: vol.All(cv.time_period, cv.positive_timedelta)}),
+    validate_refresh_intervals,
+)
+
+
 THUMBNAIL_RESOLUTION_VALIDATOR = vol.All(
     vol.Any(
         vol.All(cv.string, process_width_height_str),
@@ -179,6 +207,24 @@ CONFIG_ENTRY_SCHEMA = vol.Schema(
             MENU_OPTIONS_VALIDATOR, validate_parsed_menu_options
         ),
         vol.Optional(CONF_THUMBNAIL_RESOLUTION): THUMBNAIL_RESOLUTION_VALIDATOR,
+        vol.Optional(CONF_THUMBNAIL_CACHE, default=False): cv.boolean,
+        vol.Optional(CONF_THUMBNAIL_CACHE_SIZE, default=100): cv.positive_int,
+        vol.Optional(CONF_PAGE_SIZE, default=100): cv.positive_int,
+        vol.Optional(CONF_REFRESH_INTERVALS, default=lambda: {}): REFRESH_INTERVALS_VALIDATOR,
+        vol.Optional(CONF_REFRESH_CONCURRENCY, default=2): cv.positive_int,
+        vol.Optional(CONF_REFRESH_JITTER, default=0.1): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=1)
+        ),
+        vol.Optional(CONF_PREFETCH_CHILDREN, default=0): cv.positive_int,
+        vol.Optional(CONF_PROXY_AUDIO, default=False): cv.boolean,
+        vol.Optional(CONF_CACHE_PAYLOADS, default=False): cv.boolean,
+        vol.Optional(CONF_API_CALL_BUDGET, default=0): cv.positive_int,
+        vol.Optional(CONF_BROWSE_DEADLINE, default=0): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+        vol.Optional(CONF_BROWSE_TIMEOUT, default=0): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
         vol.Optional(CONF_DEBUG, default=False): cv.boolean,
         vol.Optional(CONF_CREDENTIALS, default=lambda: []): vol.All(
             cv.ensure_list,
@@ -188,11 +234,13 @@ CONFIG_ENTRY_SCHEMA = vol.Schema(
                         {
                             vol.Required(CONF_USERNAME): cv.string,
                             vol.Required(CONF_PASSWORD): cv.string,
+                            vol.Optional(CONF_ENTITIES, default=lambda: []): cv.entity_ids,
                         }
                     ),
                     vol.Schema(
                         {
                             vol.Required(CONF_X_TOKEN): cv.string,
+                            vol.Optional(CONF_ENTITIES, default=lambda: []): cv.entity_ids,
                         }
                     ),
                 )
@@ -281,6 +329,11 @@ async def async_setup_entry(hass: HomeAssistantType, config_entry: ConfigEntry)
         else:
             config = CONFIG_ENTRY_SCHEMA(dict(config_entry.data))
 
+        from custom_components.yandex_music_browser.catalogue import get_translation_catalogue
+
+        # Load translations ahead of browse requests, which look up languages within event loop
+        await hass.async_add_executor_job(get_translation_catalogue)
+
         uninstalls = {}
         authenticators = {}
         
@@ -341,9 +394,18 @@ async def async_setup_entry(hass: HomeAssistantType, config_entry: ConfigEntry)
 
         hass.data[DATA_AUTHENTICATORS] = authenticators
         hass.data[DATA_UNINSTALLS] = uninstalls
-        hass.data[DATA_BROWSER] = None
+        from custom_components.yandex_music_browser.default import MusicBrowserPool
+
+        hass.data[DATA_BROWSER] = MusicBrowserPool(hass)
         hass.data[DOMAIN] = config
 
+        if config[CONF_THUMBNAIL_CACHE]:
+            from custom_components.yandex_music_browser.thumbnails import (
+                async_setup_thumbnail_cache,
+            )
+
+            await async_setup_thumbnail_cache(hass)
+
         return True
 
     finally:
@@ -354,9 +416,21 @@ async def async_setup_entry(hass: HomeAssistantType, config_entry: ConfigEntry)
 async def async_unload_entry(hass: HomeAssistantType, config_entry: ConfigEntry) -> bool:
     _LOGGER.debug(f"Begin entry unload: {config_entry.entry_id}")
 
+    refresh_scheduler = hass.data.pop(DATA_REFRESH_SCHEDULER, None)
+    if refresh_scheduler is not None:
+        await refresh_scheduler.async_stop()
+
+    prefetcher = hass.data.pop(DATA_PREFETCHER, None)
+    if prefetcher is not None:
+        await prefetcher.async_stop()
+
     hass.data[DOMAIN] = None
     hass.data[DATA_BROWSER] = None
 
+    if DATA_THUMBNAIL_STORE in hass.data:
+        # Keep the key, as registered thumbnail view outlives the entry
+        hass.data[DATA_THUMBNAIL_STORE] = None
+
     del hass.data[DATA_AUTHENTICATORS]
 
     uninstalls = hass.data.pop(DATA_UNINSTALLS)
@@ -0,0 +1,131 @@
+"""Bounded expiring caches shared between executor threads."""
+__all__ = [
+    "TTLCache",
+]
+
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+_KT = TypeVar("_KT", bound=Hashable)
+_VT = TypeVar("_VT")
+
+_MISSING = object()
+
+
+class _PendingLoad:
+    __slots__ = ("event", "value")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.value = None
+
+
+class TTLCache(Generic[_KT, _VT]):
+    """
+    Thread-safe LRU cache with expiring entries.
+
+    Positive results and negative (`None`) results expire separately, so failed lookups
+    are retried sooner than successful ones are refreshed. Concurrent misses of the same
+    key are coalesced into a single load.
+    """
+
+    def __init__(self, max_size: int, ttl: float, negative_ttl: float) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries: "OrderedDict[_KT, Tuple[float, Optional[_VT]]]" = OrderedDict()
+        self._pending: Dict[_KT, _PendingLoad] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: _KT) -> bool:
+        with self._lock:
+            return self._lookup(key) is not _MISSING
+
+    def _lookup(self, key: _KT):
+        """Get unexpired value (or `_MISSING`); lock must be held"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        if entry[0] <= monotonic():
+            del self._entries[key]
+            return _MISSING
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def _store(self, key: _KT, value: Optional[_VT]) -> None:
+        """Store value; lock must be held"""
+        ttl = self.negative_ttl if value is None else self.ttl
+        if ttl <= 0:
+            self._entries.pop(key, None)
+            return
+
+        self._entries[key] = (monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def get(self, key: _KT, default: Optional[_VT] = None) -> Optional[_VT]:
+        """
+        Get cached value.
+        :param key: Cache key
+        :param default: Value to return when key is not cached (or its entry expired)
+        :return: Cached value (`None` for cached negative results)
+        """
+        with self._lock:
+            value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def set(self, key: _KT, value: Optional[_VT]) -> None:
+        """
+        Cache value (`None` caches a negative result).
+        :param key: Cache key
+        :param value: Value
+        """
+        with self._lock:
+            self._store(key, value)
+
+    def pop(self, key: _KT) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_or_load(self, key: _KT, loader: Callable[[], Optional[_VT]]) -> Optional[_VT]:
+        """
+        Get cached value, or load and cache it. Threads missing the same key concurrently
+        wait for the first one to finish loading instead of loading the value again
+        (should loading fail, waiting threads receive `None`).
+        :param key: Cache key
+        :param loader: Function returning value (`None` for negative results)
+        :return: Cached or loaded value
+        """
+        with self._lock:
+            value = self._lookup(key)
+            if value is not _MISSING:
+                return value
+
+            pending = self._pending.get(key)
+            is_loader = pending is None
+            if is_loader:
+                pending = self._pending[key] = _PendingLoad()
+
+        if not is_loader:
+            pending.event.wait()
+            return pending.value
+
+        try:
+            pending.value = loader()
+            with self._lock:
+                self._store(key, pending.value)
+            return pending.value
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+            pending.event.set()
@@ -0,0 +1,152 @@
+"""Translation catalogue for media browser titles."""
+__all__ = [
+    "CATALOGUE_ROOT_KEY",
+    "TranslationCatalogue",
+    "TranslationTemplate",
+    "get_loaded_translation_catalogue",
+    "get_translation_catalogue",
+]
+
+import threading
+from json import load
+from os import listdir
+from os.path import dirname, join, realpath, splitext
+from string import Formatter
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+CATALOGUE_ROOT_KEY = "media_browser"
+CATALOGUE_DEFAULT_LANGUAGE = "en"
+
+_TRANSLATIONS_DIR = join(dirname(realpath(__file__)), "translations")
+
+
+class TranslationTemplate:
+    """
+    Translation string compiled into literal parts and placeholders.
+
+    Placeholders missing from formatting arguments are kept intact (e.g. `{title}`).
+    Strings without placeholders are returned as-is without any formatting.
+    """
+
+    __slots__ = ("template", "_parts", "_constant")
+
+    def __init__(self, template: str) -> None:
+        self.template = template
+        self._constant: Optional[str] = None
+        self._parts: Optional[Tuple[Tuple[str, Optional[str]], ...]] = None
+
+        parts = []
+        for literal, field_name, format_spec, conversion in Formatter().parse(template):
+            if format_spec or conversion:
+                # Complex placeholders are left to `str.format_map`
+                return
+            parts.append((literal, field_name))
+
+        if all(field_name is None for _, field_name in parts):
+            self._constant = "".join(literal for literal, _ in parts)
+        else:
+            self._parts = tuple(parts)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}:{self.template!r}>"
+
+    def format(self, arguments: Mapping[str, Any]) -> str:
+        if self._constant is not None:
+            return self._constant
+
+        if self._parts is None:
+            return self.template.format_map(_MissingPlaceholdersDict(arguments))
+
+        result = []
+        for literal, field_name in self._parts:
+            result.append(literal)
+            if field_name is not None:
+                if field_name in arguments:
+                    result.append(str(arguments[field_name]))
+                else:
+                    result.append("{" + field_name + "}")
+        return "".join(result)
+
+
+class _MissingPlaceholdersDict(dict):
+    def __missing__(self, key):
+        return "{" + str(key) + "}"
+
+
+_LanguageStringsType = Mapping[str, Mapping[str, TranslationTemplate]]
+_EMPTY_STRINGS: _LanguageStringsType = MappingProxyType({})
+
+
+class TranslationCatalogue:
+    """
+    Immutable catalogue of compiled translations for all languages shipped with the component.
+    Languages are merged over the default language, so missing strings fall back to it.
+    """
+
+    def __init__(self, translations: Mapping[str, Mapping[str, Mapping[str, str]]]) -> None:
+        default_strings = translations.get(CATALOGUE_DEFAULT_LANGUAGE, {})
+
+        languages: Dict[str, _LanguageStringsType] = {}
+        for language, strings in translations.items():
+            merged = {}
+            for media_type in {*default_strings, *strings}:
+                merged[media_type] = MappingProxyType(
+                    {
+                        key: TranslationTemplate(template)
+                        for key, template in {
+                            **default_strings.get(media_type, {}),
+                            **strings.get(media_type, {}),
+                        }.items()
+                    }
+                )
+            languages[language] = MappingProxyType(merged)
+
+        self._languages = MappingProxyType(languages)
+
+    @property
+    def languages(self) -> Tuple[str, ...]:
+        return tuple(self._languages)
+
+    def get_language_strings(self, language: Optional[str]) -> _LanguageStringsType:
+        """
+        Get compiled translations for language.
+        :param language: Language code
+        :return: Translations by media type and key (default language ones if unsupported)
+        """
+        language_strings = self._languages.get(language)
+        if language_strings is None:
+            language_strings = self._languages.get(CATALOGUE_DEFAULT_LANGUAGE, _EMPTY_STRINGS)
+        return language_strings
+
+    @classmethod
+    def load(cls, translations_dir: str = _TRANSLATIONS_DIR) -> "TranslationCatalogue":
+        translations = {}
+        for file_name in listdir(translations_dir):
+            language, extension = splitext(file_name)
+            if extension != ".json":
+                continue
+            with open(join(translations_dir, file_name), "r", encoding="utf-8") as f:
+                translations[language] = load(f).get(CATALOGUE_ROOT_KEY, {})
+        return cls(translations)
+
+
+_CATALOGUE: Optional[TranslationCatalogue] = None
+_CATALOGUE_LOCK = threading.Lock()
+
+
+def get_translation_catalogue() -> TranslationCatalogue:
+    """Get translation catalogue (loaded once per process)"""
+    global _CATALOGUE
+
+    if _CATALOGUE is None:
+        with _CATALOGUE_LOCK:
+            if _CATALOGUE is None:
+                _CATALOGUE = TranslationCatalogue.load()
+
+    return _CATALOGUE
+
+
+def get_loaded_translation_catalogue() -> Optional[TranslationCatalogue]:
+    """Get translation catalogue without loading it (safe to call within event loop)"""
+    return _CATALOGUE
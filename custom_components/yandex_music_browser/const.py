@@ -34,3 +34,19 @@ CONF_PATCHES = "patches"
 CONF_DEBUG: Final = "debug"
 DATA_CONFIG = DOMAIN + "_config"
 DATA_PLAY_KEY = DOMAIN + "_play_key"
+CONF_REFRESH_INTERVALS: Final = "refresh_intervals"
+CONF_REFRESH_CONCURRENCY: Final = "refresh_concurrency"
+CONF_REFRESH_JITTER: Final = "refresh_jitter"
+DATA_REFRESH_SCHEDULER = DOMAIN + "_refresh_scheduler"
+CONF_PREFETCH_CHILDREN: Final = "prefetch_children"
+DATA_PREFETCHER = DOMAIN + "_prefetcher"
+CONF_PAGE_SIZE: Final = "page_size"
+CONF_PROXY_AUDIO: Final = "proxy_audio"
+CONF_THUMBNAIL_CACHE: Final = "thumbnail_cache"
+CONF_THUMBNAIL_CACHE_SIZE: Final = "thumbnail_cache_size"
+DATA_THUMBNAIL_STORE = DOMAIN + "_thumbnail_store"
+THUMBNAIL_PROXY_PATH: Final = "/api/yandex_music_browser/v1.0/thumbnail"
+CONF_CACHE_PAYLOADS: Final = "cache_payloads"
+CONF_API_CALL_BUDGET: Final = "api_call_budget"
+CONF_BROWSE_DEADLINE: Final = "browse_deadline"
+CONF_BROWSE_TIMEOUT: Final = "browse_timeout"
@@ -1,21 +1,29 @@
 import asyncio
+import functools
 import logging
-from typing import Union
+from typing import Dict, Optional, Union
 
 import aiohttp
 from homeassistant.components.media_player import MediaPlayerEntity
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.const import CONF_ENTITIES, CONF_PASSWORD, CONF_USERNAME
 from homeassistant.helpers.typing import HomeAssistantType
 from yandex_music import Client
 
 from custom_components.yandex_music_browser.const import (
     CONF_CREDENTIALS,
+    CONF_PREFETCH_CHILDREN,
+    CONF_REFRESH_CONCURRENCY,
+    CONF_REFRESH_INTERVALS,
+    CONF_REFRESH_JITTER,
     CONF_X_TOKEN,
     DATA_AUTHENTICATORS,
     DATA_BROWSER,
+    DATA_PREFETCHER,
+    DATA_REFRESH_SCHEDULER,
     DOMAIN,
 )
 from custom_components.yandex_music_browser.media_browser import (
+    YandexBrowseMedia,
     YandexMusicBrowser,
     YandexMusicBrowserAuthenticationError,
 )
@@ -43,7 +51,21 @@ async def async_get_music_token(x_token: str):
     return resp["access_token"]
 
 
-async def async_authenticate_using_config_credentials(hass: HomeAssistantType) -> "Client":
+def get_assigned_credentials(hass: HomeAssistantType, entity_id: Optional[str]) -> list:
+    """Get configured credentials explicitly assigned to entity"""
+    if entity_id is None:
+        return []
+
+    return [
+        credential
+        for credential in hass.data[DOMAIN].get(CONF_CREDENTIALS) or []
+        if entity_id in credential.get(CONF_ENTITIES, ())
+    ]
+
+
+async def async_authenticate_using_config_credentials(
+    hass: HomeAssistantType, entity_id: Optional[str] = None
+) -> "Client":
     config = hass.data[DOMAIN]
     credentials = config.get(CONF_CREDENTIALS)
 
@@ -52,6 +74,13 @@ async def async_authenticate_using_config_credentials(hass: HomeAssistantType) -
 
     from yandex_music import Client
 
+    # Credentials assigned to the entity take precedence over unassigned ones;
+    # credentials assigned to other entities are never used
+    credentials = [
+        *get_assigned_credentials(hass, entity_id),
+        *(credential for credential in credentials if not credential.get(CONF_ENTITIES)),
+    ]
+
     for credential in credentials:
         if CONF_X_TOKEN in credential:
             x_token = credential[CONF_X_TOKEN]
@@ -66,59 +95,184 @@ async def async_authenticate_using_config_credentials(hass: HomeAssistantType) -
     raise YandexMusicBrowserAuthenticationError("No credentials found to perform authentication")
 
 
-async def async_get_music_browser(
-    entity: Union[MediaPlayerEntity, HomeAssistantType]
-) -> YandexMusicBrowser:
-    hass = entity.hass if isinstance(entity, MediaPlayerEntity) else entity
+def async_start_refresh_scheduler(hass: HomeAssistantType, music_browser: YandexMusicBrowser):
+    config = hass.data.get(DOMAIN) or {}
+    intervals = config.get(CONF_REFRESH_INTERVALS)
 
-    music_browser = hass.data.get(DATA_BROWSER)
+    if not intervals or hass.data.get(DATA_REFRESH_SCHEDULER) is not None:
+        return
 
-    if isinstance(music_browser, asyncio.Future):
-        # Await running authentication process
-        music_browser = await music_browser
+    from custom_components.yandex_music_browser.refresh import BrowseRefreshScheduler
 
-    elif music_browser is None:
-        # Create running authentication process
-        future_obj = hass.loop.create_future()
-        hass.data[DATA_BROWSER] = future_obj
+    scheduler = BrowseRefreshScheduler(
+        hass,
+        music_browser,
+        intervals,
+        max_concurrent=config[CONF_REFRESH_CONCURRENCY],
+        jitter=config[CONF_REFRESH_JITTER],
+    )
+    scheduler.async_start()
+
+    hass.data[DATA_REFRESH_SCHEDULER] = scheduler
+
+
+def async_schedule_prefetch(
+    hass: HomeAssistantType,
+    music_browser: YandexMusicBrowser,
+    browse_object: YandexBrowseMedia,
+    language: Optional[str] = None,
+):
+    config = hass.data.get(DOMAIN) or {}
+    children = config.get(CONF_PREFETCH_CHILDREN)
+
+    if not children:
+        return
+
+    prefetcher = hass.data.get(DATA_PREFETCHER)
+    if prefetcher is None:
+        from custom_components.yandex_music_browser.refresh import BrowsePrefetcher
 
+        prefetcher = hass.data[DATA_PREFETCHER] = BrowsePrefetcher(hass, children)
+
+    prefetcher.async_schedule(music_browser, browse_object, language)
+
+
+async def async_authenticate(entity: Union[MediaPlayerEntity, HomeAssistantType]) -> str:
+    hass = entity.hass if isinstance(entity, MediaPlayerEntity) else entity
+    entity_id = entity.entity_id if isinstance(entity, MediaPlayerEntity) else None
+
+    if get_assigned_credentials(hass, entity_id):
+        # Explicitly assigned credentials override patch authentication
         try:
-            authentication = None
-
-            for patch, authenticator in hass.data[DATA_AUTHENTICATORS].items():
-                # Attempt to authenticate using patches
-                try:
-                    authentication = await authenticator(entity)
-                except BaseException as e:
-                    _LOGGER.error(f"Patch {patch} failed to authenticate: {e}")
-
-            if authentication is None:
-                # Fall back to default authentication methods
-                try:
-                    authentication = await async_authenticate_using_config_credentials(hass)
-                except BaseException as e:
-                    _LOGGER.error(f"Default authentication failed: {e}")
-
-                    raise YandexMusicBrowserAuthenticationError(
-                        "Could not authenticate with any of the provided patches"
-                    )
-
-            # Instantiate music browser object
-            music_browser = await hass.async_add_executor_job(
+            return await async_authenticate_using_config_credentials(hass, entity_id)
+        except BaseException as e:
+            _LOGGER.error(f"Authentication using credentials assigned to {entity_id} failed: {e}")
+
+    for patch, authenticator in hass.data[DATA_AUTHENTICATORS].items():
+        # Attempt to authenticate using patches
+        try:
+            authentication = await authenticator(entity)
+        except BaseException as e:
+            _LOGGER.error(f"Patch {patch} failed to authenticate: {e}")
+        else:
+            if authentication is not None:
+                return authentication
+
+    # Fall back to default authentication methods
+    try:
+        return await async_authenticate_using_config_credentials(hass, entity_id)
+    except BaseException as e:
+        _LOGGER.error(f"Default authentication failed: {e}")
+
+        raise YandexMusicBrowserAuthenticationError(
+            "Could not authenticate with any of the provided patches"
+        )
+
+
+class MusicBrowserPool:
+    """
+    Music browsers keyed by Yandex account, selected per media player entity.
+
+    Browsers of different accounts share response cache of public data (genres, albums,
+    artists, etc.), while private library data is cached by each browser on its own.
+    """
+
+    def __init__(self, hass: HomeAssistantType) -> None:
+        self.hass = hass
+        self.browsers: Dict[str, YandexMusicBrowser] = {}
+        self.shared_response_cache: dict = {}
+        self.default_browser: Optional[YandexMusicBrowser] = None
+        self._selected_accounts: Dict[Optional[str], str] = {}
+        self._token_accounts: Dict[str, str] = {}
+        self._pending: Dict[Optional[str], asyncio.Future] = {}
+
+    def add_browser(
+        self, music_browser: YandexMusicBrowser, entity_id: Optional[str] = None
+    ) -> YandexMusicBrowser:
+        """
+        Add browser to the pool, unless a browser of the same account is already present.
+        :param music_browser: Music browser
+        :param entity_id: Entity ID to select browser for (`None` for default selection)
+        :return: Browser of the account held within the pool
+        """
+        user_id = music_browser.user_id
+        music_browser = self.browsers.setdefault(user_id, music_browser)
+        self._selected_accounts[entity_id] = user_id
+
+        if self.default_browser is None:
+            self.default_browser = music_browser
+            async_start_refresh_scheduler(self.hass, music_browser)
+
+        return music_browser
+
+    async def _async_create_browser(self, authentication: Union[str, Client]) -> YandexMusicBrowser:
+        if isinstance(authentication, str):
+            user_id = self._token_accounts.get(authentication)
+            if user_id in self.browsers:
+                return self.browsers[user_id]
+
+        music_browser = await self.hass.async_add_executor_job(
+            functools.partial(
                 YandexMusicBrowser,
                 authentication,
-                hass.data[DOMAIN],
+                self.hass.data[DOMAIN],
+                shared_response_cache=self.shared_response_cache,
+            )
+        )
+
+        if isinstance(authentication, str):
+            self._token_accounts[authentication] = music_browser.user_id
+
+        return music_browser
+
+    async def async_get(
+        self, entity: Union[MediaPlayerEntity, HomeAssistantType]
+    ) -> YandexMusicBrowser:
+        entity_id = entity.entity_id if isinstance(entity, MediaPlayerEntity) else None
+
+        user_id = self._selected_accounts.get(entity_id)
+        if user_id is not None:
+            return self.browsers[user_id]
+
+        if entity_id is None and self.default_browser is not None:
+            return self.default_browser
+
+        future_obj = self._pending.get(entity_id)
+        if future_obj is not None:
+            # Await running authentication process
+            return await asyncio.shield(future_obj)
+
+        # Create running authentication process
+        future_obj = self.hass.loop.create_future()
+        self._pending[entity_id] = future_obj
+
+        try:
+            authentication = await async_authenticate(entity)
+            music_browser = self.add_browser(
+                await self._async_create_browser(authentication), entity_id
             )
 
         except BaseException as e:
-            # Remove browser future
-            hass.data[DATA_BROWSER] = None
             future_obj.set_exception(e)
+            # Mark exception as retrieved in case nobody else awaits it
+            future_obj.exception()
             raise
 
         else:
-            # Set browser object in place of the future
-            hass.data[DATA_BROWSER] = music_browser
             future_obj.set_result(music_browser)
+            return music_browser
+
+        finally:
+            del self._pending[entity_id]
+
+
+async def async_get_music_browser(
+    entity: Union[MediaPlayerEntity, HomeAssistantType]
+) -> YandexMusicBrowser:
+    hass = entity.hass if isinstance(entity, MediaPlayerEntity) else entity
+
+    browser_pool: Optional[MusicBrowserPool] = hass.data.get(DATA_BROWSER)
+    if browser_pool is None:
+        raise YandexMusicBrowserAuthenticationError("Music browser is not set up")
 
-    return music_browser
+    return await browser_pool.async_get(entity)
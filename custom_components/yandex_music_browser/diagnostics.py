@@ -0,0 +1,37 @@
+"""Diagnostics support for Yandex Music Browser."""
+from typing import Any, Dict
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.typing import HomeAssistantType
+
+from custom_components.yandex_music_browser.const import DATA_BROWSER
+from custom_components.yandex_music_browser.media_browser import get_interned_nodes_count
+from custom_components.yandex_music_browser.timings import BROWSE_TIMINGS
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistantType, config_entry: ConfigEntry
+) -> Dict[str, Any]:
+    browser_pool = hass.data.get(DATA_BROWSER)
+
+    browsers_diagnostics = []
+    shared_response_cache_size = None
+    if browser_pool is not None:
+        shared_response_cache_size = len(browser_pool.shared_response_cache)
+        for music_browser in browser_pool.browsers.values():
+            browsers_diagnostics.append(
+                {
+                    "default": music_browser is browser_pool.default_browser,
+                    "response_cache_size": len(music_browser.response_cache),
+                    "search_index_size": len(music_browser.search_index),
+                    "negative_cache_size": len(music_browser.negative_cache),
+                    "debug": music_browser.debug,
+                }
+            )
+
+    return {
+        "browsers": browsers_diagnostics,
+        "shared_response_cache_size": shared_response_cache_size,
+        "interned_nodes_count": get_interned_nodes_count(),
+        "timings": BROWSE_TIMINGS.as_dict(),
+    }
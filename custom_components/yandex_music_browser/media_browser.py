@@ -12,11 +12,16 @@ __all__ = [
     "UnknownMediaType",
     "TimeoutDataFetching",
     "BrowseTree",
+    "BrowseRequest",
+    "DEFAULT_API_CALL_BUDGET",
+    "DEFAULT_BROWSE_DEADLINE",
+    "DEFAULT_BROWSE_TIMEOUT",
     "DEFAULT_LYRICS",
     "DEFAULT_MENU_OPTIONS",
     "DEFAULT_CACHE_TTL",
     "DEFAULT_SHOW_HIDDEN",
     "DEFAULT_LANGUAGE",
+    "DEFAULT_PAGE_SIZE",
     "DEFAULT_THUMBNAIL_RESOLUTION",
     "DEFAULT_TIMEOUT",
     "DEFAULT_REQUEST_TIMEOUT",
@@ -28,23 +33,42 @@ __all__ = [
     "sanitize_media_link",
     "sanitize_thumbnail_uri",
     "sanitize_browse_thumbnail",
+    "proxy_thumbnail_uri",
+    "is_thumbnail_host_allowed",
+    "get_thumbnail_signature",
+    "split_media_content_id_page",
+    "join_media_content_id_page",
+    "get_current_browse_request",
+    "get_media_object_processor",
+    "get_interned_nodes_count",
 ]
 
 import functools
+import hashlib
+import hmac
 import logging
 import re
-from copy import deepcopy
+import secrets
+import sys
+import threading
+from contextlib import contextmanager
 from json import dumps
-from time import time
+from time import monotonic, time
+from types import MappingProxyType
+from urllib.parse import quote
+from weakref import WeakSet, WeakValueDictionary
 from typing import (
     Any,
     Callable,
     Dict,
     Hashable,
     Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
+    Sequence,
+    Set,
     Tuple,
     Type,
     TypeVar,
@@ -80,16 +104,24 @@ from yandex_music import (
     TrackShort,
     YandexMusicObject,
 )
+from yandex_music.exceptions import TimedOutError
 
 from custom_components.yandex_music_browser.const import (
+    CONF_CACHE_PAYLOADS,
+    CONF_API_CALL_BUDGET,
+    CONF_BROWSE_DEADLINE,
+    CONF_BROWSE_TIMEOUT,
     CONF_CACHE_TTL,
+    CONF_DEBUG,
     CONF_HEIGHT,
     CONF_IMAGE,
     CONF_ITEMS,
     CONF_LANGUAGE,
     CONF_LYRICS,
     CONF_MENU_OPTIONS,
+    CONF_PAGE_SIZE,
     CONF_SHOW_HIDDEN,
+    CONF_THUMBNAIL_CACHE,
     CONF_THUMBNAIL_RESOLUTION,
     CONF_TITLE,
     CONF_WIDTH,
@@ -98,8 +130,14 @@ from custom_components.yandex_music_browser.const import (
     MEDIA_TYPE_MIX_TAG,
     MEDIA_TYPE_RADIO,
     ROOT_MEDIA_CONTENT_TYPE,
+    THUMBNAIL_PROXY_PATH,
 )
 
+from custom_components.yandex_music_browser.cache import TTLCache
+from custom_components.yandex_music_browser.catalogue import get_translation_catalogue
+from custom_components.yandex_music_browser.search import SearchIndex, tokenize
+from custom_components.yandex_music_browser.timings import BROWSE_TIMINGS, timed_processor
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -124,9 +162,13 @@ BrowseGeneratorType = Callable[
 
 DirectoryChildrenType = Callable[["YandexMusicBrowser", MediaContentIDType], MediaObjectsReturnType]
 
+HydrateChildrenType = Callable[["YandexMusicBrowser", Sequence[MediaObjectType]], List[MediaObjectType]]
+
 MediaProcessorType = Callable[["YandexMusicBrowser", str], MediaObjectReturnType]
 
 MAP_MEDIA_OBJECT_TO_BROWSE: Dict[Type[_MediaObjectType], BrowseGeneratorType] = {}
+# Processors resolved for media object classes (including subclasses) through MRO
+_MEDIA_OBJECT_PROCESSOR_CACHE: Dict[type, Optional[BrowseGeneratorType]] = {}
 MAP_MEDIA_TYPE_TO_BROWSE: Dict[str, BrowseGeneratorType] = {}
 MAP_MATCHER_TO_MEDIA_TYPE: Dict[re.Pattern, Tuple[CustomResolverCallback, BrowseGeneratorType]] = {}
 
@@ -139,8 +181,27 @@ DEFAULT_LANGUAGE = "en"
 DEFAULT_THUMBNAIL_RESOLUTION = (200, 200)
 DEFAULT_SHOW_HIDDEN = False
 DEFAULT_LYRICS = False
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_THUMBNAIL_CACHE = False
+DEFAULT_CACHE_PAYLOADS = False
+DEFAULT_DEBUG = False
+DEFAULT_API_CALL_BUDGET = 0  # unlimited
+DEFAULT_BROWSE_DEADLINE = 0  # disabled
+DEFAULT_BROWSE_TIMEOUT = 0  # disabled
+MAX_DEFERRED_NODES = 50
+DEFAULT_SEARCH_RESULTS = 50
+USER_DATA_CACHE_SIZE = 1024
+USER_DATA_TTL = 6 * 60 * 60
+USER_DATA_NEGATIVE_TTL = 5 * 60
+NEGATIVE_CACHE_SIZE = 1024
+NEGATIVE_CACHE_TTL = 60
+PLAYLIST_TITLES_SIZE = 1024
+PLAYLIST_TITLES_TTL = 6 * 60 * 60
 
 THUMBNAIL_EMPTY_IMAGE = "/non/exiswtent/thumbnail/generate/404"
+THUMBNAIL_ALLOWED_HOST_SUFFIXES = ("yandex.net", "yandex.ru")
+# Proxied thumbnail paths are signed, so the cache serves only thumbnails the browser emitted
+_THUMBNAIL_SIGNING_KEY = secrets.token_bytes(32)
 
 ITEM_RESPONSE_CACHE = {}
 
@@ -152,6 +213,7 @@ class YandexBrowseMedia(BrowseMedia):
         media_content_id: str,
         media_content_type: str,
         media_object: Optional[YandexMusicObject] = None,
+        media_object_cls: Optional[Type[YandexMusicObject]] = None,
         **kwargs,
     ) -> None:
         super().__init__(
@@ -160,6 +222,37 @@ class YandexBrowseMedia(BrowseMedia):
         self.yandex_media_content_id = media_content_id
         self.yandex_media_content_type = media_content_type
         self.media_object = media_object
+        self.media_object_cls = media_object_cls if media_object is None else type(media_object)
+        self.payload: Optional[Dict[str, Any]] = None
+        self.api_calls: Optional[int] = None
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "YandexBrowseMedia":
+        """Create browse object which serializes into pre-serialized payload."""
+        browse_object = cls(
+            media_class=payload["media_class"],
+            media_content_id=payload["media_content_id"],
+            media_content_type=payload["media_content_type"],
+            title=payload["title"],
+            can_play=payload["can_play"],
+            can_expand=payload["can_expand"],
+            children_media_class=payload.get("children_media_class"),
+            thumbnail=payload.get("thumbnail"),
+        )
+        browse_object.payload = payload
+        return browse_object
+
+    def as_dict(self, *, parent: bool = True) -> dict:
+        if parent and self.payload is not None:
+            result = self.payload
+        else:
+            result = super().as_dict(parent=parent)
+
+        if parent and self.api_calls is not None:
+            # Cached payloads are shared between responses, so they are not modified
+            result = {**result, "api_calls": self.api_calls}
+
+        return result
 
     def __repr__(self):
         return (
@@ -181,6 +274,236 @@ class YandexBrowseMedia(BrowseMedia):
         return repr(self)
 
 
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+def get_search_tokens(media_object: Any) -> Optional[Tuple[str, ...]]:
+    """
+    Get words media object is found by within local search.
+    :param media_object: Media object
+    :return: Words of title, artists and albums (`None` for objects not subject to search)
+    """
+    if isinstance(media_object, Track):
+        fields = [media_object.title, *media_object.artists_name()]
+        if media_object.albums:
+            fields.extend(album.title for album in media_object.albums)
+    elif isinstance(media_object, Album):
+        fields = [media_object.title, *media_object.artists_name()]
+    elif isinstance(media_object, Artist):
+        fields = [media_object.name]
+    elif isinstance(media_object, Playlist):
+        fields = [media_object.title]
+    else:
+        return None
+
+    return tuple(sorted({sys.intern(token) for field in fields for token in tokenize(field)}))
+
+
+# Leaf nodes by presentation fingerprint; entries vanish with the last cache referencing them
+_LEAF_NODES: "WeakValueDictionary[Tuple[Any, ...], CompactBrowseNode]" = WeakValueDictionary()
+_LEAF_NODES_LOCK = threading.Lock()
+
+
+class CompactBrowseNode:
+    """
+    Memory-efficient representation of browse objects held in response cache.
+
+    Nodes keep only attributes required for rendering, share equal strings through
+    the interpreter's interned string table, and reference media object classes
+    instead of media objects themselves. Leaf nodes (e.g. tracks) rendered identically
+    within albums, playlists and likes are interned as well, and must not be modified.
+    Root nodes of response cache entries are never interned, so payloads attached to them
+    belong to their entry alone.
+    """
+
+    __slots__ = (
+        "media_class",
+        "media_content_type",
+        "media_content_id",
+        "yandex_media_content_type",
+        "yandex_media_content_id",
+        "title",
+        "thumbnail",
+        "can_play",
+        "can_expand",
+        "children_media_class",
+        "children",
+        "media_object_cls",
+        "search_tokens",
+        "payloads",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        media_class: str,
+        media_content_type: str,
+        media_content_id: str,
+        yandex_media_content_type: str,
+        yandex_media_content_id: str,
+        title: str,
+        thumbnail: Optional[str],
+        can_play: bool,
+        can_expand: bool,
+        children_media_class: Optional[str] = None,
+        children: Optional[Tuple["CompactBrowseNode", ...]] = None,
+        media_object_cls: Optional[Type[YandexMusicObject]] = None,
+        search_tokens: Optional[Tuple[str, ...]] = None,
+    ) -> None:
+        self.media_class = _intern(media_class)
+        self.media_content_type = _intern(media_content_type)
+        self.media_content_id = _intern(media_content_id)
+        self.yandex_media_content_type = _intern(yandex_media_content_type)
+        self.yandex_media_content_id = _intern(yandex_media_content_id)
+        self.title = _intern(title)
+        self.thumbnail = _intern(thumbnail)
+        self.can_play = can_play
+        self.can_expand = can_expand
+        self.children_media_class = _intern(children_media_class)
+        self.children = children
+        self.media_object_cls = media_object_cls
+        self.search_tokens = search_tokens
+        # Serialized forms of the node, keyed by presentation target
+        self.payloads: Optional[Dict[Hashable, Dict[str, Any]]] = None
+
+    def __repr__(self):
+        return (
+            self.__class__.__name__
+            + "["
+            + str(self.yandex_media_content_type)
+            + ":"
+            + str(self.yandex_media_content_id)
+            + "]"
+        )
+
+    @classmethod
+    def from_browse_media(
+        cls, browse_object: BrowseMedia, with_children: bool = True, intern: bool = True
+    ) -> "CompactBrowseNode":
+        """
+        Convert browse object into a compact node.
+        :param browse_object: Browse object
+        :param with_children: Convert children as well
+        :param intern: Intern the node if it is a leaf (children are interned regardless)
+        :return: Compact node
+        """
+        children = browse_object.children if with_children else None
+        if children is not None:
+            children = tuple(map(cls.from_browse_media, children))
+
+        media_object = getattr(browse_object, "media_object", None)
+
+        node = cls(
+            media_class=browse_object.media_class,
+            media_content_type=browse_object.media_content_type,
+            media_content_id=browse_object.media_content_id,
+            yandex_media_content_type=getattr(
+                browse_object, "yandex_media_content_type", browse_object.media_content_type
+            ),
+            yandex_media_content_id=getattr(
+                browse_object, "yandex_media_content_id", browse_object.media_content_id
+            ),
+            title=browse_object.title,
+            thumbnail=browse_object.thumbnail,
+            can_play=browse_object.can_play,
+            can_expand=browse_object.can_expand,
+            children_media_class=browse_object.children_media_class,
+            children=children,
+            media_object_cls=(
+                getattr(browse_object, "media_object_cls", None)
+                if media_object is None
+                else type(media_object)
+            ),
+            search_tokens=None if media_object is None else get_search_tokens(media_object),
+        )
+
+        if intern and children is None:
+            node = node.intern()
+
+        return node
+
+    @property
+    def fingerprint(self) -> Tuple[Any, ...]:
+        """Attributes the node is rendered from (media link first)"""
+        return (
+            self.yandex_media_content_type,
+            self.yandex_media_content_id,
+            self.media_content_type,
+            self.media_content_id,
+            self.media_class,
+            self.title,
+            self.thumbnail,
+            self.can_play,
+            self.can_expand,
+            self.children_media_class,
+            self.media_object_cls,
+            self.search_tokens,
+        )
+
+    def intern(self) -> "CompactBrowseNode":
+        """
+        Get the shared instance of an identically rendered leaf node.
+        :return: Previously interned node (or this node, if none is alive)
+        """
+        if self.children is not None:
+            return self
+
+        fingerprint = self.fingerprint
+        with _LEAF_NODES_LOCK:
+            node = _LEAF_NODES.get(fingerprint)
+            if node is None:
+                node = _LEAF_NODES[fingerprint] = self
+        return node
+
+    def without_children(self) -> "CompactBrowseNode":
+        """Get leaf node rendered the same way as this node (e.g. for listing it elsewhere)"""
+        if self.children is None:
+            return self
+
+        return CompactBrowseNode(
+            media_class=self.media_class,
+            media_content_type=self.media_content_type,
+            media_content_id=self.media_content_id,
+            yandex_media_content_type=self.yandex_media_content_type,
+            yandex_media_content_id=self.yandex_media_content_id,
+            title=self.title,
+            thumbnail=self.thumbnail,
+            can_play=self.can_play,
+            can_expand=self.can_expand,
+            children_media_class=self.children_media_class,
+            media_object_cls=self.media_object_cls,
+            search_tokens=self.search_tokens,
+        ).intern()
+
+    def to_browse_media(self) -> "YandexBrowseMedia":
+        children = self.children
+        if children is not None:
+            children = [child.to_browse_media() for child in children]
+
+        browse_object = YandexBrowseMedia(
+            media_class=self.media_class,
+            media_content_type=self.yandex_media_content_type,
+            media_content_id=self.yandex_media_content_id,
+            title=self.title,
+            thumbnail=self.thumbnail,
+            can_play=self.can_play,
+            can_expand=self.can_expand,
+            children_media_class=self.children_media_class,
+            children=children,
+            media_object_cls=self.media_object_cls,
+        )
+        browse_object.media_content_type = self.media_content_type
+        browse_object.media_content_id = self.media_content_id
+
+        return browse_object
+
+
+def get_interned_nodes_count() -> int:
+    """Get amount of leaf nodes currently shared between cached browse trees"""
+    return len(_LEAF_NODES)
+
+
 class YandexMusicBrowserException(Exception):
     pass
 
@@ -209,31 +532,153 @@ class InvalidUserMediaID(YandexMusicBrowserBrowseError):
     """Raised when media_content_id contains invalid user_id"""
 
 
-_DATA_BY_USER_ID_CACHE = {}
-_DATA_BY_USER_LOGIN_CACHE = {}
+class BrowseRequest:
+    """Accounting of Yandex API calls and time spent while serving a single browse request."""
 
+    __slots__ = (
+        "api_call_budget",
+        "api_calls",
+        "truncations",
+        "deadline",
+        "deadline_truncations",
+        "deferred",
+        "timeout_at",
+        "language",
+    )
 
-def extract_user_data(
-    media_content_id: Union[MediaContentIDType, Client]
-) -> Optional[Dict[str, Any]]:
-    """Extract user ID from media_content_id"""
-    if isinstance(media_content_id, Client):
-        acc = media_content_id.me.account
+    def __init__(
+        self,
+        api_call_budget: int = DEFAULT_API_CALL_BUDGET,
+        browse_deadline: float = DEFAULT_BROWSE_DEADLINE,
+        browse_timeout: float = DEFAULT_BROWSE_TIMEOUT,
+        language: Optional[str] = None,
+    ) -> None:
+        started_at = monotonic()
+        self.language = language
+        self.api_call_budget = api_call_budget
+        self.api_calls = 0
+        self.truncations = 0
+        self.deadline = started_at + browse_deadline if browse_deadline > 0 else None
+        self.timeout_at = started_at + browse_timeout if browse_timeout > 0 else None
+        self.deadline_truncations = 0
+        self.deferred: List[Tuple[str, MediaContentIDType]] = []
 
-        data = {"uid": acc.uid, "login": acc.login, "name": acc.display_name}
-        _DATA_BY_USER_ID_CACHE.setdefault(str(acc.uid), {}).update(data)
-        _DATA_BY_USER_LOGIN_CACHE.setdefault(str(acc.login), {}).update(data)
+    @property
+    def budget_exceeded(self) -> bool:
+        return 0 < self.api_call_budget <= self.api_calls
 
-    elif media_content_id.startswith("#"):
-        uid = media_content_id[1:]
-        return _DATA_BY_USER_ID_CACHE.get(uid, {"uid": uid})
+    @property
+    def deadline_passed(self) -> bool:
+        return self.deadline is not None and monotonic() >= self.deadline
 
-    if (
-        media_content_id in _DATA_BY_USER_LOGIN_CACHE
-        and "image" in _DATA_BY_USER_LOGIN_CACHE[media_content_id]
-    ):
-        return _DATA_BY_USER_LOGIN_CACHE[media_content_id]
+    @property
+    def remaining_time(self) -> Optional[float]:
+        """Time left until browse request times out (if timeout is set)"""
+        return None if self.timeout_at is None else self.timeout_at - monotonic()
+
+    def limit_expansion(self, fetch_children: FetchChildrenType) -> FetchChildrenType:
+        """Disable children expansion once API call budget is exhausted or deadline has passed"""
+        if fetch_children:
+            if self.budget_exceeded:
+                self.truncations += 1
+                return False
+            if self.deadline_passed:
+                self.truncations += 1
+                self.deadline_truncations += 1
+                return False
+        return fetch_children
+
+    def defer(self, media_content_type: str, media_content_id: MediaContentIDType) -> None:
+        """
+        Remember node left unexpanded due to passed deadline, so it can be expanded later.
+        :param media_content_type: Registered media content type
+        :param media_content_id: Media content ID
+        """
+        if not self.deadline_passed or len(self.deferred) >= MAX_DEFERRED_NODES:
+            return
+
+        media_link = (media_content_type, media_content_id)
+        if media_link not in self.deferred:
+            self.deferred.append(media_link)
+
+
+_CURRENT_BROWSE_REQUEST = threading.local()
+
+
+def get_current_browse_request() -> Optional[BrowseRequest]:
+    """Get browse request served by current thread (if any)"""
+    return getattr(_CURRENT_BROWSE_REQUEST, "value", None)
+
+
+def install_request_hooks(client: Client, get_timeout: Callable[[], Optional[float]]) -> None:
+    """
+    Count HTTP requests made by client towards current browse request, and enforce timeouts
+    on every request (including ones made by library methods that do not accept a timeout).
+    Per-request timeout is shortened to fit the time left until current browse request times out.
+    Requests made for a browse request with its own language are localized for that language.
+    :param client: Yandex Music client
+    :param get_timeout: Per-request timeout getter
+    """
+    request = client.request
+    request._browser_get_timeout = get_timeout
+    if getattr(request, "_browser_request_hooks", False):
+        return
+
+    original_request_wrapper = request._request_wrapper
+
+    @functools.wraps(original_request_wrapper)
+    def _hooked_request_wrapper(*args, **kwargs):
+        timeout = request._browser_get_timeout()
+        browse_request = get_current_browse_request()
+        if browse_request is not None:
+            browse_request.api_calls += 1
+            remaining_time = browse_request.remaining_time
+            if remaining_time is not None:
+                if remaining_time <= 0:
+                    raise TimeoutDataFetching("Browse request timed out")
+                if not timeout or remaining_time < timeout:
+                    timeout = remaining_time
+
+            if browse_request.language is not None:
+                # Client headers are shared between threads, hence they are not modified
+                kwargs["headers"] = {
+                    **(kwargs.get("headers") or {}),
+                    "Accept-Language": browse_request.language,
+                }
+
+        if timeout:
+            kwargs["timeout"] = timeout
 
+        try:
+            return original_request_wrapper(*args, **kwargs)
+        except TimedOutError as e:
+            raise TimeoutDataFetching(f"Request timed out after {timeout} seconds") from e
+
+    request._request_wrapper = _hooked_request_wrapper
+    request._browser_request_hooks = True
+
+
+# User data is keyed by user ID (for `#<user_id>` media IDs) and by login (for looked up users)
+_USER_DATA_BY_ID: TTLCache[str, Dict[str, Any]] = TTLCache(
+    USER_DATA_CACHE_SIZE, USER_DATA_TTL, USER_DATA_NEGATIVE_TTL
+)
+_USER_DATA_BY_LOGIN: TTLCache[str, Dict[str, Any]] = TTLCache(
+    USER_DATA_CACHE_SIZE, USER_DATA_TTL, USER_DATA_NEGATIVE_TTL
+)
+# Data of authenticated accounts, used when their profiles can not be looked up (or expired)
+_ACCOUNT_DATA_BY_LOGIN: Dict[str, Dict[str, Any]] = {}
+_ACCOUNT_DATA_BY_ID: Dict[str, Dict[str, Any]] = {}
+
+
+def _remember_user_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    uid = str(data["uid"])
+    data = {**(_USER_DATA_BY_ID.get(uid) or {}), **data}
+    _USER_DATA_BY_ID.set(uid, data)
+    return data
+
+
+def _fetch_user_data(login: str) -> Optional[Dict[str, Any]]:
+    """Look up user profile by login using web handlers"""
     from requests import get
 
     data = None
@@ -241,7 +686,7 @@ def extract_user_data(
         r = get(
             url=f"https://music.yandex.ru/handlers/library.jsx",
             params={
-                "owner": media_content_id,
+                "owner": login,
                 "filter": "playlists",
                 "likeFilter": "favorite",
                 "playlistsWithoutContent": "true",
@@ -250,10 +695,11 @@ def extract_user_data(
                 "overembed": "false",
             },
             headers={
-                "X-Retpath-Y": f"https://music.yandex.ru/users/{media_content_id}/playlists",
+                "X-Retpath-Y": f"https://music.yandex.ru/users/{login}/playlists",
                 "X-Requested-With": "XMLHttpRequest",
-                "Referer": f"https://music.yandex.ru/users/{media_content_id}/playlists",
+                "Referer": f"https://music.yandex.ru/users/{login}/playlists",
             },
+            timeout=DEFAULT_REQUEST_TIMEOUT,
         )
         r.encoding = "utf-8"
         _LOGGER.debug(r.text)
@@ -262,36 +708,57 @@ def extract_user_data(
     except BaseException as e:
         _LOGGER.debug("Could not fetch using requests: %s", e)
 
-    if not data:
-        return _DATA_BY_USER_LOGIN_CACHE.get(media_content_id)
+    if not data or "uid" not in data:
+        return _ACCOUNT_DATA_BY_LOGIN.get(login)
 
     if "avatarHash" in data:
         data["image"] = (
             "https://avatars.mds.yandex.net/get-yapic/" + data.pop("avatarHash") + "/islands-300"
         )
 
-    uid = data.get("uid")
+    return _remember_user_data(data)
 
-    _DATA_BY_USER_LOGIN_CACHE[media_content_id] = data
 
-    if uid in _DATA_BY_USER_ID_CACHE:
-        _DATA_BY_USER_ID_CACHE[uid].update(data)
-    else:
-        _DATA_BY_USER_ID_CACHE[uid] = data
+def extract_user_data(
+    media_content_id: Union[MediaContentIDType, Client]
+) -> Optional[Dict[str, Any]]:
+    """Extract user ID from media_content_id"""
+    if isinstance(media_content_id, Client):
+        acc = media_content_id.me.account
 
-    return data
+        data = _remember_user_data(
+            {"uid": acc.uid, "login": acc.login, "name": acc.display_name}
+        )
+        login = str(acc.login)
+        _ACCOUNT_DATA_BY_LOGIN[login] = _ACCOUNT_DATA_BY_ID[str(acc.uid)] = data
 
+        data = _USER_DATA_BY_LOGIN.get_or_load(login, functools.partial(_fetch_user_data, login))
+        if data is not None:
+            # Keep looked up profile (e.g. avatar) for when user data cache entries expire
+            _ACCOUNT_DATA_BY_LOGIN[login] = _ACCOUNT_DATA_BY_ID[str(acc.uid)] = data
+        return data
 
+    elif media_content_id.startswith("#"):
+        uid = media_content_id[1:]
+        return _USER_DATA_BY_ID.get(uid) or _ACCOUNT_DATA_BY_ID.get(uid) or {"uid": uid}
+
+    return _USER_DATA_BY_LOGIN.get_or_load(
+        media_content_id, functools.partial(_fetch_user_data, media_content_id)
+    )
+
+
+@functools.lru_cache(maxsize=4096)
 def sanitize_thumbnail_uri(
     thumbnail: str, preferred_resolution: PreferredResolutionType = None
 ) -> str:
     """
     Helper function to apply common replacement operations on thumbnail URIs.
+    Results are memoized, as the same covers appear throughout browse trees.
     :param thumbnail: Thumbnail URI
     :param preferred_resolution: (optional) Preferred thumbnail resolution (if applicable)
     :return: None
     """
-    if thumbnail == THUMBNAIL_EMPTY_IMAGE:
+    if thumbnail == THUMBNAIL_EMPTY_IMAGE or thumbnail.startswith(THUMBNAIL_PROXY_PATH):
         return thumbnail
 
     if "%%" in thumbnail:
@@ -314,24 +781,69 @@ def sanitize_thumbnail_uri(
     return thumbnail
 
 
+def is_thumbnail_host_allowed(host: str) -> bool:
+    """Check whether thumbnails from the host may be served by local thumbnail cache"""
+    return any(
+        host == suffix or host.endswith("." + suffix) for suffix in THUMBNAIL_ALLOWED_HOST_SUFFIXES
+    )
+
+
+def get_thumbnail_signature(host_path: str) -> str:
+    """
+    Sign thumbnail path served by local thumbnail cache (valid until restart).
+    :param host_path: Thumbnail URI without scheme
+    :return: Signature
+    """
+    return hmac.new(
+        _THUMBNAIL_SIGNING_KEY, host_path.encode("utf-8"), hashlib.sha256
+    ).hexdigest()[:32]
+
+
+@functools.lru_cache(maxsize=4096)
+def proxy_thumbnail_uri(thumbnail: str) -> str:
+    """
+    Helper function to rewrite sanitized thumbnail URIs to local thumbnail cache.
+    :param thumbnail: Sanitized thumbnail URI
+    :return: Local thumbnail URI (if host is supported)
+    """
+    scheme, _, host_path = thumbnail.partition("://")
+    if scheme not in ("http", "https") or not host_path:
+        return thumbnail
+
+    if not is_thumbnail_host_allowed(host_path.partition("/")[0]):
+        return thumbnail
+
+    return (
+        THUMBNAIL_PROXY_PATH
+        + "/"
+        + get_thumbnail_signature(host_path)
+        + "/"
+        + quote(host_path, safe="/")
+    )
+
+
 def sanitize_browse_thumbnail(
     browse_object: YandexBrowseMedia,
     default_thumbnail: Optional[str] = None,
     preferred_resolution: PreferredResolutionType = None,
+    proxy: bool = False,
 ) -> None:
     """
     Helper function to apply sanitation to browse objects.
     :param browse_object: Browse object
     :param default_thumbnail: (optional) Default thumbnail to apply on thumbnail absence
     :param preferred_resolution: (optional) Preferred thumbnail resolution (if applicable)
+    :param proxy: (optional) Rewrite thumbnail to local thumbnail cache (default = false)
     :return: None
     """
     if browse_object.thumbnail:
-        browse_object.thumbnail = sanitize_thumbnail_uri(
-            browse_object.thumbnail, preferred_resolution
-        )
+        thumbnail = sanitize_thumbnail_uri(browse_object.thumbnail, preferred_resolution)
     elif default_thumbnail:
-        browse_object.thumbnail = sanitize_thumbnail_uri(default_thumbnail, preferred_resolution)
+        thumbnail = sanitize_thumbnail_uri(default_thumbnail, preferred_resolution)
+    else:
+        return
+
+    browse_object.thumbnail = proxy_thumbnail_uri(thumbnail) if proxy else thumbnail
 
 
 def find_genre_recursive(genre_id: str, genres_list: List[Genre]) -> Optional[Genre]:
@@ -353,17 +865,37 @@ def extract_name_from_function(func: Callable):
     return name
 
 
-def recursive_dict_update(to_dict: dict, from_dict: Mapping):
-    for k, v in from_dict.items():
-        to_dict[k] = (
-            recursive_dict_update(to_dict[k] if k in to_dict else {}, v)
-            if isinstance(v, Mapping)
-            else v
-        )
-    return to_dict
+RE_MEDIA_LINK = re.compile(r"([^()]+)(\([^()]+\))?")
+RE_MEDIA_CONTENT_ID_PAGE = re.compile(r"(.*)@page=(\d+)")
 
 
-RE_MEDIA_LINK = re.compile(r"([^()]+)(\([^()]+\))?")
+def split_media_content_id_page(
+    media_content_id: Optional[MediaContentIDType],
+) -> Tuple[Optional[MediaContentIDType], Optional[int]]:
+    """
+    Split page number from page-aware media content ID.
+    :param media_content_id: Media content ID (e.g. `#12345@page=3`)
+    :return: Media content ID without page suffix, page number (if present)
+    """
+    if media_content_id:
+        match = RE_MEDIA_CONTENT_ID_PAGE.fullmatch(media_content_id)
+        if match:
+            return match.group(1) or None, int(match.group(2))
+    return media_content_id, None
+
+
+def join_media_content_id_page(
+    media_content_id: Optional[MediaContentIDType], page: Optional[int] = None
+) -> Optional[MediaContentIDType]:
+    """
+    Create page-aware media content ID.
+    :param media_content_id: Media content ID
+    :param page: (optional) Page number (first page does not receive suffix)
+    :return: Media content ID
+    """
+    if page is None or page <= 1:
+        return media_content_id
+    return f"{media_content_id or ''}@page={page}"
 
 
 def sanitize_media_link(value: Union[str, Tuple[str, Optional[str]]], validate: bool = True):
@@ -401,11 +933,92 @@ _ListHierarchyType = Mapping[str, Optional[Union[str, _ListItemsHierarchyType]]]
 
 
 class BrowseTree:
+    """
+    Immutable menu hierarchy.
+
+    Levels are compiled once: translation keys of folder titles are resolved upon creation,
+    and browse nodes of levels are built once per language. Trees are never modified, hence
+    copies share compiled levels.
+    """
+
     def __init__(self, hierarchy):
         if isinstance(hierarchy, BrowseTree):
-            hierarchy = deepcopy(hierarchy.hierarchy)
+            self.hierarchy = hierarchy.hierarchy
+            self._title_keys = hierarchy._title_keys
+            self._nodes_by_language = hierarchy._nodes_by_language
+            return
+
+        self.hierarchy: Tuple[Mapping[str, Any], ...] = tuple(
+            MappingProxyType({**level, "items": tuple(level.get("items") or ())})
+            for level in hierarchy
+        )
+        self._title_keys: Tuple[Tuple[str, ...], ...] = tuple(
+            self._resolve_title_keys(level_index, level)
+            for level_index, level in enumerate(self.hierarchy)
+        )
+        self._nodes_by_language: Dict[str, Tuple[CompactBrowseNode, ...]] = {}
+
+    @staticmethod
+    def _resolve_title_keys(level_index: int, level: Mapping[str, Any]) -> Tuple[str, ...]:
+        """Translation keys (in order of preference) for title of a level without explicit one"""
+        if level_index == 0:
+            return ("title",)
+
+        options = level["items"]
+        if options and all(options[0][0] == option[0] for option in options):
+            return "folder_" + options[0][0], "folder"
+
+        return ("folder",)
+
+    def _compile_nodes(self, browser: "YandexMusicBrowser") -> Tuple[CompactBrowseNode, ...]:
+        nodes = []
+        for level_index, level in enumerate(self.hierarchy):
+            title = level.get(CONF_TITLE)
+            if not title:
+                for title_key in self._title_keys[level_index]:
+                    title = browser.get_translation(
+                        ROOT_MEDIA_CONTENT_TYPE, title_key, return_none=True
+                    )
+                    if title is not None:
+                        break
+                else:
+                    title = browser.get_translation(ROOT_MEDIA_CONTENT_TYPE, "folder")
+
+            nodes.append(
+                CompactBrowseNode(
+                    media_class=MEDIA_CLASS_DIRECTORY,
+                    media_content_type=ROOT_MEDIA_CONTENT_TYPE,
+                    media_content_id=str(level_index),
+                    yandex_media_content_type=ROOT_MEDIA_CONTENT_TYPE,
+                    yandex_media_content_id=str(level_index),
+                    title=title,
+                    thumbnail=level.get(CONF_IMAGE),
+                    can_play=False,
+                    can_expand=True,
+                    children_media_class=MEDIA_CLASS_DIRECTORY,
+                )
+            )
 
-        self.hierarchy = hierarchy
+        return tuple(nodes)
+
+    def get_level_node(
+        self, level_index: Union[int, str], browser: "YandexMusicBrowser"
+    ) -> Optional[CompactBrowseNode]:
+        """
+        Get browse node of a level (without children).
+        :param level_index: Level index (folder ID)
+        :param browser: Browser object (provides translations)
+        :return: Browse node (if level exists)
+        """
+        language = browser.language
+        nodes = self._nodes_by_language.get(language)
+        if nodes is None:
+            nodes = self._nodes_by_language[language] = self._compile_nodes(browser)
+
+        try:
+            return nodes[int(level_index)]
+        except (IndexError, ValueError, TypeError):
+            return None
 
     def __str__(self):
         return str(self.hierarchy)
@@ -551,18 +1164,12 @@ class BrowseTree:
         return self._map_to_str(self._hierarchy_to_map(self.hierarchy))
 
 
-class _TranslationsDict(dict):
-    def __missing__(self, key):
-        return "{" + str(key) + "}"
-
-
 class YandexMusicBrowser:
-    _DATA_BY_USER_ID_CACHE = {}
-
     def __init__(
         self,
         authentication: Union[Tuple[str, str], str, Client],
         browser_config: Optional[Mapping[str, Any]] = None,
+        shared_response_cache: Optional[dict] = None,
     ):
         self._cache_ttl = None
         self._timeout = None
@@ -570,9 +1177,32 @@ class YandexMusicBrowser:
         self._thumbnail_resolution = None
         self._show_hidden = None
         self._lyrics = None
+        self._page_size = None
+        self._thumbnail_cache = None
+        self._cache_payloads = None
+        self._debug = None
+        self._api_call_budget = None
+        self._browse_deadline = None
+        self._browse_timeout = None
         self._client = None
-        self._language_strings = None
+        self._language = None
+        self._shared_cache_settings: Optional[Tuple[Any, ...]] = None
         self._response_cache = {}
+        self._shared_response_cache = {} if shared_response_cache is None else shared_response_cache
+        self._search_index = SearchIndex()
+        # Response cache entries already indexed (entries of other accounts included)
+        self._indexed_nodes: "WeakSet[CompactBrowseNode]" = WeakSet()
+        # Deferred nodes scheduled for background expansion
+        self._pending_deferred: Set[Tuple[str, MediaContentIDType]] = set()
+        self._pending_deferred_lock = threading.Lock()
+        # Titles of known playlists: {"<owner_uid>:<kind>": title}
+        self._playlist_titles: TTLCache[str, str] = TTLCache(
+            PLAYLIST_TITLES_SIZE, PLAYLIST_TITLES_TTL, 0
+        )
+        # Media links known to not resolve: {(media_content_type, media_content_id): None}
+        self._negative_cache: TTLCache[Tuple[str, Any], Any] = TTLCache(
+            NEGATIVE_CACHE_SIZE, 0, NEGATIVE_CACHE_TTL
+        )
         self._oldest_cache_entry = time()
 
         if isinstance(authentication, Client):
@@ -584,6 +1214,7 @@ class YandexMusicBrowser:
 
         self._original_client = client
 
+        install_request_hooks(client, lambda: self.timeout)
         extract_user_data(client)
 
         self.browser_config = browser_config
@@ -597,6 +1228,7 @@ class YandexMusicBrowser:
     def client(self, value: Optional[Client]):
         self._client = value
         if value is not None:
+            install_request_hooks(value, lambda: self.timeout)
             extract_user_data(value)
 
         self.clear_cache()
@@ -609,7 +1241,7 @@ class YandexMusicBrowser:
     @lyrics.setter
     def lyrics(self, value: Optional[bool]):
         self._lyrics = value
-        self.clear_cache()
+        self.clear_cache(shared=True)
 
     @property
     def show_hidden(self) -> bool:
@@ -618,7 +1250,60 @@ class YandexMusicBrowser:
     @show_hidden.setter
     def show_hidden(self, value: Optional[bool]):
         self._show_hidden = value
-        self.clear_cache()
+        self.clear_cache(shared=True)
+
+    @property
+    def cache_payloads(self) -> bool:
+        return DEFAULT_CACHE_PAYLOADS if self._cache_payloads is None else self._cache_payloads
+
+    @cache_payloads.setter
+    def cache_payloads(self, value: Optional[bool]):
+        self._cache_payloads = value
+
+    @property
+    def debug(self) -> bool:
+        return DEFAULT_DEBUG if self._debug is None else self._debug
+
+    @debug.setter
+    def debug(self, value: Optional[bool]):
+        self._debug = value
+
+    @property
+    def api_call_budget(self) -> int:
+        return (
+            DEFAULT_API_CALL_BUDGET if self._api_call_budget is None else self._api_call_budget
+        )
+
+    @api_call_budget.setter
+    def api_call_budget(self, value: Optional[int]):
+        self._api_call_budget = value
+
+    @property
+    def browse_deadline(self) -> float:
+        return (
+            DEFAULT_BROWSE_DEADLINE if self._browse_deadline is None else self._browse_deadline
+        )
+
+    @browse_deadline.setter
+    def browse_deadline(self, value: Optional[float]):
+        self._browse_deadline = value
+
+    @property
+    def browse_timeout(self) -> float:
+        return DEFAULT_BROWSE_TIMEOUT if self._browse_timeout is None else self._browse_timeout
+
+    @browse_timeout.setter
+    def browse_timeout(self, value: Optional[float]):
+        self._browse_timeout = value
+
+    @property
+    def page_size(self) -> int:
+        return DEFAULT_PAGE_SIZE if self._page_size is None else self._page_size
+
+    @page_size.setter
+    def page_size(self, value: Optional[int]):
+        self._page_size = value
+        self.clear_cache(shared=True)
 
     @property
     def cache_ttl(self) -> Union[int, float]:
@@ -629,7 +1314,15 @@ class YandexMusicBrowser:
         self._cache_ttl = value
 
     @property
-    def menu_options(self) -> Tuple[str]:
+    def timeout(self) -> Union[int, float]:
+        return DEFAULT_TIMEOUT if self._timeout is None else self._timeout
+
+    @timeout.setter
+    def timeout(self, value: Optional[Union[int, float]]):
+        self._timeout = value
+
+    @property
+    def menu_options(self) -> BrowseTree:
         return DEFAULT_MENU_OPTIONS if self._menu_options is None else self._menu_options
 
     @menu_options.setter
@@ -653,48 +1346,46 @@ class YandexMusicBrowser:
     @thumbnail_resolution.setter
     def thumbnail_resolution(self, value: Optional[Tuple[int, int]]):
         self._thumbnail_resolution = value
-        self.clear_cache()
+        self.clear_cache(shared=True)
 
     @property
-    def language(self) -> str:
-        return self.client.request.headers["Accept-Language"]
+    def thumbnail_cache(self) -> bool:
+        return DEFAULT_THUMBNAIL_CACHE if self._thumbnail_cache is None else self._thumbnail_cache
 
-    @language.setter
-    def language(self, language: Optional[str]) -> None:
-        language = language or DEFAULT_LANGUAGE
-        self.client.request.set_language(language)
-
-        from os.path import dirname, isfile, join, realpath
-        from json import load
-
-        root_translations_key = "media_browser"
-        translations_dir = join(dirname(realpath(__file__)), "translations")
+    @thumbnail_cache.setter
+    def thumbnail_cache(self, value: Optional[bool]):
+        self._thumbnail_cache = value
+        self.clear_cache(shared=True)
 
-        default_translation_file = join(translations_dir, DEFAULT_LANGUAGE + ".json")
-        with open(default_translation_file, "r") as f:
-            self._language_strings = load(f).get(root_translations_key, {})
+    @property
+    def default_language(self) -> str:
+        return DEFAULT_LANGUAGE if self._language is None else self._language
 
-        if language != DEFAULT_LANGUAGE:
-            translation_file = join(translations_dir, language + ".json")
-            if isfile(translation_file):
-                with open(translation_file, "r") as f:
-                    recursive_dict_update(
-                        self._language_strings, load(f).get(root_translations_key, {})
-                    )
+    @property
+    def language(self) -> str:
+        """Language of current browse request (browser's default language outside of one)"""
+        browse_request = get_current_browse_request()
+        if browse_request is not None and browse_request.language is not None:
+            return browse_request.language
+        return self.default_language
 
-        self.clear_cache()
+    @language.setter
+    def language(self, language: Optional[str]) -> None:
+        # Response cache entries are keyed by language, so they remain valid
+        self._language = language
+        self.client.request.set_language(self.default_language)
 
     @property
     def browser_config(self):
         browser_config = {
-            CONF_LANGUAGE: self.language,
+            CONF_LANGUAGE: self.default_language,
         }
 
         if self._cache_ttl is not None:
             browser_config[CONF_CACHE_TTL] = self._cache_ttl
 
         if self._timeout is not None:
-            browser_config[CONF_TIMEOUT] = self._cache_ttl
+            browser_config[CONF_TIMEOUT] = self._timeout
 
         if self._menu_options is not None:
             browser_config[CONF_MENU_OPTIONS] = self._menu_options
@@ -711,11 +1402,33 @@ class YandexMusicBrowser:
         if self._lyrics is not None:
             browser_config[CONF_LYRICS] = self._lyrics
 
+        if self._page_size is not None:
+            browser_config[CONF_PAGE_SIZE] = self._page_size
+
+        if self._thumbnail_cache is not None:
+            browser_config[CONF_THUMBNAIL_CACHE] = self._thumbnail_cache
+
+        if self._cache_payloads is not None:
+            browser_config[CONF_CACHE_PAYLOADS] = self._cache_payloads
+
+        if self._debug is not None:
+            browser_config[CONF_DEBUG] = self._debug
+
+        if self._api_call_budget is not None:
+            browser_config[CONF_API_CALL_BUDGET] = self._api_call_budget
+
+        if self._browse_deadline is not None:
+            browser_config[CONF_BROWSE_DEADLINE] = self._browse_deadline
+
+        if self._browse_timeout is not None:
+            browser_config[CONF_BROWSE_TIMEOUT] = self._browse_timeout
+
         return browser_config
 
     @browser_config.setter
     def browser_config(self, browser_config: Optional[Mapping[str, Any]]):
         browser_config = browser_config or {}
+        previous_shared_cache_settings = self._shared_cache_settings
 
         self.cache_ttl = browser_config.get(CONF_CACHE_TTL)
         self.timeout = browser_config.get(CONF_TIMEOUT)
@@ -723,6 +1436,13 @@ class YandexMusicBrowser:
 
         self._show_hidden = browser_config.get(CONF_SHOW_HIDDEN)
         self._lyrics = browser_config.get(CONF_LYRICS)
+        self._page_size = browser_config.get(CONF_PAGE_SIZE)
+        self._thumbnail_cache = browser_config.get(CONF_THUMBNAIL_CACHE)
+        self._cache_payloads = browser_config.get(CONF_CACHE_PAYLOADS)
+        self._debug = browser_config.get(CONF_DEBUG)
+        self._api_call_budget = browser_config.get(CONF_API_CALL_BUDGET)
+        self._browse_deadline = browser_config.get(CONF_BROWSE_DEADLINE)
+        self._browse_timeout = browser_config.get(CONF_BROWSE_TIMEOUT)
 
         thumbnail_resolution = browser_config.get(CONF_THUMBNAIL_RESOLUTION)
         if thumbnail_resolution is not None:
@@ -731,16 +1451,277 @@ class YandexMusicBrowser:
                 thumbnail_resolution[CONF_HEIGHT],
             )
 
-        # This will clear response cache
         self.language = browser_config.get(CONF_LANGUAGE)
 
+        # Shared cache is filled by browsers of other accounts under the same settings, so it is
+        # kept when the browser is configured initially or when presentation did not change
+        shared_cache_settings = self._get_shared_cache_settings()
+        self.clear_cache(
+            shared=previous_shared_cache_settings is not None
+            and previous_shared_cache_settings != shared_cache_settings
+        )
+        self._shared_cache_settings = shared_cache_settings
+
     # Cache management
     @property
     def response_cache(self) -> dict:
         return self._response_cache
 
-    def clear_cache(self):
+    @property
+    def shared_response_cache(self) -> dict:
+        """Response cache of public data (may be shared with browsers of other accounts)"""
+        return self._shared_response_cache
+
+    @property
+    def negative_cache(self) -> TTLCache:
+        """Media links which recently failed to resolve"""
+        return self._negative_cache
+
+    def get_response_cache(self, media_content_type: str) -> dict:
+        """Get response cache used by registered type processor"""
+        browse_generator = MAP_MEDIA_TYPE_TO_BROWSE.get(media_content_type)
+        if getattr(browse_generator, SHARED_CACHE_ATTRIBUTE, False):
+            return self._shared_response_cache
+        return self._response_cache
+
+    def _get_shared_cache_settings(self) -> Tuple[Any, ...]:
+        """Settings which affect contents of shared response cache entries"""
+        return (
+            self.thumbnail_resolution,
+            self.thumbnail_cache,
+            self.page_size,
+            self.lyrics,
+            self.show_hidden,
+        )
+
+    def clear_cache(self, shared: bool = False):
+        """
+        Clear cached responses of this browser.
+        :param shared: Also clear shared response cache (affects browsers of other accounts)
+        """
         self._response_cache.clear()
+        self._negative_cache.clear()
+        if shared:
+            self._shared_response_cache.clear()
+
+    def get_cache_key(
+        self,
+        media_content_type: str,
+        media_content_id: Optional[MediaContentIDType] = None,
+        language: Optional[str] = None,
+    ) -> Optional[Tuple[Any, ...]]:
+        """
+        Get response cache key under which registered type processor stores its result.
+        :param media_content_type: Registered media content type
+        :param media_content_id: Media content ID
+        :param language: (optional) Browse language (current language by default)
+        :return: Response cache key (if media content type is registered)
+        """
+        browse_generator = MAP_MEDIA_TYPE_TO_BROWSE.get(media_content_type)
+        if browse_generator is None:
+            return None
+
+        if media_content_id is None:
+            media_content_id = getattr(browse_generator, DEFAULT_MEDIA_ID_ATTRIBUTE, None)
+
+        if getattr(browse_generator, LANGUAGE_NEUTRAL_ATTRIBUTE, False):
+            return media_content_type, media_content_id
+
+        return media_content_type, media_content_id, language or self.language
+
+    def get_cached_payload(
+        self,
+        media_content_type: str,
+        media_content_id: Optional[MediaContentIDType],
+        target: Hashable,
+        language: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get serialized form of a cached browse object.
+        :param media_content_type: Registered media content type
+        :param media_content_id: Media content ID
+        :param target: Presentation target the payload was serialized for
+        :param language: (optional) Browse language (current language by default)
+        :return: Serialized browse object (if cached)
+        """
+        cache_entry = self.get_response_cache(media_content_type).get(
+            self.get_cache_key(media_content_type, media_content_id, language)
+        )
+        if cache_entry is None or cache_entry[1] is None or cache_entry[1].payloads is None:
+            return None
+
+        # Presentation may depend on the account (e.g. playlist ownership)
+        return cache_entry[1].payloads.get((self.user_id, target))
+
+    def set_cached_payload(
+        self,
+        media_content_type: str,
+        media_content_id: Optional[MediaContentIDType],
+        target: Hashable,
+        payload: Dict[str, Any],
+        language: Optional[str] = None,
+    ) -> None:
+        """
+        Attach serialized form of a browse object to its response cache entry.
+        Payload is discarded together with the entry once it expires or gets refreshed.
+        :param media_content_type: Registered media content type
+        :param media_content_id: Media content ID
+        :param target: Presentation target the payload was serialized for
+        :param payload: Serialized browse object
+        :param language: (optional) Browse language (current language by default)
+        """
+        cache_entry = self.get_response_cache(media_content_type).get(
+            self.get_cache_key(media_content_type, media_content_id, language)
+        )
+        if cache_entry is None or cache_entry[1] is None:
+            return
+
+        cached_node = cache_entry[1]
+        if cached_node.payloads is None:
+            cached_node.payloads = {}
+        cached_node.payloads[(self.user_id, target)] = payload
+
+    @property
+    def search_index(self) -> SearchIndex:
+        return self._search_index
+
+    def index_cached_node(self, node: CompactBrowseNode) -> None:
+        """
+        Make media within a response cache entry searchable by title, artists and albums.
+        Every entry is indexed once, including entries cached by browsers of other accounts.
+        :param node: Root node of response cache entry
+        """
+        if node in self._indexed_nodes:
+            return
+        self._indexed_nodes.add(node)
+
+        nodes = [node]
+        while nodes:
+            node = nodes.pop()
+            if node.children is not None:
+                nodes.extend(node.children)
+            if node.search_tokens is not None:
+                self._search_index.add(
+                    node.yandex_media_content_type,
+                    node.yandex_media_content_id,
+                    node.search_tokens,
+                    node.without_children(),
+                )
+
+    def remember_playlist_title(self, playlist_id: str, title: str) -> None:
+        """
+        Record title of a browsed playlist.
+        :param playlist_id: Playlist ID (`<owner_uid>:<kind>`)
+        :param title: Playlist title
+        """
+        self._playlist_titles.set(playlist_id, title)
+
+    def get_playlist_title(
+        self, kind: Union[str, int], user_id: Optional[Union[str, int]] = None
+    ) -> Optional[str]:
+        """
+        Get playlist title, preferably from titles of already browsed playlists.
+        :param kind: Playlist kind
+        :param user_id: (optional) Playlist owner ID (current user by default)
+        :return: Playlist title (if playlist exists)
+        """
+        playlist_id = f"{user_id or self.user_id}:{kind}"
+        title = self._playlist_titles.get(playlist_id)
+        if title is not None:
+            return title
+
+        playlist = self.client.users_playlists(kind, user_id, timeout=self.timeout)
+        if playlist is None:
+            return None
+
+        if playlist.title:
+            self.remember_playlist_title(playlist_id, playlist.title)
+        return playlist.title
+
+    @contextmanager
+    def track_browse_request(
+        self, language: Optional[str] = None, limited: bool = True
+    ) -> Iterator[BrowseRequest]:
+        """
+        Account API calls and time spent within enclosed block towards a single browse request.
+        Nested blocks share the outermost request.
+        :param language: (optional) Browse language (browser's default language if not provided)
+        :param limited: (optional) Apply API call budget and time limits (default = true)
+        """
+        browse_request = get_current_browse_request()
+        if browse_request is not None:
+            yield browse_request
+            return
+
+        if limited:
+            browse_request = BrowseRequest(
+                self.api_call_budget, self.browse_deadline, self.browse_timeout, language
+            )
+        else:
+            browse_request = BrowseRequest(language=language)
+        _CURRENT_BROWSE_REQUEST.value = browse_request
+        try:
+            yield browse_request
+        finally:
+            _CURRENT_BROWSE_REQUEST.value = None
+
+    def refresh_browse(
+        self,
+        media_content_type: str,
+        media_content_id: Optional[MediaContentIDType] = None,
+    ) -> BrowseGeneratorReturnType:
+        """
+        Re-run registered type processor, and replace its response cache entry with the result.
+        :param media_content_type: Registered media content type
+        :param media_content_id: (optional) Media content ID
+        :return: Refreshed browse object
+        """
+        browse_generator = MAP_MEDIA_TYPE_TO_BROWSE.get(media_content_type)
+        if browse_generator is None:
+            raise UnknownMediaType(f"Media type not registered: {media_content_type}")
+
+        return browse_generator(self, media_content_id, True, bypass_cache=True)
+
+    def claim_deferred_browse(
+        self, media_links: Iterable[Tuple[str, MediaContentIDType]]
+    ) -> List[Tuple[str, MediaContentIDType]]:
+        """
+        Reserve deferred nodes for background expansion.
+        :param media_links: Registered media content types and IDs (in deferral order)
+        :return: Nodes not yet pending expansion by another browse request
+        """
+        with self._pending_deferred_lock:
+            claimed = [x for x in media_links if x not in self._pending_deferred]
+            self._pending_deferred.update(claimed)
+        return claimed
+
+    def complete_deferred_browse(
+        self,
+        media_links: Iterable[Tuple[str, MediaContentIDType]],
+        language: Optional[str] = None,
+    ) -> None:
+        """
+        Expand nodes left unexpanded by a browse deadline, storing results into response cache.
+        Neither deadline nor API call budget apply to this. Nodes are expanded in the order they
+        were deferred, which follows their listing order (i.e. first visible nodes go first).
+        :param media_links: Nodes claimed with `claim_deferred_browse`
+        :param language: (optional) Language of the browse request that deferred the nodes
+        """
+        with self.track_browse_request(language, limited=False):
+            for media_link in media_links:
+                media_content_type, media_content_id = media_link
+                try:
+                    self.refresh_browse(media_content_type, media_content_id)
+                except BaseException as e:
+                    _LOGGER.debug(
+                        "Could not complete deferred browse of %s / %s: %s",
+                        media_content_type,
+                        media_content_id,
+                        e,
+                    )
+                finally:
+                    with self._pending_deferred_lock:
+                        self._pending_deferred.discard(media_link)
 
     # Data-driven properties
     @property
@@ -752,35 +1733,46 @@ class YandexMusicBrowser:
     ) -> Optional[str]:
         """Get translation for media_type"""
 
-        ts_string = self._language_strings.get(media_type, {}).get(translation)
+        language_strings = get_translation_catalogue().get_language_strings(self.language)
+        template = language_strings.get(media_type, {}).get(translation)
 
-        if ts_string is None:
+        if template is None:
             if return_none:
                 return None
             return f"%{media_type}.{translation}"
-        return ts_string.format_map(_TranslationsDict(kwargs))
+        return template.format(kwargs)
 
     def generate_browse_from_media(
         self,
         media_object: _MediaObjectType,
         fetch_children: FetchChildrenType = True,
         cache_garbage_collection: bool = False,
+        page: Optional[int] = None,
     ) -> BrowseGeneratorReturnType:
-        processor = MAP_MEDIA_OBJECT_TO_BROWSE.get(type(media_object))
-
-        if processor is None:
-            for processor_cls, processor_fn in MAP_MEDIA_OBJECT_TO_BROWSE.items():
-                if isinstance(media_object, processor_cls):
-                    processor = processor_fn
-                    break
+        processor = get_media_object_processor(type(media_object))
 
         if processor is None:
             return None
 
-        browse_object = processor(self, media_object, fetch_children)
-
-        if browse_object is not None:
-            sanitize_browse_thumbnail(browse_object, preferred_resolution=self.thumbnail_resolution)
+        browse_request = get_current_browse_request()
+        deadline_truncations = 0
+        if browse_request is not None:
+            deadline_truncations = browse_request.deadline_truncations
+            fetch_children = browse_request.limit_expansion(fetch_children)
+
+        browse_object = processor(self, media_object, fetch_children, page=page)
+
+        if (
+            browse_request is not None
+            and browse_request.deadline_truncations > deadline_truncations
+            and isinstance(browse_object, YandexBrowseMedia)
+            and browse_object.can_expand
+            and browse_object.yandex_media_content_type in MAP_MEDIA_TYPE_TO_BROWSE
+        ):
+            browse_request.defer(
+                browse_object.yandex_media_content_type,
+                browse_object.yandex_media_content_id,
+            )
 
         if cache_garbage_collection:
             _LOGGER.debug("Running garbage collection")
@@ -791,17 +1783,22 @@ class YandexMusicBrowser:
                 _LOGGER.debug("Oldest cache entry is: %s", self._oldest_cache_entry)
 
                 oldest_cache = time()
-                remove_keys = []
-                for cache_key, (created_at, _) in self._response_cache.items():
-                    if now - created_at >= cache_ttl:
-                        remove_keys.append(cache_key)
-                    elif created_at < oldest_cache:
-                        oldest_cache = created_at
+                removed_count = 0
+                for response_cache in (self._response_cache, self._shared_response_cache):
+                    remove_keys = []
+                    # Shared cache may be populated concurrently by other browsers
+                    for cache_key, (created_at, _) in list(response_cache.items()):
+                        if now - created_at >= cache_ttl:
+                            remove_keys.append(cache_key)
+                        elif created_at < oldest_cache:
+                            oldest_cache = created_at
 
-                for cache_key in remove_keys:
-                    del self._response_cache[cache_key]
+                    for cache_key in remove_keys:
+                        response_cache.pop(cache_key, None)
 
-                _LOGGER.debug("Removed %d items from cache", len(remove_keys))
+                    removed_count += len(remove_keys)
+
+                _LOGGER.debug("Removed %d items from cache", removed_count)
 
                 self._oldest_cache_entry = oldest_cache
             else:
@@ -830,6 +1827,59 @@ class YandexMusicBrowser:
 
         return browse_objects
 
+    def slice_page(
+        self,
+        media_objects: Sequence[_MediaObjectType],
+        page: Optional[int] = None,
+    ) -> Tuple[Sequence[_MediaObjectType], int, int]:
+        """
+        Slice media objects according to configured page size.
+        :param media_objects: Sequence of media objects
+        :param page: (optional) Requested page number (first page by default)
+        :return: Page slice, current page number, total number of pages
+        """
+        page_size = self.page_size
+        if page_size <= 0:
+            return media_objects, 1, 1
+
+        pages = max(1, -(-len(media_objects) // page_size))
+        page = min(max(1, page or 1), pages)
+        start = (page - 1) * page_size
+
+        return media_objects[start : start + page_size], page, pages
+
+    def get_page_title(self, title: str, page: int, pages: int) -> str:
+        """Append page information to directory title"""
+        if page <= 1:
+            return title
+        return self.get_translation("pagination", "page", title=title, page=page, pages=pages)
+
+    def generate_next_page_browse(
+        self,
+        media_content_type: str,
+        media_content_id: Optional[MediaContentIDType],
+        page: int,
+        pages: int,
+    ) -> "YandexBrowseMedia":
+        """
+        Create expandable node which points to the next page of the directory.
+        :param media_content_type: Media content type of the directory
+        :param media_content_id: Media content ID of the directory (without page suffix)
+        :param page: Next page number
+        :param pages: Total number of pages
+        :return: Browse object
+        """
+        return YandexBrowseMedia(
+            title=self.get_translation("pagination", "next_page", page=page, pages=pages),
+            media_class=MEDIA_CLASS_DIRECTORY,
+            media_content_type=media_content_type,
+            media_content_id=join_media_content_id_page(media_content_id, page),
+            can_play=False,
+            can_expand=True,
+            children=None,
+            thumbnail=THUMBNAIL_EMPTY_IMAGE,
+        )
+
     def get_playlists_from_ids(
         self,
         playlist_ids: List[Union[Dict[str, Union[int, str]], PlaylistId]],
@@ -849,6 +1899,9 @@ class YandexMusicBrowser:
 
 
 MEDIA_CONTENT_ID_VALIDATOR_ATTRIBUTE = "__media_content_id_validator"
+DEFAULT_MEDIA_ID_ATTRIBUTE = "_default_media_id"
+SHARED_CACHE_ATTRIBUTE = "_shared_cache"
+LANGUAGE_NEUTRAL_ATTRIBUTE = "_language_neutral"
 
 
 def register_type_browse_processor(
@@ -857,6 +1910,9 @@ def register_type_browse_processor(
     force_media_content_type: bool = True,
     default_media_id: Optional[str] = None,
     cache_on_demand: bool = True,
+    shared_cache: bool = False,
+    language_neutral: bool = False,
+    negative_cache: bool = False,
 ) -> Callable[[BrowseGeneratorType], BrowseGeneratorType]:
     """
     Decorator that registers function as a type resolver.
@@ -868,6 +1924,14 @@ def register_type_browse_processor(
     :param force_media_content_type: Force provided media content type onto root objects
     :param default_media_id: Default media ID when empty media ID is encountered
     :param cache_on_demand: Cache browse object when demanded (default = True)
+    :param shared_cache: Browse object holds public data, cache it within response cache
+                         shared between accounts (default = False)
+    :param language_neutral: Cache browse object once for all languages, rendering it (and
+                             requesting its data) in browser's default language regardless
+                             of browse request language (default = False)
+    :param negative_cache: Remember media IDs that failed to resolve for a short time, and
+                           answer repeated requests for them without calling the API
+                           (default = False)
     :return: Decorator
     """
     if isinstance(media_id_pattern, str):
@@ -897,16 +1961,46 @@ def register_type_browse_processor(
             browser: YandexMusicBrowser,
             media_content_id: MediaContentIDType = None,
             fetch_children: FetchChildrenType = True,
+            bypass_cache: bool = False,
         ) -> BrowseGeneratorReturnType:
             if media_content_id is None:
                 media_content_id = default_media_id
 
+            negative_key = None
+            if negative_cache and isinstance(media_content_id, Hashable):
+                negative_key = (_media_content_type, media_content_id)
+                if not bypass_cache and negative_key in browser.negative_cache:
+                    BROWSE_TIMINGS.mark_cached()
+                    return None
+
+            browse_request = get_current_browse_request()
+            truncations = 0
+            if browse_request is not None:
+                deadline_truncations = browse_request.deadline_truncations
+                fetch_children = browse_request.limit_expansion(fetch_children)
+                truncations = browse_request.truncations
+                if browse_request.deadline_truncations > deadline_truncations:
+                    browse_request.defer(_media_content_type, media_content_id)
+
+            response_cache = (
+                browser.shared_response_cache if shared_cache else browser.response_cache
+            )
             cache_key = None
             if cache_on_demand and browser.cache_ttl > 0 and bool(fetch_children):
                 if isinstance(media_content_id, Hashable):
-                    cache_key = (_media_content_type, media_content_id)
-                    if cache_key in browser.response_cache:
-                        return browser.response_cache[cache_key][1]
+                    cache_key = (
+                        (_media_content_type, media_content_id)
+                        if language_neutral
+                        else (_media_content_type, media_content_id, browser.language)
+                    )
+                    cache_entry = None if bypass_cache else response_cache.get(cache_key)
+                    if cache_entry is not None:
+                        BROWSE_TIMINGS.mark_cached()
+                        cached_node = cache_entry[1]
+                        if cached_node is None:
+                            return None
+                        browser.index_cached_node(cached_node)
+                        return cached_node.to_browse_media()
                 else:
                     _LOGGER.debug(
                         "%s not of hashable type (%s)", media_content_id, type(media_content_type)
@@ -914,10 +2008,21 @@ def register_type_browse_processor(
 
             # this could be without hasattr(...) and getattr(...),
             # but what if something removes the attribute at runtime...
-            if not getattr(func, MEDIA_CONTENT_ID_VALIDATOR_ATTRIBUTE)(media_content_id):
+            if not getattr(func, MEDIA_CONTENT_ID_VALIDATOR_ATTRIBUTE)(
+                split_media_content_id_page(media_content_id)[0]
+            ):
                 return None
 
-            browse_object = func(browser, media_content_id, fetch_children)
+            if language_neutral and browse_request is not None:
+                # Yandex localizes names by Accept-Language, so the entry shared between
+                # languages is fetched and rendered in the same language for all of them
+                request_language, browse_request.language = browse_request.language, None
+                try:
+                    browse_object = func(browser, media_content_id, fetch_children)
+                finally:
+                    browse_request.language = request_language
+            else:
+                browse_object = func(browser, media_content_id, fetch_children)
 
             if force_media_content_type:
                 if isinstance(browse_object, BrowseMedia):
@@ -925,12 +2030,36 @@ def register_type_browse_processor(
                 if isinstance(browse_object, YandexBrowseMedia):
                     browse_object.yandex_media_content_type = _media_content_type
 
+            if browse_request is not None and browse_request.truncations > truncations:
+                # Children were left unexpanded due to exhausted API call budget or passed deadline
+                cache_key = None
+
+            if negative_key is not None:
+                if browse_object is None:
+                    browser.negative_cache.set(negative_key, None)
+                    # Negative result expires sooner than response cache entries would
+                    cache_key = None
+                else:
+                    browser.negative_cache.pop(negative_key)
+
             if cache_key is not None:
-                browser.response_cache[cache_key] = (time(), browse_object)
+                # Entry roots are kept private, as serialized payloads get attached to them
+                cached_node = (
+                    None
+                    if browse_object is None
+                    else CompactBrowseNode.from_browse_media(browse_object, intern=False)
+                )
+                # Single assignment replaces the entry atomically for concurrent readers
+                response_cache[cache_key] = (time(), cached_node)
+                if cached_node is not None:
+                    browser.index_cached_node(cached_node)
 
             return browse_object
 
         wrapped_function.__name__ = func.__name__
+        setattr(wrapped_function, DEFAULT_MEDIA_ID_ATTRIBUTE, default_media_id)
+        setattr(wrapped_function, SHARED_CACHE_ATTRIBUTE, shared_cache)
+        setattr(wrapped_function, LANGUAGE_NEUTRAL_ATTRIBUTE, language_neutral)
 
         if isinstance(media_content_type, str):
             _media_content_type = media_content_type
@@ -942,6 +2071,8 @@ def register_type_browse_processor(
         if "(" in _media_content_type or ")" in _media_content_type:
             raise ValueError("media_content_type contains invalid characters")
 
+        wrapped_function = timed_processor(_media_content_type)(wrapped_function)
+
         MAP_MEDIA_TYPE_TO_BROWSE[_media_content_type] = wrapped_function
 
         return wrapped_function
@@ -956,6 +2087,8 @@ def adapt_media_id_to_user_id(func):
         media_content_id: MediaContentIDType = None,
         fetch_children: FetchChildrenType = True,
     ) -> BrowseGeneratorReturnType:
+        media_content_id, page = split_media_content_id_page(media_content_id)
+
         if media_content_id is None:
             user_id = browser.user_id
         else:
@@ -966,7 +2099,7 @@ def adapt_media_id_to_user_id(func):
 
             user_id = user_data["uid"]
 
-        return func(browser, f"#{user_id}", fetch_children)
+        return func(browser, join_media_content_id_page(f"#{user_id}", page), fetch_children)
 
     setattr(wrapped_function, "_media_id_to_user_id", True)
 
@@ -981,6 +2114,8 @@ def adapt_directory_to_browse_processor(
     can_play: bool = False,
     can_expand: bool = True,
     translation_key: Optional[str] = None,
+    paginate: bool = False,
+    hydrate: Optional[HydrateChildrenType] = None,
 ) -> Callable[[DirectoryChildrenType], BrowseGeneratorType]:
     """
     Decorator that creates generators for directories.
@@ -989,6 +2124,8 @@ def adapt_directory_to_browse_processor(
     :param can_play: (optional) Whether directory can be used for playback (default = true)
     :param can_expand: (optional) Whether directory can be expanded (default = true)
     :param translation_key: Translation key to fetch main translations from
+    :param paginate: (optional) Split children into pages (default = false)
+    :param hydrate: (optional) Function to resolve full media objects for a page of children
     :return: Decorator
     """
 
@@ -998,9 +2135,8 @@ def adapt_directory_to_browse_processor(
         :param func: Function that fetches directory's children
         :return: Wrapped function
         """
-        _translation_key = (
-            extract_name_from_function(func) if translation_key is None else translation_key
-        )
+        _media_content_type = extract_name_from_function(func)
+        _translation_key = _media_content_type if translation_key is None else translation_key
 
         @functools.wraps(func)
         def wrapped_function(
@@ -1008,6 +2144,12 @@ def adapt_directory_to_browse_processor(
             media_content_id: Optional[MediaContentIDType] = None,
             fetch_children: FetchChildrenType = True,
         ) -> BrowseGeneratorReturnType:
+            media_content_id, page = split_media_content_id_page(media_content_id)
+            pages = 1
+
+            if not paginate:
+                page = None
+
             if media_content_id is None:
                 media_content_id = MEDIA_CLASS_DIRECTORY
 
@@ -1016,15 +2158,32 @@ def adapt_directory_to_browse_processor(
                 child_media_objects = func(browser, media_content_id)
 
                 if child_media_objects:
+                    if paginate:
+                        child_media_objects, page, pages = browser.slice_page(
+                            list(child_media_objects), page
+                        )
+
+                    if hydrate is not None:
+                        child_media_objects = hydrate(browser, child_media_objects)
+
                     children = browser.generate_browse_list_from_media_list(
                         child_media_objects, fetch_children=fetch_children
                     )
+
+                    if page is not None and page < pages:
+                        children.append(
+                            browser.generate_next_page_browse(
+                                _media_content_type, media_content_id, page + 1, pages
+                            )
+                        )
                 else:
                     children = []
             else:
                 children = None
 
             title = browser.get_translation(_translation_key, "title")
+            if page is not None:
+                title = browser.get_page_title(title, page, pages)
 
             return YandexBrowseMedia(
                 media_class=MEDIA_CLASS_DIRECTORY,
@@ -1064,11 +2223,12 @@ def adapt_type_to_browse_processor() -> Callable[[MediaProcessorType], BrowseGen
             media_content_id: MediaContentIDType = None,
             fetch_children: FetchChildrenType = True,
         ) -> BrowseGeneratorReturnType:
+            media_content_id, page = split_media_content_id_page(media_content_id)
             media_object = func(browser, media_content_id)
 
             if media_object is not None:
                 return browser.generate_browse_from_media(
-                    media_object, fetch_children=fetch_children
+                    media_object, fetch_children=fetch_children, page=page
                 )
 
         wrapped_function.__name__ = func.__name__
@@ -1081,11 +2241,13 @@ def adapt_type_to_browse_processor() -> Callable[[MediaProcessorType], BrowseGen
 def adapt_media_browse_processor(
     media_object_cls: Type[_MediaObjectType],
     thumbnail: Optional[str] = None,
+    paginate: bool = False,
 ) -> Callable[[BrowseGeneratorType], BrowseGeneratorType]:
     """
     Register media to browse converter.
     :param media_object_cls: (required) Media object class
     :param thumbnail:
+    :param paginate: (optional) Pass requested page number to the converter (default = false)
     :return:
     """
 
@@ -1095,22 +2257,29 @@ def adapt_media_browse_processor(
             browser: YandexMusicBrowser,
             media_object: _MediaObjectType,
             fetch_children: FetchChildrenType = True,
+            page: Optional[int] = None,
         ) -> BrowseGeneratorReturnType:
             # @TODO: post-processing
-            browse_object = func(browser, media_object, fetch_children)
+            if paginate:
+                browse_object = func(browser, media_object, fetch_children, page)
+            else:
+                browse_object = func(browser, media_object, fetch_children)
 
             if browse_object:
                 sanitize_browse_thumbnail(
                     browse_object,
                     default_thumbnail=thumbnail,
                     preferred_resolution=browser.thumbnail_resolution,
+                    proxy=browser.thumbnail_cache,
                 )
 
             return browse_object
 
         wrapped_function.__name__ = func.__name__
+        wrapped_function = timed_processor(func.__name__)(wrapped_function)
 
         MAP_MEDIA_OBJECT_TO_BROWSE[media_object_cls] = wrapped_function
+        _MEDIA_OBJECT_PROCESSOR_CACHE.clear()
 
         return wrapped_function
 
@@ -1168,53 +2337,40 @@ def user_processor(
 def library_processor(
     browser: "YandexMusicBrowser", media_id: Union[int, str], fetch_children: FetchChildrenType
 ) -> BrowseGeneratorReturnType:
-    level_index = int(media_id)
     menu_options = browser.menu_options
 
-    try:
-        level_definition = menu_options[level_index]
-    except (IndexError, ValueError, TypeError):
+    level_node = menu_options.get_level_node(media_id, browser)
+    if level_node is None:
         _LOGGER.debug("Invalid folder ID requested: %s (type: %s)", media_id, type(media_id))
         return None
 
-    try:
-        options = level_definition[CONF_ITEMS]
-    except (KeyError, ValueError, TypeError):
-        return None
+    browse_object = level_node.to_browse_media()
 
     if fetch_children:
-        fetch_children = int(fetch_children) - 1
-        children = browser.generate_browse_list_from_media_list(
-            options, fetch_children=fetch_children
-        )
-
-    else:
-        children = None
+        # Same depth as children generated by `generate_browse_list_from_media_list`
+        fetch_children = max(int(fetch_children) - 2, 0)
+        children = []
+        for media_link in menu_options[media_id][CONF_ITEMS]:
+            if media_link[0] == ROOT_MEDIA_CONTENT_TYPE and not fetch_children:
+                # Nested folders are served straight from the compiled tree
+                child_node = menu_options.get_level_node(media_link[1], browser)
+                if child_node is not None:
+                    child = child_node.to_browse_media()
+                    sanitize_browse_thumbnail(
+                        child,
+                        preferred_resolution=browser.thumbnail_resolution,
+                        proxy=browser.thumbnail_cache,
+                    )
+                    children.append(child)
+                continue
 
-    title = None
-    if level_definition[CONF_TITLE]:
-        title = level_definition[CONF_TITLE]
-    elif level_index == 0:
-        title = browser.get_translation(ROOT_MEDIA_CONTENT_TYPE, "title")
-    elif len(options) > 0 and all(map(lambda x: options[0][0] == x[0], options)):
-        title = browser.get_translation(
-            ROOT_MEDIA_CONTENT_TYPE, "folder_" + options[0][0], return_none=True
-        )
+            child = browser.generate_browse_from_media(media_link, fetch_children=fetch_children)
+            if child is not None:
+                children.append(child)
 
-    if title is None:
-        title = browser.get_translation(ROOT_MEDIA_CONTENT_TYPE, "folder")
+        browse_object.children = children
 
-    return YandexBrowseMedia(
-        media_class=MEDIA_CLASS_DIRECTORY,
-        media_content_type=ROOT_MEDIA_CONTENT_TYPE,
-        media_content_id=str(media_id),
-        title=title,
-        can_play=False,
-        can_expand=True,
-        children=children,
-        children_media_class=MEDIA_CLASS_DIRECTORY,
-        thumbnail=level_definition[CONF_IMAGE],
-    )
+    return browse_object
 
 
 @register_type_browse_processor(MEDIA_TYPE_RADIO)
@@ -1255,6 +2411,8 @@ def generate_radio_object(
         return None
 
     thumbnail = sanitize_thumbnail_uri(thumbnail, browser.thumbnail_resolution)
+    if browser.thumbnail_cache:
+        thumbnail = proxy_thumbnail_uri(thumbnail)
 
     return YandexBrowseMedia(
         title=browser.get_translation(MEDIA_TYPE_RADIO, "prefix", title=suffix),
@@ -1336,20 +2494,121 @@ def user_liked_albums_processor(
         return [x.album for x in likes]
 
 
+def get_media_object_processor(
+    media_object_cls: Type[_MediaObjectType],
+) -> Optional[BrowseGeneratorType]:
+    """
+    Find processor registered for media object class, or for its closest base class.
+    :param media_object_cls: Media object class
+    :return: Processor (if registered)
+    """
+    try:
+        return _MEDIA_OBJECT_PROCESSOR_CACHE[media_object_cls]
+    except KeyError:
+        pass
+
+    processor = None
+    for base_cls in media_object_cls.__mro__:
+        processor = MAP_MEDIA_OBJECT_TO_BROWSE.get(base_cls)
+        if processor is not None:
+            break
+
+    _MEDIA_OBJECT_PROCESSOR_CACHE[media_object_cls] = processor
+    return processor
+
+
+def hydrate_tracks(
+    browser: "YandexMusicBrowser", media_objects: Sequence[Union[Track, TrackShort]]
+) -> List[Track]:
+    """
+    Resolve full tracks for short track objects using a single batch request.
+    :param browser: Browser object
+    :param media_objects: Tracks and/or short tracks
+    :return: List[Track]
+    """
+    missing_ids = [
+        media_object.track_id
+        for media_object in media_objects
+        if isinstance(media_object, TrackShort) and media_object.track is None
+    ]
+
+    fetched_tracks = {}
+    if missing_ids:
+        for track in browser.client.tracks(track_ids=missing_ids, timeout=browser.timeout) or []:
+            fetched_tracks[str(track.id)] = track
+
+    tracks = []
+    for media_object in media_objects:
+        if isinstance(media_object, TrackShort):
+            media_object = media_object.track or fetched_tracks.get(str(media_object.id))
+        if media_object is not None:
+            tracks.append(media_object)
+
+    return tracks
+
+
+@register_type_browse_processor(media_id_pattern=True, cache_on_demand=False)
+def search_processor(
+    browser: "YandexMusicBrowser", media_content_id: str, fetch_children: FetchChildrenType
+) -> YandexBrowseMedia:
+    """
+    Search media already fetched by other processors, and fall back
+    to Yandex Music search only when nothing is found locally.
+    """
+    if fetch_children:
+        fetch_children = int(fetch_children) - 1
+
+        children = [
+            node.to_browse_media()
+            for node in browser.search_index.search(media_content_id, DEFAULT_SEARCH_RESULTS)
+        ]
+
+        if not children:
+            search_result = browser.client.search(media_content_id, timeout=browser.timeout)
+            if search_result:
+                for search_result_list in (
+                    search_result.artists,
+                    search_result.albums,
+                    search_result.playlists,
+                    search_result.tracks,
+                ):
+                    if search_result_list and search_result_list.results:
+                        children.extend(
+                            browser.generate_browse_list_from_media_list(
+                                search_result_list.results, fetch_children=fetch_children
+                            )
+                        )
+    else:
+        children = None
+
+    return YandexBrowseMedia(
+        media_class=MEDIA_CLASS_DIRECTORY,
+        media_content_id=media_content_id,
+        media_content_type="search",
+        title=browser.get_translation("search", "title", query=media_content_id),
+        can_play=False,
+        can_expand=True,
+        children=children,
+    )
+
+
 @register_type_browse_processor()
 @adapt_media_id_to_user_id
-@adapt_directory_to_browse_processor(children_media_class=MEDIA_CLASS_TRACK)
+@adapt_directory_to_browse_processor(
+    children_media_class=MEDIA_CLASS_TRACK,
+    paginate=True,
+    hydrate=hydrate_tracks,
+)
 def user_liked_tracks_processor(
     browser: "YandexMusicBrowser", media_id: str
-) -> Optional[List[Track]]:
+) -> Optional[List[TrackShort]]:
     track_list = browser.client.users_likes_tracks(user_id=media_id[1:], timeout=browser.timeout)
 
     if track_list:
-        # @TODO: this method doesn't support timeout, yet...
-        return track_list.fetch_tracks()
+        return track_list.tracks
 
 
-@register_type_browse_processor()
+@register_type_browse_processor(shared_cache=True)
 @adapt_directory_to_browse_processor(children_media_class=MEDIA_CLASS_GENRE)
 def genres_processor(browser: "YandexMusicBrowser", media_id: str):
     items = browser.client.genres(timeout=browser.timeout)
@@ -1365,7 +2624,7 @@ def genres_processor(browser: "YandexMusicBrowser", media_id: str):
     return items
 
 
-@register_type_browse_processor()
+@register_type_browse_processor(shared_cache=True)
 @adapt_directory_to_browse_processor(children_media_class=MEDIA_CLASS_ALBUM)
 def new_releases_processor(browser: "YandexMusicBrowser", media_id: str) -> Optional[List[Album]]:
     landing_list = browser.client.new_releases(timeout=browser.timeout)
@@ -1375,7 +2634,7 @@ def new_releases_processor(browser: "YandexMusicBrowser", media_id: str) -> Opti
             return browser.client.albums(album_ids=album_ids, timeout=browser.timeout)
 
 
-@register_type_browse_processor()
+@register_type_browse_processor(shared_cache=True)
 @adapt_directory_to_browse_processor(children_media_class=MEDIA_CLASS_PLAYLIST)
 def new_playlists_processor(
     browser: "YandexMusicBrowser", media_id: str
@@ -1517,26 +2776,49 @@ def album_media_processor(
     )
 
 
-@adapt_media_browse_processor(Artist)
+@adapt_media_browse_processor(Artist, paginate=True)
 def artist_media_processor(
-    browser: "YandexMusicBrowser", media_object: Artist, fetch_children: FetchChildrenType
+    browser: "YandexMusicBrowser",
+    media_object: Artist,
+    fetch_children: FetchChildrenType,
+    page: Optional[int] = None,
 ) -> YandexBrowseMedia:
+    page, pages = page or 1, 1
+
     if fetch_children:
         fetch_children = int(fetch_children) - 1
-        artist_albums = media_object.get_albums(timeout=browser.timeout)
+        page_size = browser.page_size
+
+        if page_size > 0:
+            # Artist albums are paginated by the API itself
+            artist_albums = media_object.get_albums(
+                page=page - 1, page_size=page_size, timeout=browser.timeout
+            )
+        else:
+            artist_albums = media_object.get_albums(timeout=browser.timeout)
 
         if artist_albums and artist_albums.albums:
             children = browser.generate_browse_list_from_media_list(
                 artist_albums.albums,
                 fetch_children=fetch_children,
             )
+
+            pager = artist_albums.pager
+            if page_size > 0 and pager and pager.total:
+                pages = max(1, -(-pager.total // page_size))
+                if page < pages:
+                    children.append(
+                        browser.generate_next_page_browse(
+                            MEDIA_TYPE_ARTIST, str(media_object.id), page + 1, pages
+                        )
+                    )
         else:
             children = []
     else:
         children = None
 
     return YandexBrowseMedia(
-        title=media_object.name,
+        title=browser.get_page_title(media_object.name, page, pages),
         media_content_type=MEDIA_TYPE_ARTIST,
         media_class=MEDIA_CLASS_ARTIST,
         thumbnail=media_object.cover.uri,
@@ -1548,26 +2830,46 @@ def artist_media_processor(
     )
 
 
-@adapt_media_browse_processor(Playlist)
+@adapt_media_browse_processor(Playlist, paginate=True)
 def playlist_media_processor(
-    browser: "YandexMusicBrowser", media_object: Playlist, fetch_children: FetchChildrenType
+    browser: "YandexMusicBrowser",
+    media_object: Playlist,
+    fetch_children: FetchChildrenType,
+    page: Optional[int] = None,
 ) -> YandexBrowseMedia:
+    media_content_id = f"{media_object.owner.uid}:{media_object.kind}"
+    page, pages = page or 1, 1
+
+    if media_object.title:
+        # Titles are recorded as playlists are listed, saving lookups when playing them by kind
+        browser.remember_playlist_title(media_content_id, media_object.title)
+
     if fetch_children:
         fetch_children = int(fetch_children) - 1
-        playlist_tracks = media_object.fetch_tracks(timeout=browser.timeout)
+        playlist_tracks = media_object.tracks or media_object.fetch_tracks(
+            timeout=browser.timeout
+        )
+        playlist_tracks, page, pages = browser.slice_page(playlist_tracks or [], page)
         children = browser.generate_browse_list_from_media_list(
-            playlist_tracks,
+            hydrate_tracks(browser, playlist_tracks),
             fetch_children=fetch_children,
         )
+
+        if page < pages:
+            children.append(
+                browser.generate_next_page_browse(
+                    MEDIA_TYPE_PLAYLIST, media_content_id, page + 1, pages
+                )
+            )
     else:
         children = None
 
     return YandexBrowseMedia(
-        title=media_object.title,
+        title=browser.get_page_title(media_object.title, page, pages),
         media_content_type=MEDIA_TYPE_PLAYLIST,
         media_class=MEDIA_CLASS_PLAYLIST,
         thumbnail=media_object.animated_cover_uri or media_object.cover.uri,
-        media_content_id=f"{media_object.owner.uid}:{media_object.kind}",
+        media_content_id=media_content_id,
         can_play=True,
         can_expand=True,
         children_media_class=MEDIA_CLASS_TRACK,
@@ -1709,7 +3011,13 @@ def genre_media_processor(
     )
 
 
-@register_type_browse_processor(MEDIA_TYPE_ALBUM, media_id_pattern=r"\d+")
+@register_type_browse_processor(
+    MEDIA_TYPE_ALBUM,
+    media_id_pattern=r"\d+",
+    shared_cache=True,
+    language_neutral=True,
+    negative_cache=True,
+)
 @adapt_type_to_browse_processor()
 def album_type_processor(
     browser: "YandexMusicBrowser", media_content_id: MediaContentIDType
@@ -1719,7 +3027,7 @@ def album_type_processor(
         return albums[0]
 
 
-@register_type_browse_processor(MEDIA_TYPE_ARTIST, media_id_pattern=r"\d+")
+@register_type_browse_processor(MEDIA_TYPE_ARTIST, media_id_pattern=r"\d+", shared_cache=True)
 @adapt_type_to_browse_processor()
 def artist_type_processor(
     browser: "YandexMusicBrowser", media_content_id: MediaContentIDType
@@ -1729,7 +3037,9 @@ def artist_type_processor(
         return artists[0]
 
 
-@register_type_browse_processor(MEDIA_TYPE_PLAYLIST, media_id_pattern=r"(\d+:)?\d+")
+@register_type_browse_processor(
+    MEDIA_TYPE_PLAYLIST, media_id_pattern=r"(\d+:)?\d+", negative_cache=True
+)
 @adapt_type_to_browse_processor()
 def playlist_type_processor(
     browser: "YandexMusicBrowser", media_content_id: MediaContentIDType
@@ -1743,7 +3053,13 @@ def playlist_type_processor(
     )
 
 
-@register_type_browse_processor(MEDIA_TYPE_TRACK, media_id_pattern=r"\d+")
+@register_type_browse_processor(
+    MEDIA_TYPE_TRACK,
+    media_id_pattern=r"\d+",
+    shared_cache=True,
+    language_neutral=True,
+    negative_cache=True,
+)
 @adapt_type_to_browse_processor()
 def track_type_processor(
     browser: "YandexMusicBrowser", media_content_id: MediaContentIDType
@@ -1753,7 +3069,7 @@ def track_type_processor(
         return tracks[0]
 
 
-@register_type_browse_processor(MEDIA_TYPE_MIX_TAG)
+@register_type_browse_processor(MEDIA_TYPE_MIX_TAG, shared_cache=True)
 @adapt_type_to_browse_processor()
 def mix_tag_type_processor(
     browser: "YandexMusicBrowser", media_content_id: MediaContentIDType
@@ -1761,7 +3077,9 @@ def mix_tag_type_processor(
     return browser.client.tags(tag_id=media_content_id, timeout=browser.timeout)
 
 
-@register_type_browse_processor(MEDIA_TYPE_GENRE, media_id_pattern=r".+")
+@register_type_browse_processor(
+    MEDIA_TYPE_GENRE, media_id_pattern=r".+", shared_cache=True, negative_cache=True
+)
 @adapt_type_to_browse_processor()
 def genre_type_processor(
     browser: "YandexMusicBrowser", media_content_id: MediaContentIDType
@@ -1,38 +1,185 @@
 import logging
-from typing import Optional, Union
+from typing import Callable, Hashable, Optional, Union
 
-from homeassistant.components.media_player import BrowseError
+from homeassistant.components.media_player import BrowseError, BrowseMedia
 from homeassistant.helpers.typing import HomeAssistantType
 
-from custom_components.yandex_music_browser import ROOT_MEDIA_CONTENT_TYPE, YandexBrowseMedia
-from custom_components.yandex_music_browser.default import async_get_music_browser
+from custom_components.yandex_music_browser import (
+    ROOT_MEDIA_CONTENT_TYPE,
+    YandexBrowseMedia,
+    YandexMusicBrowser,
+)
+from custom_components.yandex_music_browser.catalogue import get_loaded_translation_catalogue
+from custom_components.yandex_music_browser.default import (
+    async_get_music_browser,
+    async_schedule_prefetch,
+)
+from custom_components.yandex_music_browser.timings import BROWSE_TIMINGS, describe_media
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _get_request_language() -> Optional[str]:
+    """
+    Get language preferred by the frontend user making current HTTP / websocket request.
+    :return: Supported language code (if determined)
+    """
+    try:
+        from homeassistant.helpers.http import current_request
+    except ImportError:
+        return None
+
+    request = current_request.get()
+    if request is None:
+        return None
+
+    # Catalogue is loaded during entry setup, as loading it involves file I/O
+    catalogue = get_loaded_translation_catalogue()
+    if catalogue is None:
+        return None
+
+    supported_languages = catalogue.languages
+    for language_range in request.headers.get("Accept-Language", "").split(","):
+        language = language_range.partition(";")[0].strip().partition("-")[0].lower()
+        if language in supported_languages:
+            return language
+
+    return None
+
+
 async def _patch_root_async_browse_media(
     self: Union["MediaPlayerEntity", HomeAssistantType],
     media_content_type: Optional[str] = None,
     media_content_id: Optional[str] = None,
     fetch_children: bool = True,
+    language: Optional[str] = None,
+    music_browser: Optional[YandexMusicBrowser] = None,
 ) -> YandexBrowseMedia:
-    music_browser = await async_get_music_browser(self)
+    if music_browser is None:
+        music_browser = await async_get_music_browser(self)
 
     if media_content_type is None:
         media_content_type = ROOT_MEDIA_CONTENT_TYPE
 
+    if language is None:
+        language = _get_request_language()
+
     _LOGGER.debug("Requesting browse: %s / %s" % (media_content_type, media_content_id))
-    response = await (
-        self if isinstance(self, HomeAssistantType) else self.hass
-    ).async_add_executor_job(
-        music_browser.generate_browse_from_media,
-        (media_content_type, media_content_id),
-        fetch_children,  # fetch_children
-        True,  # cache_garbage_collection
-    )
+
+    def _browse_timed() -> Optional[YandexBrowseMedia]:
+        media_link = (media_content_type, media_content_id)
+        with music_browser.track_browse_request(language) as browse_request, BROWSE_TIMINGS.span(
+            "browse", describe_media(media_link)
+        ) as span:
+            browse_object = music_browser.generate_browse_from_media(
+                media_link,
+                fetch_children,  # fetch_children
+                True,  # cache_garbage_collection
+            )
+
+        if browse_object is not None:
+            browse_object.api_calls = browse_request.api_calls
+
+        _LOGGER.debug(
+            "Browse of %s / %s made %d API calls",
+            media_content_type,
+            media_content_id,
+            browse_request.api_calls,
+        )
+        if browse_request.deadline_truncations:
+            _LOGGER.debug(
+                "Browse deadline passed while browsing %s / %s, "
+                "%d node(s) left unexpanded, %d deferred",
+                media_content_type,
+                media_content_id,
+                browse_request.deadline_truncations,
+                len(browse_request.deferred),
+            )
+        if browse_request.truncations > browse_request.deadline_truncations:
+            _LOGGER.info(
+                "API call budget (%d) exhausted while browsing %s / %s, "
+                "%d node(s) left unexpanded",
+                browse_request.api_call_budget,
+                media_content_type,
+                media_content_id,
+                browse_request.truncations - browse_request.deadline_truncations,
+            )
+
+        if music_browser.debug:
+            BROWSE_TIMINGS.add_trace(span)
+            _LOGGER.info(
+                "Browse trace (%d API calls):\n%s", browse_request.api_calls, span.format()
+            )
+
+        if browse_request.deadline_truncations:
+            # Only unexpanded nodes are completed in background; partially expanded response is
+            # not cached, and gets assembled from their cache entries once browsed again
+            deferred = music_browser.claim_deferred_browse(browse_request.deferred)
+            if deferred:
+                hass.add_job(music_browser.complete_deferred_browse, deferred, language)
+
+        return browse_object
+
+    hass = self if isinstance(self, HomeAssistantType) else self.hass
+    response = await hass.async_add_executor_job(_browse_timed)
 
     if response is None:
         _LOGGER.debug("Media type: %s", type(media_content_type))
         raise BrowseError(f"Media not found: {media_content_type} / {media_content_id}")
 
+    if fetch_children and response.children:
+        async_schedule_prefetch(hass, music_browser, response, language)
+
     return response
+
+
+async def _async_browse_presented(
+    self: Union["MediaPlayerEntity", HomeAssistantType],
+    media_content_type: Optional[str],
+    media_content_id: Optional[str],
+    target: Hashable,
+    present: Callable[[YandexMusicBrowser, YandexBrowseMedia], YandexBrowseMedia],
+) -> YandexBrowseMedia:
+    """
+    Browse media and adapt the result for presentation target.
+
+    When payload caching is enabled, serialized form of the adapted browse object is kept
+    alongside its response cache entry, so repeated browses skip adapting and serializing.
+    :param self: Media player entity or Home Assistant object
+    :param media_content_type: Media content type
+    :param media_content_id: Media content ID
+    :param target: Presentation target identifier
+    :param present: Function that adapts browse object (runs within executor)
+    :return: Browse object
+    """
+    music_browser = await async_get_music_browser(self)
+
+    if media_content_type is None:
+        media_content_type = ROOT_MEDIA_CONTENT_TYPE
+
+    language = _get_request_language()
+
+    if music_browser.cache_payloads:
+        payload = music_browser.get_cached_payload(
+            media_content_type, media_content_id, target, language
+        )
+        if payload is not None:
+            _LOGGER.debug("Serving cached payload: %s / %s", media_content_type, media_content_id)
+            return YandexBrowseMedia.from_payload(payload)
+
+    response = await _patch_root_async_browse_media(
+        self, media_content_type, media_content_id, language=language
+    )
+    hass = self if isinstance(self, HomeAssistantType) else self.hass
+
+    def _present_and_serialize() -> YandexBrowseMedia:
+        browse_object = present(music_browser, response)
+        if music_browser.cache_payloads:
+            # Payload is serialized without per-request API call count, as it is reused
+            browse_object.payload = BrowseMedia.as_dict(browse_object)
+            music_browser.set_cached_payload(
+                media_content_type, media_content_id, target, browse_object.payload, language
+            )
+        return browse_object
+
+    return await hass.async_add_executor_job(_present_and_serialize)
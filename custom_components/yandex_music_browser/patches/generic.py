@@ -1,27 +1,52 @@
+import asyncio
 import logging
 import random
 import string
-from functools import wraps
-from typing import Callable, Dict, List, Optional, Sequence, Tuple, Type, TypeVar, Union
+from collections import deque
+from copy import copy
+from functools import partial, wraps
+from time import monotonic, time
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 from urllib.parse import quote
 
+from aiohttp import ClientError, ClientTimeout, hdrs
 from aiohttp.abc import Request
 from aiohttp.web_exceptions import HTTPFound
-from aiohttp.web_response import Response
+from aiohttp.web_response import Response, StreamResponse
 from homeassistant.components.http import HomeAssistantView, KEY_HASS
 from homeassistant.components.media_player import (
     BrowseError,
+    BrowseMedia,
     MediaPlayerEntity,
     SUPPORT_BROWSE_MEDIA,
     SUPPORT_PLAY_MEDIA,
 )
 from homeassistant.components.media_player.const import MEDIA_TYPE_MUSIC, MEDIA_TYPE_PLAYLIST
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.typing import HomeAssistantType
-from yandex_music import Artist, DownloadInfo, Playlist, Track, YandexMusicObject
+from yandex_music import Artist, Client, DownloadInfo, Playlist, Track, YandexMusicObject
+from yandex_music.exceptions import YandexMusicError
 
+from custom_components.yandex_music_browser.cache import TTLCache
 from custom_components.yandex_music_browser.const import (
+    CONF_PROXY_AUDIO,
+    DATA_BROWSER,
     DATA_PLAY_KEY,
     DOMAIN,
+    MEDIA_TYPE_RADIO,
     ROOT_MEDIA_CONTENT_TYPE,
 )
 from custom_components.yandex_music_browser.default import async_get_music_browser
@@ -30,7 +55,11 @@ from custom_components.yandex_music_browser.media_browser import (
     YandexMusicBrowser,
     YandexMusicBrowserException,
 )
-from custom_components.yandex_music_browser.patches._base import _patch_root_async_browse_media
+from custom_components.yandex_music_browser.patches._base import (
+    _async_browse_presented,
+    _get_request_language,
+    _patch_root_async_browse_media,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -46,7 +75,29 @@ async def _patch_generic_async_play_media(
         media_type, _, media_id = media_id.partition(":")
 
         _LOGGER.debug("Willing to play Yandex Media: %s - %s", media_type, media_id)
-        browse_object = await _patch_root_async_browse_media(self, media_type, media_id)
+        if media_type == MEDIA_TYPE_RADIO:
+            # Radio stations are streamed as an endless track sequence
+            internal_url = self.hass.config.internal_url
+            if internal_url is None:
+                raise YandexMusicBrowserException(
+                    "radio playback requires Home Assistant internal URL to be set"
+                )
+
+            # Personal stations depend on the account assigned to the player
+            music_browser = await async_get_music_browser(self)
+            return await object.__getattribute__(self, "async_play_media")(
+                media_id=internal_url
+                + get_play_path(
+                    self.hass, music_browser.user_id, MEDIA_TYPE_RADIO, media_id, "radio.mp3"
+                ),
+                media_type=MEDIA_TYPE_MUSIC,
+                **kwargs,
+            )
+
+        # Cached browse objects do not hold media objects, therefore cache is not used
+        browse_object = await _patch_root_async_browse_media(
+            self, media_type, media_id, fetch_children=False
+        )
         media_object = getattr(browse_object, "media_object", None)
 
         if media_object:
@@ -61,14 +112,13 @@ async def _patch_generic_async_play_media(
                 if getattr(getter, "_is_urls_container", False):
                     internal_url = self.hass.config.internal_url
                     if internal_url is not None:
-                        media_id = (
-                            internal_url
-                            + YandexMusicBrowserView.url.format(
-                                key=get_play_key(self.hass),
-                                media_type=quote(browse_object.yandex_media_content_type),
-                                media_id=quote(browse_object.yandex_media_content_id),
-                            )
-                            + "/playlist.m3u8"
+                        music_browser = await async_get_music_browser(self)
+                        media_id = internal_url + get_play_path(
+                            self.hass,
+                            music_browser.user_id,
+                            browse_object.yandex_media_content_type,
+                            browse_object.yandex_media_content_id,
+                            "playlist.m3u8",
                         )
                         media_type = MEDIA_TYPE_PLAYLIST
 
@@ -96,6 +146,39 @@ async def _patch_generic_async_play_media(
     )
 
 
+GENERIC_ROOT_TTL = 10
+GENERIC_YANDEX_ROOT_TTL = 60
+
+
+async def _async_get_generic_yandex_root(
+    self: "MediaPlayerEntity", fetch_children: bool, language: Optional[str]
+) -> YandexBrowseMedia:
+    """Get Yandex root adapted for playback by URL, memoized per entity and variant"""
+    memos: Optional[Dict[Tuple[bool, Optional[str]], Tuple[float, YandexBrowseMedia]]]
+    memos = getattr(self, "_yandex_root_memos", None)
+    if memos is None:
+        memos = self._yandex_root_memos = {}
+
+    memo_key = (fetch_children, language)
+    memo = memos.get(memo_key)
+    if memo is not None and memo[0] > monotonic():
+        return memo[1]
+
+    yandex_browse_object = await _patch_root_async_browse_media(
+        self, None, None, fetch_children=fetch_children, language=language
+    )
+    await self.hass.async_add_executor_job(
+        _update_browse_object_for_url,
+        self.hass,
+        await async_get_music_browser(self),
+        yandex_browse_object,
+    )
+
+    # Variants are few (children fetched or not, per language), so expired ones are just replaced
+    memos[memo_key] = (monotonic() + GENERIC_YANDEX_ROOT_TTL, yandex_browse_object)
+    return yandex_browse_object
+
+
 async def _patch_generic_async_browse_media(
     self: "MediaPlayerEntity",
     media_content_type: Optional[str] = None,
@@ -104,63 +187,85 @@ async def _patch_generic_async_browse_media(
     _LOGGER.debug(
         "Generic async browse media call: (%s) (%s)", media_content_type, media_content_id
     )
-    yandex_browse_object = None
 
     if media_content_type == "yandex":
         media_content_type, _, media_content_id = media_content_id.partition(":")
-        yandex_browse_object = await _patch_root_async_browse_media(
-            self, media_content_type, media_content_id, fetch_children=True
+        return await _async_browse_presented(
+            self,
+            media_content_type,
+            media_content_id,
+            "generic",
+            lambda music_browser, browse_object: _update_browse_object_for_url(
+                self.hass, music_browser, browse_object
+            ),
         )
-        result_object = yandex_browse_object
 
+    language = _get_request_language()
+    request_key = (media_content_type, media_content_id, language)
+
+    merged_root_memo = getattr(self, "_merged_root_memo", None)
+    if (
+        merged_root_memo is not None
+        and merged_root_memo[0] == request_key
+        and merged_root_memo[1] > monotonic()
+    ):
+        return merged_root_memo[2]
+
+    async_browse_media_local = self.__class__.async_browse_media
+    has_native_browse = async_browse_media_local is not _patch_generic_async_browse_media
+
+    async def _async_browse_native() -> Optional[BrowseMedia]:
+        if not has_native_browse:
+            return None
+        try:
+            return await async_browse_media_local(self, media_content_type, media_content_id)
+        except (NotImplementedError, BrowseError):
+            return None
+
+    _root_browse_object_access = getattr(self, "_root_browse_object_access", None)
+    is_root_request = (
+        media_content_type is None or media_content_type == ROOT_MEDIA_CONTENT_TYPE
+    ) and not media_content_id
+
+    yandex_browse_object = None
+    if has_native_browse and (
+        is_root_request or (media_content_id, media_content_type) == _root_browse_object_access
+    ):
+        # Yandex node is fetched alongside native root, as it is most likely to be merged into it
+        result_object, yandex_browse_object = await asyncio.gather(
+            _async_browse_native(),
+            _async_get_generic_yandex_root(self, False, language),
+        )
     else:
-        async_browse_media_local = self.__class__.async_browse_media
-        result_object = None
-        if async_browse_media_local is not _patch_generic_async_browse_media:
-            try:
-                result_object = await async_browse_media_local(
-                    self, media_content_type, media_content_id
-                )
-            except (NotImplementedError, BrowseError):
-                pass
-
-        _root_browse_object_access = getattr(self, "_root_browse_object_access", None)
-
-        if (
-            (media_content_type is None or media_content_type == ROOT_MEDIA_CONTENT_TYPE)
-            and not media_content_id
-        ) or (
-            result_object
-            and _root_browse_object_access
-            and (result_object.media_content_id, result_object.media_content_type)
-            == _root_browse_object_access
-        ):
-            yandex_browse_object = await _patch_root_async_browse_media(
-                self, None, None, fetch_children=not result_object
-            )
-            if result_object:
-                self._root_browse_object_access = (
-                    result_object.media_content_id,
-                    result_object.media_content_type,
-                )
-                result_object.children = [
-                    *(result_object.children or []),
-                    yandex_browse_object,
-                ]
-            else:
-                result_object = yandex_browse_object
+        result_object = await _async_browse_native()
 
     if result_object is None:
-        raise BrowseError("Could not find required object")
-
-    if yandex_browse_object is not None:
-        await self.hass.async_add_executor_job(
-            _update_browse_object_for_url,
-            self.hass,
-            await async_get_music_browser(self),
-            yandex_browse_object,
+        if not is_root_request:
+            raise BrowseError("Could not find required object")
+
+        # No native root to merge into, Yandex root is presented on its own
+        result_object = await _async_get_generic_yandex_root(self, True, language)
+
+    elif is_root_request or (
+        _root_browse_object_access is not None
+        and (result_object.media_content_id, result_object.media_content_type)
+        == _root_browse_object_access
+    ):
+        if yandex_browse_object is None:
+            yandex_browse_object = await _async_get_generic_yandex_root(self, False, language)
+
+        self._root_browse_object_access = (
+            result_object.media_content_id,
+            result_object.media_content_type,
         )
+        # Native integrations may hold on to their browse objects
+        result_object = copy(result_object)
+        result_object.children = [*(result_object.children or []), yandex_browse_object]
 
+    else:
+        return result_object
+
+    self._merged_root_memo = (request_key, monotonic() + GENERIC_ROOT_TTL, result_object)
     return result_object
 
 
@@ -206,32 +311,193 @@ def _update_browse_object_for_url(
     media_object = browse_object.media_object
 
     can_play = False
-    if media_object:
-        solver = URL_ITEM_VALIDATORS.get(media_object.__class__)
-        if solver:
-            url_getter, requires_test = solver
-            if requires_test is False:
-                can_play = True
-            else:
-                can_play = bool(url_getter(hass, media_object))
+    solver = URL_ITEM_VALIDATORS.get(browse_object.media_object_cls)
+    if browse_object.yandex_media_content_type == MEDIA_TYPE_RADIO:
+        can_play = hass.config.internal_url is not None
+    elif solver:
+        url_getter, requires_test = solver
+        if requires_test is False:
+            can_play = True
+        elif media_object is None:
+            # Browse objects restored from cache are tested upon playback
+            can_play = hass.config.internal_url is not None
+        else:
+            can_play = bool(url_getter(hass, media_object))
 
     browse_object.can_play = can_play
 
     return browse_object
 
 
+PROXY_CHUNK_SIZE = 64 * 1024
+PROXY_DIRECT_LINK_TTL = 60
+PROXY_PASSTHROUGH_HEADERS = (
+    hdrs.ACCEPT_RANGES,
+    hdrs.CONTENT_LENGTH,
+    hdrs.CONTENT_RANGE,
+    hdrs.CONTENT_TYPE,
+    hdrs.ETAG,
+    hdrs.LAST_MODIFIED,
+)
+
+RADIO_PREFETCH_LINKS = 2
+RADIO_QUEUE_REFILL_THRESHOLD = 2
+# Consecutive unplayable tracks and fetched batches after which the station is given up on
+RADIO_MAX_FAILED_TRACKS = 10
+RADIO_MAX_FAILED_BATCHES = 3
+
+
+class RadioSession:
+    """
+    Queue of rotor station tracks played through a single radio stream.
+
+    Next batch of tracks is requested once the queue runs low, and direct links of upcoming
+    tracks are resolved while the current one plays, so switching tracks does not wait for
+    the API. Playback feedback is sent in background.
+    """
+
+    def __init__(self, hass: HomeAssistantType, client: Client, station: str) -> None:
+        self.hass = hass
+        self.client = client
+        self.station = station
+        self.batch_id: Optional[str] = None
+        self._last_track_id: Optional[str] = None
+        self._queue: Deque[Tuple[Track, str]] = deque()  # (track, batch ID)
+        self._links: Dict[str, "asyncio.Future[Optional[str]]"] = {}
+        self._batch_task: Optional["asyncio.Future[None]"] = None
+
+    def _fetch_batch(self) -> Tuple[Optional[str], List[Track]]:
+        result = self.client.rotor_station_tracks(
+            self.station, settings2=True, queue=self._last_track_id
+        )
+        if result is None:
+            return None, []
+        return result.batch_id, [x.track for x in result.sequence if x.track is not None]
+
+    async def _async_fetch_batch(self) -> None:
+        started = self.batch_id is not None
+        try:
+            batch_id, tracks = await self.hass.async_add_executor_job(self._fetch_batch)
+        except (YandexMusicError, YandexMusicBrowserException) as e:
+            _LOGGER.debug("Could not fetch tracks of station %s: %s", self.station, e)
+            return
+
+        self.batch_id = batch_id
+        for track in tracks:
+            self._queue.append((track, batch_id))
+        if tracks:
+            self._last_track_id = str(tracks[-1].id)
+        if not started:
+            self.send_feedback("radioStarted", from_="homeassistant", batch_id=batch_id)
+
+    def _prefetch(self) -> None:
+        if len(self._queue) <= RADIO_QUEUE_REFILL_THRESHOLD and (
+            self._batch_task is None or self._batch_task.done()
+        ):
+            self._batch_task = self.hass.async_create_task(self._async_fetch_batch())
+
+        for i, (track, _) in enumerate(self._queue):
+            if i >= RADIO_PREFETCH_LINKS:
+                break
+            track_id = str(track.id)
+            if track_id not in self._links:
+                self._links[track_id] = self.hass.async_add_executor_job(
+                    self._resolve_link, track
+                )
+
+    def _resolve_link(self, track: Track) -> Optional[str]:
+        try:
+            return get_track_play_url(self.hass, track)
+        except (YandexMusicError, YandexMusicBrowserException) as e:
+            _LOGGER.debug("Could not resolve link for track %s: %s", track.id, e)
+            return None
+
+    async def async_next(self) -> Optional[Tuple[Track, str, Optional[str]]]:
+        """
+        Take next playable track from the queue.
+        :return: Track, its batch ID and direct link (`None` when station ran out of tracks
+                 or none of its recent tracks could be played)
+        """
+        failed_tracks = 0
+        failed_batches: Set[Optional[str]] = set()
+        while True:
+            if not self._queue:
+                self._prefetch()
+                await self._batch_task
+                if not self._queue:
+                    return None
+
+            track, batch_id = self._queue.popleft()
+            self._prefetch()
+
+            link_future = self._links.pop(str(track.id), None)
+            if link_future is None:
+                link = await self.hass.async_add_executor_job(self._resolve_link, track)
+            else:
+                link = await link_future
+
+            if link is not None:
+                return track, batch_id, link
+
+            failed_tracks += 1
+            failed_batches.add(batch_id)
+            if (
+                failed_tracks >= RADIO_MAX_FAILED_TRACKS
+                or len(failed_batches) >= RADIO_MAX_FAILED_BATCHES
+            ):
+                break
+
+        _LOGGER.warning(
+            "Giving up on station %s after %d unplayable tracks", self.station, failed_tracks
+        )
+        return None
+
+    def _send_feedback(self, type_: str, **kwargs) -> None:
+        try:
+            self.client.rotor_station_feedback(self.station, type_, **kwargs)
+        except (YandexMusicError, YandexMusicBrowserException) as e:
+            _LOGGER.debug("Could not send %s feedback to station %s: %s", type_, self.station, e)
+
+    def send_feedback(self, type_: str, **kwargs) -> None:
+        """Send playback feedback without waiting for it to be delivered"""
+        self.hass.async_add_executor_job(partial(self._send_feedback, type_, **kwargs))
+
+    def cancel(self) -> None:
+        for link_future in self._links.values():
+            link_future.cancel()
+        self._links.clear()
+        if self._batch_task is not None:
+            self._batch_task.cancel()
+
+
 class YandexMusicBrowserView(HomeAssistantView):
     """Handle Yandex Smart Home unauthorized requests."""
 
-    url = "/api/yandex_music_browser/v1.0/{key}/{media_type}/{media_id}"
+    url = "/api/yandex_music_browser/v1.0/{key}/{user_id}/{media_type}/{media_id}"
     extra_urls = [
         url + "/playlist.m3u8",
         url + "/track.mp3",
+        url + "/radio.mp3",
     ]
     name = "api:yandex_music_browser"
     requires_auth = False
 
-    async def get(self, request: Request, key: str, media_type: str, media_id: str) -> Response:
+    def __init__(self) -> None:
+        # Direct links: {(user_id, media_type, media_id): (expires_at, link)}
+        self._direct_links: Dict[Tuple[str, str, str], Tuple[float, str]] = {}
+        # Rendered playlists:
+        # {(user_id, media_type, media_id, revision, internal_url, play_key): body}
+        self._rendered_playlists: TTLCache[
+            Tuple[str, str, str, int, Optional[str], str], str
+        ] = TTLCache(PLAYLIST_CACHE_SIZE, PLAYLIST_CACHE_TTL, 0)
+        # Recently seen revisions: {(user_id, media_type, media_id): revision}
+        self._playlist_revisions: TTLCache[Tuple[str, str, str], int] = TTLCache(
+            PLAYLIST_CACHE_SIZE, PLAYLIST_REVISION_CHECK_INTERVAL, 0
+        )
+
+    async def get(
+        self, request: Request, key: str, user_id: str, media_type: str, media_id: str
+    ) -> Response:
         """Handle Yandex Smart Home HEAD requests."""
         hass: HomeAssistantType = request.app[KEY_HASS]
 
@@ -243,10 +509,41 @@ class YandexMusicBrowserView(HomeAssistantView):
         if hass.data[DATA_PLAY_KEY] != key:
             return Response(status=401, body="invalid key")
 
+        # Media is fetched by the account which the URL was generated for
+        browser_pool = hass.data.get(DATA_BROWSER)
+        music_browser = None if browser_pool is None else browser_pool.browsers.get(user_id)
+        if music_browser is None:
+            return Response(status=404, body="no account")
+
+        if media_type == MEDIA_TYPE_RADIO:
+            return await self._async_stream_radio(request, hass, music_browser, media_id)
+
+        link_key = (user_id, media_type, media_id)
+        if (hass.data[DOMAIN] or {}).get(CONF_PROXY_AUDIO):
+            # Players seeking through proxied streams reuse recently resolved links
+            cached_link = self._direct_links.get(link_key)
+            if cached_link is not None and cached_link[0] > time():
+                response = await self._async_proxy_stream(request, hass, cached_link[1])
+                if response is not None:
+                    return response
+                self._direct_links.pop(link_key, None)
+
+        # Rendered URLs embed both internal URL and play key, either of which may change
+        play_key = get_play_key(hass)
+
+        # Playlists requested again shortly are served without checking their revision
+        revision = self._playlist_revisions.get(link_key)
+        if revision is not None:
+            body = self._rendered_playlists.get(
+                (*link_key, revision, hass.config.internal_url, play_key)
+            )
+            if body is not None:
+                return Response(status=200, body=body, content_type="application/mpegurl")
+
         # Get browse media object
         try:
             browse_object = await _patch_root_async_browse_media(
-                hass, media_type, media_id, fetch_children=False
+                hass, media_type, media_id, fetch_children=False, music_browser=music_browser
             )
         except BrowseError as e:
             return Response(status=404, body=str(e))
@@ -261,27 +558,212 @@ class YandexMusicBrowserView(HomeAssistantView):
 
         url_getter, _ = validator
 
+        playlist_key = None
+        revision = getattr(media_object, "revision", None)
+        if getattr(url_getter, "_is_urls_container", False) and revision is not None:
+            playlist_key = (*link_key, revision, hass.config.internal_url, play_key)
+            self._playlist_revisions.set(link_key, revision)
+            body = self._rendered_playlists.get(playlist_key)
+            if body is not None:
+                return Response(status=200, body=body, content_type="application/mpegurl")
+
         urls = await hass.async_add_executor_job(url_getter, hass, media_object)
         if urls is None:
             return Response(status=404, body="no urls")
 
         if isinstance(urls, str):
-            raise HTTPFound(urls)
+            if not (hass.data[DOMAIN] or {}).get(CONF_PROXY_AUDIO):
+                raise HTTPFound(urls)
+
+            self._cleanup_direct_links()
+            self._direct_links[link_key] = (time() + PROXY_DIRECT_LINK_TTL, urls)
+
+            response = await self._async_proxy_stream(request, hass, urls)
+            if response is None:
+                return Response(status=502, body="upstream unavailable")
+            return response
+
+        body = render_m3u8(urls)
+        if playlist_key is not None:
+            self._rendered_playlists.set(playlist_key, body)
+
+        return Response(status=200, body=body, content_type="application/mpegurl")
+
+    @staticmethod
+    async def _async_stream_radio(
+        request: Request,
+        hass: HomeAssistantType,
+        music_browser: YandexMusicBrowser,
+        station: str,
+    ) -> StreamResponse:
+        """
+        Stream station tracks one after another within a single response.
+        :param request: Player request
+        :param hass: Home Assistant object
+        :param music_browser: Browser of the account the station is played for
+        :param station: Rotor station (e.g. `genre:rock`)
+        :return: Streamed response
+        """
+        radio_session = RadioSession(hass, music_browser.client, station)
+
+        item = await radio_session.async_next()
+        if item is None:
+            return Response(status=404, body="no station tracks")
+
+        response = StreamResponse(status=200)
+        response.content_type = "audio/mpeg"
+        await response.prepare(request)
+
+        session = async_get_clientsession(hass)
+        try:
+            while item is not None:
+                track, batch_id, link = item
+                track_id = str(track.id)
+                radio_session.send_feedback("trackStarted", track_id=track_id, batch_id=batch_id)
+                started_at = monotonic()
+                finished = False
+
+                try:
+                    async with session.get(
+                        link, timeout=ClientTimeout(total=None, sock_connect=15, sock_read=60)
+                    ) as upstream:
+                        if upstream.status == 200:
+                            async for chunk in upstream.content.iter_chunked(PROXY_CHUNK_SIZE):
+                                await response.write(chunk)
+                            finished = True
+                        else:
+                            _LOGGER.debug("Upstream responded with status %d", upstream.status)
+                except ConnectionResetError:
+                    # Player stopped listening
+                    radio_session.send_feedback(
+                        "skip",
+                        track_id=track_id,
+                        batch_id=batch_id,
+                        total_played_seconds=monotonic() - started_at,
+                    )
+                    return response
+                except ClientError as e:
+                    _LOGGER.debug("Station track stream interrupted (%s): %s", e, track_id)
+
+                if finished:
+                    radio_session.send_feedback(
+                        "trackFinished",
+                        track_id=track_id,
+                        batch_id=batch_id,
+                        total_played_seconds=(track.duration_ms or 0) / 1000,
+                    )
+                else:
+                    # Station is told only what was actually streamed of an interrupted track
+                    radio_session.send_feedback(
+                        "skip",
+                        track_id=track_id,
+                        batch_id=batch_id,
+                        total_played_seconds=monotonic() - started_at,
+                    )
+                item = await radio_session.async_next()
+
+            await response.write_eof()
+        finally:
+            radio_session.cancel()
+
+        return response
+
+    def _cleanup_direct_links(self) -> None:
+        now = time()
+        for link_key in [k for k, (expires_at, _) in self._direct_links.items() if expires_at <= now]:
+            del self._direct_links[link_key]
+
+    @staticmethod
+    async def _async_proxy_stream(
+        request: Request, hass: HomeAssistantType, url: str
+    ) -> Optional[StreamResponse]:
+        """
+        Stream upstream body through Home Assistant.
+
+        Memory usage per stream is bounded by the chunk size and the read buffer of
+        the shared client session, as every write waits for the player to drain it.
+        :param request: Player request
+        :param hass: Home Assistant object
+        :param url: Direct link to the upstream file
+        :return: Streamed response, or `None` if upstream refused the request
+        """
+        upstream_headers = {}
+        if hdrs.RANGE in request.headers:
+            upstream_headers[hdrs.RANGE] = request.headers[hdrs.RANGE]
+
+        session = async_get_clientsession(hass)
+
+        try:
+            async with session.get(
+                url,
+                headers=upstream_headers,
+                timeout=ClientTimeout(total=None, sock_connect=15, sock_read=60),
+            ) as upstream:
+                if upstream.status not in (200, 206):
+                    _LOGGER.debug("Upstream responded with status %d: %s", upstream.status, url)
+                    return None
+
+                response = StreamResponse(status=upstream.status)
+                for header in PROXY_PASSTHROUGH_HEADERS:
+                    if header in upstream.headers:
+                        response.headers[header] = upstream.headers[header]
+                response.headers.setdefault(hdrs.ACCEPT_RANGES, "bytes")
+
+                await response.prepare(request)
+
+                try:
+                    async for chunk in upstream.content.iter_chunked(PROXY_CHUNK_SIZE):
+                        await response.write(chunk)
+                except (ConnectionResetError, ClientError) as e:
+                    _LOGGER.debug("Stream interrupted (%s): %s", e, url)
+                    return response
+
+                await response.write_eof()
+                return response
+
+        except ClientError as e:
+            _LOGGER.debug("Could not open upstream stream %s: %s", url, e)
+            return None
+
+
+PLAYLIST_CACHE_SIZE = 64
+PLAYLIST_CACHE_TTL = 6 * 60 * 60
+PLAYLIST_REVISION_CHECK_INTERVAL = 60
 
-        m3u8str = "#EXTM3U\n\n"
-        for i, url in enumerate(urls, start=1):
-            m3u8str += f"#EXTINF:-1,Track {i}\n{url}\n"
 
-        return Response(status=200, body=m3u8str, content_type="application/mpegurl")
+class ContainerItem(NamedTuple):
+    """Entry of a track container (e.g. playlist)"""
+
+    url: str
+    duration: int  # seconds (-1 if unknown)
+    title: Optional[str]
+
+
+def render_m3u8(items: Sequence[ContainerItem]) -> str:
+    """
+    Render extended M3U playlist of container items.
+    :param items: Container items
+    :return: Playlist contents
+    """
+    lines = ["#EXTM3U", ""]
+    for i, item in enumerate(items, start=1):
+        title = item.title or f"Track {i}"
+        lines.append(f"#EXTINF:{item.duration},{' '.join(title.splitlines())}")
+        lines.append(item.url)
+    lines.append("")
+    return "\n".join(lines)
 
 
 _TYandexMusicObject = TypeVar("_TYandexMusicObject", bound=YandexMusicObject)
-TURLGetter = Callable[[HomeAssistantType, _TYandexMusicObject], Optional[Union[str, Sequence[str]]]]
+TURLGetter = Callable[
+    [HomeAssistantType, _TYandexMusicObject],
+    Optional[Union[str, Sequence[ContainerItem]]],
+]
 
 
 GET_MEDIA_OBJECT_NAME = {
     Playlist: lambda x: x.title,
-    Track: lambda x: f"{x.art} - {x.title}",
+    Track: lambda x: " - ".join(filter(None, (", ".join(x.artists_name()), x.title))),
     Artist: lambda x: x.name,
 }
 
@@ -306,11 +788,45 @@ def get_play_key(hass: HomeAssistantType):
     return play_key
 
 
+def get_media_object_user_id(media_object: YandexMusicObject) -> str:
+    """Get ID of the account media object was fetched by"""
+    return str(media_object.client.me.account.uid)
+
+
+def get_play_path(
+    hass: HomeAssistantType, user_id: str, media_type: str, media_id: str, file_name: str
+) -> str:
+    """
+    Get path of playback view serving media.
+    :param hass: Home Assistant object
+    :param user_id: ID of the account media is fetched by
+    :param media_type: Media content type
+    :param media_id: Media content ID
+    :param file_name: File name determining response type (e.g. `track.mp3`)
+    :return: Path relative to Home Assistant URL
+    """
+    return (
+        YandexMusicBrowserView.url.format(
+            key=get_play_key(hass),
+            user_id=quote(user_id),
+            media_type=quote(media_type),
+            media_id=quote(media_id),
+        )
+        + "/"
+        + file_name
+    )
+
+
 def wrap_urls_container(
-    fn: Callable[[HomeAssistantType, _TYandexMusicObject], Optional[Sequence[Tuple[str, str]]]]
+    fn: Callable[
+        [HomeAssistantType, _TYandexMusicObject],
+        Optional[Sequence[Tuple[str, str, Optional[YandexMusicObject]]]],
+    ]
 ):
     @wraps(fn)
-    def _wrapped(hass: HomeAssistantType, media_object: _TYandexMusicObject):
+    def _wrapped(
+        hass: HomeAssistantType, media_object: _TYandexMusicObject
+    ) -> Optional[List[ContainerItem]]:
         internal_url = hass.config.internal_url
         if internal_url is None:
             _LOGGER.debug("To use track containers, you must set your Home Assistant internal URL")
@@ -320,14 +836,27 @@ def wrap_urls_container(
         if items is None:
             return None
 
-        return [
-            hass.config.internal_url
-            + YandexMusicBrowserView.url.format(
-                key=get_play_key(hass), media_type=quote(type_), media_id=quote(id_)
+        user_id = get_media_object_user_id(media_object)
+        container_items = []
+        for type_, id_, item_object in items:
+            duration, title = -1, None
+            if item_object is not None:
+                duration_ms = getattr(item_object, "duration_ms", None)
+                if duration_ms:
+                    duration = duration_ms // 1000
+                name_getter = GET_MEDIA_OBJECT_NAME.get(type(item_object))
+                if name_getter is not None:
+                    title = name_getter(item_object)
+
+            container_items.append(
+                ContainerItem(
+                    internal_url + get_play_path(hass, user_id, type_, id_, "track.mp3"),
+                    duration,
+                    title,
+                )
             )
-            + "/track.mp3"
-            for type_, id_ in items
-        ]
+
+        return container_items
 
     setattr(_wrapped, "_is_urls_container", True)
 
@@ -357,11 +886,12 @@ def get_track_play_url(
 def get_playlist_play_url(
     hass: HomeAssistantType,
     media_object: Playlist,
-) -> Sequence[Tuple[str, str]]:
+) -> Sequence[Tuple[str, str, Optional[Track]]]:
     tracks = media_object.tracks
     if tracks is None:
         tracks = media_object.fetch_tracks()
-    return [("track", str(track.id)) for track in tracks]
+    # Short tracks of fetched playlists carry full tracks, which provide titles and durations
+    return [("track", str(track.id), getattr(track, "track", None)) for track in tracks]
 
 
 def install(hass: HomeAssistantType):
@@ -10,17 +10,18 @@ from homeassistant.components.media_player.const import (
 from homeassistant.core import callback
 from homeassistant.helpers.typing import HomeAssistantType
 
-from custom_components.yandex_music_browser.const import DATA_BROWSER, MEDIA_TYPE_RADIO
+from custom_components.yandex_music_browser.const import MEDIA_TYPE_RADIO
 from custom_components.yandex_music_browser.default import (
     async_get_music_browser,
     async_get_music_token,
 )
-from custom_components.yandex_music_browser.patches._base import _patch_root_async_browse_media
+from custom_components.yandex_music_browser.patches._base import _async_browse_presented
 from custom_components.yandex_music_browser.media_browser import (
     YandexMusicBrowser,
     YandexMusicBrowserAuthenticationError,
     MAP_MEDIA_TYPE_TO_BROWSE,
     YandexBrowseMedia,
+    split_media_content_id_page,
 )
 
 if TYPE_CHECKING:
@@ -89,6 +90,9 @@ async def _patch_yandex_station_async_play_media(
     self: "YandexStation", media_type: str, media_id: str, **kwargs
 ):
     if media_type in MAP_MEDIA_TYPE_TO_BROWSE:
+        # Pages of a directory play the directory itself
+        media_id, _ = split_media_content_id_page(media_id)
+
         if self.local_state:
             if media_type in ("track", "playlist", "album", "artist", "radio"):
                 payload = {
@@ -108,7 +112,7 @@ async def _patch_yandex_station_async_play_media(
             command = "радио " + media_id
 
         elif media_type == MEDIA_TYPE_PLAYLIST:
-            music_browser = self.hass.data.get(DATA_BROWSER)
+            music_browser = await async_get_music_browser(self)
 
             if ":" not in media_id:
                 playlist_id = media_id
@@ -118,15 +122,15 @@ async def _patch_yandex_station_async_play_media(
                 _LOGGER.warning(f"Unsupported playlist ID: {media_id}")
                 return
 
-            playlist_obj = await self.hass.async_add_executor_job(
-                music_browser.client.users_playlists, playlist_id
+            playlist_title = await self.hass.async_add_executor_job(
+                music_browser.get_playlist_title, playlist_id
             )
 
-            if playlist_obj is None:
+            if playlist_title is None:
                 _LOGGER.warning(f"Playlist not found: {media_id}")
                 return
 
-            command = "плейлист " + playlist_obj.title
+            command = "плейлист " + playlist_title
 
         else:
             _LOGGER.warning(f"Unsupported cloud media type: {media_type}")
@@ -144,12 +148,16 @@ async def _patch_yandex_station_async_browse_media(
     media_content_type: Optional[str] = None,
     media_content_id: Optional[str] = None,
 ) -> YandexBrowseMedia:
-    music_browser = await async_get_music_browser(self)
-    response = await _patch_root_async_browse_media(self, media_content_type, media_content_id)
-    return _update_browse_object_for_cloud(
-        music_browser,
-        response,
-        for_cloud=not self.local_state,
+    for_cloud = not self.local_state
+
+    return await _async_browse_presented(
+        self,
+        media_content_type,
+        media_content_id,
+        "yandex_station_cloud" if for_cloud else "yandex_station_local",
+        lambda music_browser, browse_object: _update_browse_object_for_cloud(
+            music_browser, browse_object, for_cloud=for_cloud
+        ),
     )
 
 
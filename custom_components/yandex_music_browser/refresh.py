@@ -0,0 +1,239 @@
+"""Background refresh of browse nodes held in response cache."""
+__all__ = [
+    "BrowsePrefetcher",
+    "BrowseRefreshScheduler",
+    "DEFAULT_MAX_OUTSTANDING_PREFETCHES",
+    "DEFAULT_REFRESH_CONCURRENCY",
+    "DEFAULT_REFRESH_JITTER",
+]
+
+import asyncio
+import logging
+import random
+from datetime import timedelta
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from homeassistant.helpers.typing import HomeAssistantType
+
+from custom_components.yandex_music_browser.media_browser import (
+    MAP_MEDIA_TYPE_TO_BROWSE,
+    YandexBrowseMedia,
+    YandexMusicBrowser,
+    sanitize_media_link,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_REFRESH_CONCURRENCY = 2
+DEFAULT_REFRESH_JITTER = 0.1
+DEFAULT_MAX_OUTSTANDING_PREFETCHES = 20
+
+MediaLinkType = Tuple[str, Optional[str]]
+
+
+class BrowseRefreshScheduler:
+    """Re-run registered processors for configured nodes on their own intervals."""
+
+    def __init__(
+        self,
+        hass: HomeAssistantType,
+        music_browser: YandexMusicBrowser,
+        intervals: Mapping[str, timedelta],
+        max_concurrent: int = DEFAULT_REFRESH_CONCURRENCY,
+        jitter: float = DEFAULT_REFRESH_JITTER,
+    ) -> None:
+        self.hass = hass
+        self.music_browser = music_browser
+        self.intervals: Dict[MediaLinkType, float] = {
+            sanitize_media_link(media_link, validate=False): interval.total_seconds()
+            for media_link, interval in intervals.items()
+        }
+        self.jitter = jitter
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrent))
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._tasks)
+
+    def _get_delay(self, interval: float) -> float:
+        if self.jitter <= 0:
+            return interval
+        spread = interval * self.jitter
+        return max(0.0, interval + random.uniform(-spread, spread))
+
+    async def _async_refresh(self, media_link: MediaLinkType) -> None:
+        media_content_type, media_content_id = media_link
+
+        async with self._semaphore:
+            _LOGGER.debug("Refreshing cached node: %s / %s", media_content_type, media_content_id)
+            try:
+                await self.hass.async_add_executor_job(
+                    self.music_browser.refresh_browse, media_content_type, media_content_id
+                )
+            except asyncio.CancelledError:
+                raise
+            except BaseException as e:
+                _LOGGER.warning(
+                    "Could not refresh node %s / %s: %s", media_content_type, media_content_id, e
+                )
+
+    async def _async_refresh_loop(self, media_link: MediaLinkType, interval: float) -> None:
+        # Initial delay is fully randomized to spread out first refreshes
+        await asyncio.sleep(random.uniform(0, interval) if self.jitter > 0 else interval)
+
+        while True:
+            await self._async_refresh(media_link)
+            await asyncio.sleep(self._get_delay(interval))
+
+    def async_start(self) -> None:
+        if self._tasks:
+            return
+
+        for media_link, interval in self.intervals.items():
+            _LOGGER.debug("Scheduling refresh of %s every %d seconds", media_link, interval)
+            self._tasks.append(
+                self.hass.loop.create_task(self._async_refresh_loop(media_link, interval))
+            )
+
+    async def async_stop(self) -> None:
+        tasks, self._tasks = self._tasks, []
+
+        for task in tasks:
+            task.cancel()
+
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class BrowsePrefetcher:
+    """
+    Expand first children of served directories into response cache, ahead of the user
+    opening one of them. Prefetching runs one node at a time, and is cancelled for a browser
+    once another directory is served by it (i.e. the user navigated elsewhere).
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistantType,
+        children: int,
+        max_outstanding: int = DEFAULT_MAX_OUTSTANDING_PREFETCHES,
+    ) -> None:
+        self.hass = hass
+        self.children = children
+        self.max_outstanding = max_outstanding
+        self._semaphore = asyncio.Semaphore(1)
+        # Pending prefetches: {id(music_browser): (task, amount of media links)}
+        self._tasks: Dict[int, Tuple[asyncio.Task, int]] = {}
+
+    @property
+    def outstanding(self) -> int:
+        return sum(count for _, count in self._tasks.values())
+
+    @staticmethod
+    def _is_cached(
+        music_browser: YandexMusicBrowser, media_link: MediaLinkType, language: Optional[str]
+    ) -> bool:
+        cache_key = music_browser.get_cache_key(*media_link, language)
+        return cache_key in music_browser.get_response_cache(media_link[0])
+
+    def _get_prefetch_links(
+        self,
+        music_browser: YandexMusicBrowser,
+        browse_object: YandexBrowseMedia,
+        language: Optional[str],
+    ) -> List[MediaLinkType]:
+        media_links = []
+        for child in browse_object.children or ():
+            if len(media_links) >= self.children:
+                break
+            if not child.can_expand:
+                continue
+
+            media_link = (
+                getattr(child, "yandex_media_content_type", child.media_content_type),
+                getattr(child, "yandex_media_content_id", child.media_content_id),
+            )
+            if media_link[0] in MAP_MEDIA_TYPE_TO_BROWSE and not self._is_cached(
+                music_browser, media_link, language
+            ):
+                media_links.append(media_link)
+
+        return media_links
+
+    def _prefetch(
+        self,
+        music_browser: YandexMusicBrowser,
+        media_link: MediaLinkType,
+        language: Optional[str],
+    ) -> None:
+        with music_browser.track_browse_request(language):
+            music_browser.generate_browse_from_media(media_link, fetch_children=True)
+
+    async def _async_prefetch(
+        self,
+        music_browser: YandexMusicBrowser,
+        media_links: List[MediaLinkType],
+        language: Optional[str],
+    ) -> None:
+        for media_link in media_links:
+            async with self._semaphore:
+                if self._is_cached(music_browser, media_link, language):
+                    continue
+
+                _LOGGER.debug("Prefetching node: %s / %s", *media_link)
+                try:
+                    await self.hass.async_add_executor_job(
+                        self._prefetch, music_browser, media_link, language
+                    )
+                except asyncio.CancelledError:
+                    raise
+                except BaseException as e:
+                    _LOGGER.debug("Could not prefetch node %s / %s: %s", *media_link, e)
+
+    def async_schedule(
+        self,
+        music_browser: YandexMusicBrowser,
+        browse_object: YandexBrowseMedia,
+        language: Optional[str] = None,
+    ) -> None:
+        """
+        Schedule prefetching of first children of a served directory.
+        :param music_browser: Music browser that served the directory
+        :param browse_object: Served directory
+        :param language: (optional) Language of the browse request
+        """
+        browser_key = id(music_browser)
+        pending = self._tasks.pop(browser_key, None)
+        if pending is not None:
+            pending[0].cancel()
+
+        if music_browser.cache_ttl <= 0:
+            # Prefetched nodes would not be retained
+            return
+
+        media_links = self._get_prefetch_links(music_browser, browse_object, language)
+        del media_links[max(self.max_outstanding - self.outstanding, 0) :]
+        if not media_links:
+            return
+
+        task = self.hass.async_create_task(
+            self._async_prefetch(music_browser, media_links, language)
+        )
+        self._tasks[browser_key] = (task, len(media_links))
+
+        def _done(_) -> None:
+            if self._tasks.get(browser_key, (None,))[0] is task:
+                del self._tasks[browser_key]
+
+        task.add_done_callback(_done)
+
+    async def async_stop(self) -> None:
+        tasks = [task for task, _ in self._tasks.values()]
+        self._tasks.clear()
+
+        for task in tasks:
+            task.cancel()
+
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,181 @@
+"""Local search over media already fetched by browse processors."""
+__all__ = [
+    "DEFAULT_MAX_DOCUMENTS",
+    "SearchIndex",
+    "tokenize",
+]
+
+import re
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from difflib import get_close_matches
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+DEFAULT_MAX_DOCUMENTS = 20000
+DEFAULT_FUZZY_CUTOFF = 0.75
+DEFAULT_FUZZY_MATCHES = 3
+DEFAULT_FUZZY_LENGTH_DIFFERENCE = 2
+
+# Relevance of a query token match, by match kind
+_SCORE_EXACT = 3
+_SCORE_PREFIX = 2
+_SCORE_FUZZY = 1
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+_DocumentKey = Tuple[str, str]
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Split text into normalized words"""
+    if not text:
+        return []
+    return _TOKEN_PATTERN.findall(text.casefold().replace("ё", "е"))
+
+
+class SearchIndex:
+    """
+    In-memory inverted index of media titles.
+
+    Documents are identified by media links (media content type and ID) and carry an arbitrary
+    value (e.g. a compact browse node) returned with search results. Once the index grows beyond
+    its size limit, least recently indexed documents are dropped.
+    """
+
+    def __init__(self, max_documents: int = DEFAULT_MAX_DOCUMENTS) -> None:
+        self.max_documents = max_documents
+        self._documents: "OrderedDict[_DocumentKey, Tuple[Tuple[str, ...], Any]]" = (
+            OrderedDict()
+        )
+        self._postings: Dict[str, Set[_DocumentKey]] = {}
+        self._sorted_tokens: Optional[List[str]] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add(
+        self,
+        media_content_type: str,
+        media_content_id: str,
+        fields: Iterable[Optional[str]],
+        value: Any,
+    ) -> None:
+        """
+        Add document to the index (or replace existing one).
+        :param media_content_type: Media content type
+        :param media_content_id: Media content ID
+        :param fields: Searchable texts (title, artists, album title, ...)
+        :param value: Value returned for matching document
+        """
+        key = (media_content_type, media_content_id)
+        tokens = tuple(sorted({token for field in fields for token in tokenize(field)}))
+        if not tokens:
+            return
+
+        with self._lock:
+            existing = self._documents.pop(key, None)
+            if existing is not None:
+                self._remove_postings(key, existing[0])
+
+            self._documents[key] = (tokens, value)
+            for token in tokens:
+                documents = self._postings.get(token)
+                if documents is None:
+                    documents = self._postings[token] = set()
+                    self._sorted_tokens = None
+                documents.add(key)
+
+            while len(self._documents) > self.max_documents:
+                evicted_key, (evicted_tokens, _) = self._documents.popitem(last=False)
+                self._remove_postings(evicted_key, evicted_tokens)
+
+    def _remove_postings(self, key: _DocumentKey, tokens: Tuple[str, ...]) -> None:
+        for token in tokens:
+            documents = self._postings.get(token)
+            if documents is not None:
+                documents.discard(key)
+                if not documents:
+                    del self._postings[token]
+                    self._sorted_tokens = None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._documents.clear()
+            self._postings.clear()
+            self._sorted_tokens = None
+
+    def _match_token(self, query_token: str, sorted_tokens: List[str]) -> Dict[_DocumentKey, int]:
+        """Find documents matching a single query token, with match scores"""
+        scores: Dict[_DocumentKey, int] = {}
+
+        # Exact and prefix matches are a contiguous range of sorted tokens
+        for i in range(bisect_left(sorted_tokens, query_token), len(sorted_tokens)):
+            token = sorted_tokens[i]
+            if not token.startswith(query_token):
+                break
+            score = _SCORE_EXACT if token == query_token else _SCORE_PREFIX
+            for key in self._postings[token]:
+                if scores.get(key, 0) < score:
+                    scores[key] = score
+
+        if not scores:
+            # Typos rarely hit the first letter, so candidates are limited to tokens sharing it
+            first_letter = query_token[0]
+            candidates = [
+                token
+                for token in sorted_tokens[
+                    bisect_left(sorted_tokens, first_letter) : bisect_left(
+                        sorted_tokens, chr(ord(first_letter) + 1)
+                    )
+                ]
+                if abs(len(token) - len(query_token)) <= DEFAULT_FUZZY_LENGTH_DIFFERENCE
+            ]
+            for token in get_close_matches(
+                query_token, candidates, DEFAULT_FUZZY_MATCHES, DEFAULT_FUZZY_CUTOFF
+            ):
+                for key in self._postings[token]:
+                    scores[key] = _SCORE_FUZZY
+
+        return scores
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Any]:
+        """
+        Find documents matching every word of the query, by prefix or approximately.
+        :param query: Search query
+        :param limit: (optional) Maximum amount of results
+        :return: Values of matching documents, most relevant first
+        """
+        query_tokens = tokenize(query)
+        if not query_tokens:
+            return []
+
+        with self._lock:
+            sorted_tokens = self._sorted_tokens
+            if sorted_tokens is None:
+                sorted_tokens = self._sorted_tokens = sorted(self._postings)
+
+            total_scores: Optional[Dict[_DocumentKey, int]] = None
+            for query_token in query_tokens:
+                scores = self._match_token(query_token, sorted_tokens)
+                if total_scores is None:
+                    total_scores = scores
+                else:
+                    total_scores = {
+                        key: total_score + scores[key]
+                        for key, total_score in total_scores.items()
+                        if key in scores
+                    }
+                if not total_scores:
+                    return []
+
+            # Higher score first; shorter documents match the query more closely
+            ranked_keys = sorted(
+                total_scores,
+                key=lambda x: (-total_scores[x], len(self._documents[x][0])),
+            )
+            if limit is not None:
+                ranked_keys = ranked_keys[:limit]
+
+            return [self._documents[key][1] for key in ranked_keys]
@@ -0,0 +1,257 @@
+"""Local thumbnail cache for media browser nodes."""
+__all__ = [
+    "ThumbnailStore",
+    "YandexMusicThumbnailView",
+    "DEFAULT_THUMBNAIL_CACHE_SIZE",
+    "async_setup_thumbnail_cache",
+]
+
+import asyncio
+import hashlib
+import hmac
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from aiohttp import ClientError, ClientTimeout, hdrs
+from aiohttp.abc import Request
+from aiohttp.web_response import Response
+from homeassistant.components.http import HomeAssistantView, KEY_HASS
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.typing import HomeAssistantType
+
+from custom_components.yandex_music_browser.const import (
+    CONF_THUMBNAIL_CACHE_SIZE,
+    DATA_THUMBNAIL_STORE,
+    DOMAIN,
+    THUMBNAIL_PROXY_PATH,
+)
+from custom_components.yandex_music_browser.media_browser import (
+    get_thumbnail_signature,
+    is_thumbnail_host_allowed,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_THUMBNAIL_CACHE_SIZE = 100  # megabytes
+THUMBNAIL_MAX_FILE_SIZE = 5 * 1024 * 1024
+THUMBNAIL_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+IMAGE_SIGNATURES = (
+    (b"\x89PNG", "image/png"),
+    (b"GIF8", "image/gif"),
+    (b"RIFF", "image/webp"),
+)
+
+
+def _guess_content_type(data: bytes) -> str:
+    for signature, content_type in IMAGE_SIGNATURES:
+        if data.startswith(signature):
+            return content_type
+    return "image/jpeg"
+
+
+class ThumbnailStore:
+    """On-disk thumbnail store with least-recently-used eviction."""
+
+    def __init__(self, directory: str, max_size: int) -> None:
+        self.directory = directory
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_size = 0
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(path: str) -> str:
+        return hashlib.sha1(path.encode("utf-8")).hexdigest()
+
+    def get_file_path(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def load(self) -> None:
+        """Index existing files, oldest access first (executor only)"""
+        if self._loaded:
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and not entry.name.endswith(".tmp"):
+                stat = entry.stat()
+                files.append((stat.st_mtime, entry.name, stat.st_size))
+
+        with self._lock:
+            for _, key, size in sorted(files):
+                self._entries[key] = size
+                self._total_size += size
+
+            self._loaded = True
+            self._evict()
+
+    def read(self, key: str) -> Optional[bytes]:
+        """Read thumbnail and mark it as recently used (executor only)"""
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+
+        file_path = self.get_file_path(key)
+        try:
+            with open(file_path, "rb") as f:
+                data = f.read()
+            os.utime(file_path)
+        except OSError:
+            with self._lock:
+                self._forget(key)
+            return None
+
+        return data
+
+    def write(self, key: str, data: bytes) -> None:
+        """Store thumbnail and evict least recently used ones (executor only)"""
+        file_path = self.get_file_path(key)
+        tmp_file_path = file_path + ".tmp"
+
+        with open(tmp_file_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_file_path, file_path)
+
+        with self._lock:
+            self._forget(key)
+            self._entries[key] = len(data)
+            self._total_size += len(data)
+            self._evict()
+
+    def _forget(self, key: str) -> None:
+        size = self._entries.pop(key, None)
+        if size is not None:
+            self._total_size -= size
+
+    def _evict(self) -> None:
+        while self._total_size > self.max_size and len(self._entries) > 1:
+            key, size = self._entries.popitem(last=False)
+            self._total_size -= size
+            try:
+                os.remove(self.get_file_path(key))
+            except OSError as e:
+                _LOGGER.debug("Could not remove cached thumbnail %s: %s", key, e)
+
+
+class YandexMusicThumbnailView(HomeAssistantView):
+    """
+    Serve media browser thumbnails from local thumbnail cache.
+    Only signed paths produced by the media browser are served, as the view requires no auth.
+    """
+
+    url = THUMBNAIL_PROXY_PATH + "/{signature}/{path:.+}"
+    name = "api:yandex_music_browser:thumbnail"
+    requires_auth = False
+
+    def __init__(self) -> None:
+        self._pending: Dict[str, asyncio.Future] = {}
+
+    async def get(self, request: Request, signature: str, path: str) -> Response:
+        hass: HomeAssistantType = request.app[KEY_HASS]
+
+        store: Optional[ThumbnailStore] = hass.data.get(DATA_THUMBNAIL_STORE)
+        if store is None:
+            return Response(status=404, body="no config")
+
+        if not hmac.compare_digest(signature, get_thumbnail_signature(path)):
+            return Response(status=403, body="invalid signature")
+
+        if not is_thumbnail_host_allowed(path.partition("/")[0]):
+            return Response(status=403, body="host not allowed")
+
+        key = store.get_key(path)
+
+        if request.headers.get(hdrs.IF_NONE_MATCH) == f'"{key}"':
+            return Response(status=304, headers=self._get_cache_headers(key))
+
+        data = await hass.async_add_executor_job(store.read, key)
+
+        if data is None:
+            # Concurrent requests of the same thumbnail share a single download
+            pending = self._pending.get(key)
+            if pending is None:
+                pending = hass.loop.create_future()
+                self._pending[key] = pending
+                try:
+                    data = await self._async_fetch(hass, store, key, path)
+                except BaseException as e:
+                    pending.set_exception(e)
+                    # Mark exception as retrieved in case nobody else awaits it
+                    pending.exception()
+                    raise
+                else:
+                    pending.set_result(data)
+                finally:
+                    del self._pending[key]
+            else:
+                data = await asyncio.shield(pending)
+
+        if data is None:
+            return Response(status=404, body="thumbnail unavailable")
+
+        return Response(
+            body=data,
+            content_type=_guess_content_type(data),
+            headers=self._get_cache_headers(key),
+        )
+
+    @staticmethod
+    def _get_cache_headers(key: str) -> Dict[str, str]:
+        return {
+            hdrs.CACHE_CONTROL: f"public, max-age={THUMBNAIL_CACHE_MAX_AGE}, immutable",
+            hdrs.ETAG: f'"{key}"',
+        }
+
+    @staticmethod
+    async def _async_fetch(
+        hass: HomeAssistantType, store: ThumbnailStore, key: str, path: str
+    ) -> Optional[bytes]:
+        session = async_get_clientsession(hass)
+
+        try:
+            async with session.get(
+                "https://" + path, timeout=ClientTimeout(total=30)
+            ) as response:
+                if response.status != 200:
+                    _LOGGER.debug("Thumbnail responded with status %d: %s", response.status, path)
+                    return None
+
+                data = bytearray()
+                async for chunk in response.content.iter_chunked(64 * 1024):
+                    data.extend(chunk)
+                    if len(data) > THUMBNAIL_MAX_FILE_SIZE:
+                        _LOGGER.debug("Thumbnail exceeds maximum size: %s", path)
+                        return None
+                data = bytes(data)
+
+        except (ClientError, asyncio.TimeoutError) as e:
+            _LOGGER.debug("Could not fetch thumbnail %s: %s", path, e)
+            return None
+
+        await hass.async_add_executor_job(store.write, key, data)
+        return data
+
+
+async def async_setup_thumbnail_cache(hass: HomeAssistantType) -> None:
+    """Register thumbnail view and open on-disk thumbnail store"""
+    config = hass.data[DOMAIN]
+
+    store = ThumbnailStore(
+        hass.config.path(".cache", DOMAIN, "thumbnails"),
+        config.get(CONF_THUMBNAIL_CACHE_SIZE, DEFAULT_THUMBNAIL_CACHE_SIZE) * 1024 * 1024,
+    )
+    await hass.async_add_executor_job(store.load)
+
+    if DATA_THUMBNAIL_STORE not in hass.data:
+        # Views can not be unregistered, therefore registration happens once
+        hass.http.register_view(YandexMusicThumbnailView())
+
+    hass.data[DATA_THUMBNAIL_STORE] = store
@@ -0,0 +1,196 @@
+"""Timing instrumentation for browse processors."""
+__all__ = [
+    "BROWSE_TIMINGS",
+    "HISTOGRAM_BUCKETS",
+    "BrowseSpan",
+    "BrowseTimings",
+    "ProcessorStats",
+    "describe_media",
+    "timed_processor",
+]
+
+import functools
+import threading
+from collections import deque
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, TypeVar
+
+# Upper bounds of latency histogram buckets (in milliseconds); last bucket is unbounded
+HISTOGRAM_BUCKETS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+DEFAULT_TRACES_KEPT = 20
+
+_T = TypeVar("_T", bound=Callable)
+
+
+def describe_media(media: Any) -> Optional[str]:
+    """Short description of processed media for trace output"""
+    if media is None or isinstance(media, str):
+        return media
+    if isinstance(media, tuple) and len(media) == 2:
+        return f"{media[0]}({media[1] or ''})"
+    return f"{type(media).__name__}({getattr(media, 'id', '')})"
+
+
+class BrowseSpan:
+    """Timed execution of a single processor, including nested processors."""
+
+    __slots__ = ("name", "label", "duration", "cached", "children")
+
+    def __init__(self, name: str, label: Optional[str] = None) -> None:
+        self.name = name
+        self.label = label
+        self.duration = 0.0
+        self.cached = False
+        self.children: List["BrowseSpan"] = []
+
+    def format(self, indent: int = 0) -> str:
+        line = "  " * indent + f"{self.name}"
+        if self.label:
+            line += f" [{self.label}]"
+        line += f": {self.duration * 1000:.1f} ms"
+        if self.cached:
+            line += " (cached)"
+        return "\n".join([line, *(child.format(indent + 1) for child in self.children)])
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "label": self.label,
+            "duration_ms": round(self.duration * 1000, 3),
+            "cached": self.cached,
+            "children": [child.as_dict() for child in self.children],
+        }
+
+
+class ProcessorStats:
+    """Latency histogram of a single processor."""
+
+    __slots__ = ("count", "cache_hits", "total", "maximum", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.cache_hits = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self.buckets = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+
+    def add(self, duration_ms: float) -> None:
+        self.count += 1
+        self.total += duration_ms
+        if duration_ms > self.maximum:
+            self.maximum = duration_ms
+
+        for i, upper_bound in enumerate(HISTOGRAM_BUCKETS):
+            if duration_ms <= upper_bound:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "cache_hits": self.cache_hits,
+            "mean_ms": round(self.total / self.count, 3) if self.count else None,
+            "max_ms": round(self.maximum, 3),
+            "histogram_ms": {
+                **{
+                    f"<={upper_bound}": amount
+                    for upper_bound, amount in zip(HISTOGRAM_BUCKETS, self.buckets)
+                },
+                f">{HISTOGRAM_BUCKETS[-1]}": self.buckets[-1],
+            },
+        }
+
+
+class BrowseTimings:
+    """Process-wide aggregation of processor spans."""
+
+    def __init__(self, traces_kept: int = DEFAULT_TRACES_KEPT) -> None:
+        self._stats: Dict[str, ProcessorStats] = {}
+        self._traces: Deque[BrowseSpan] = deque(maxlen=traces_kept)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def span(self, name: str, label: Optional[str] = None) -> Iterator[BrowseSpan]:
+        """
+        Time enclosed block as a span nested under currently running span (if any).
+        Spans are tracked per thread, as browsing happens within executor threads.
+        :param name: Processor name (aggregation key)
+        :param label: Processed media description
+        """
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+
+        span = BrowseSpan(name, label)
+        if stack:
+            stack[-1].children.append(span)
+        stack.append(span)
+
+        started_at = perf_counter()
+        try:
+            yield span
+        finally:
+            span.duration = perf_counter() - started_at
+            stack.pop()
+            self._record(span)
+
+    def mark_cached(self) -> None:
+        """Mark currently running span as served from cache"""
+        stack = getattr(self._local, "stack", None)
+        if stack:
+            stack[-1].cached = True
+
+    def _record(self, span: BrowseSpan) -> None:
+        with self._lock:
+            stats = self._stats.get(span.name)
+            if stats is None:
+                stats = self._stats[span.name] = ProcessorStats()
+
+            # Cache hits do not run processors, therefore they are kept out of histograms
+            if span.cached:
+                stats.cache_hits += 1
+            else:
+                stats.add(span.duration * 1000)
+
+    def add_trace(self, span: BrowseSpan) -> None:
+        with self._lock:
+            self._traces.append(span)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+            self._traces.clear()
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "processors": {
+                    name: stats.as_dict() for name, stats in sorted(self._stats.items())
+                },
+                "traces": [span.as_dict() for span in self._traces],
+            }
+
+
+BROWSE_TIMINGS = BrowseTimings()
+
+
+def timed_processor(name: str) -> Callable[[_T], _T]:
+    """
+    Decorator that times processor calls under given name.
+    :param name: Processor name
+    :return: Decorator
+    """
+
+    def _decorate(func: _T) -> _T:
+        @functools.wraps(func)
+        def wrapped_function(browser, media=None, *args, **kwargs):
+            with BROWSE_TIMINGS.span(name, describe_media(media)):
+                return func(browser, media, *args, **kwargs)
+
+        return wrapped_function
+
+    return _decorate